@@ -0,0 +1,74 @@
+"""Requests per second: one-shot httpx calls vs. the shared connection pool.
+
+Runs a local keep-alive HTTP server that stands in for the Moneybird API and
+fires the same number of GET requests through both code paths.
+
+    python benchmarks/bench_connection_pool.py [requests]
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+import moneysnake.client as client
+
+BODY = b'{"id": 1, "company_name": "Acme"}'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def one_shot(url: str, n: int) -> float:
+    """The previous behavior: a new connection for every request."""
+    start = time.perf_counter()
+    for _ in range(n):
+        httpx.request("get", url, headers={"Authorization": "Bearer x"}).json()
+    return n / (time.perf_counter() - start)
+
+
+def pooled(n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        client.http_get("contacts/1")
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    client.MB_URL = base
+    client.set_admin_id(1)
+    client.set_token("x")
+    url = f"{base}/{client.MB_VERSION_ID}/1/contacts/1"
+
+    try:
+        before = one_shot(url, n)
+        with client.connection_pool():
+            after = pooled(n)
+    finally:
+        server.shutdown()
+
+    print(f"one-shot httpx.request: {before:8.0f} req/s")
+    print(f"pooled httpx.Client:    {after:8.0f} req/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Time to turn a page of sales invoices into models.
+
+Compares the previous per-record construction from decoded dicts with one
+TypeAdapter call on the decoded page and with validate_json straight from
+the response bytes.
+
+    python benchmarks/bench_list_validation.py [records] [repeat]
+"""
+
+import json
+import sys
+import timeit
+from typing import Any
+
+from moneysnake.codec import get_json_codec
+from moneysnake.sales_invoice import SalesInvoice
+
+
+def invoice(i: int) -> dict[str, Any]:
+    return {
+        "id": str(10**17 + i),
+        "contact_id": "550000000000000002",
+        "invoice_id": f"2026-{i:05}",
+        "state": "open",
+        "invoice_date": "2026-01-01",
+        "currency": "EUR",
+        "total_price_incl_tax": "121.0",
+        "version": 1760000000 + i,
+        "details": [
+            {
+                "id": str(10**17 + 10 * i + line),
+                "description": "Consultancy",
+                "price": "50.0",
+                "amount": "1",
+                "tax_rate_id": "3",
+            }
+            for line in range(2)
+        ],
+        "payments": [],
+    }
+
+
+def main() -> None:
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    content = json.dumps([invoice(i) for i in range(records)]).encode()
+    loads = get_json_codec().loads
+
+    runs = {
+        "decode + cls(**item)": lambda: [SalesInvoice(**r) for r in loads(content)],
+        "decode + TypeAdapter": lambda: SalesInvoice._validate_list(loads(content)),
+        "validate_json(bytes)": lambda: SalesInvoice._validate_page(content),
+    }
+    baseline = None
+    for label, run in runs.items():
+        seconds = min(timeit.repeat(run, number=1, repeat=repeat))
+        baseline = baseline or seconds
+        print(
+            f"{label:22} {records} records: {seconds * 1e3:8.1f} ms "
+            f"({baseline / seconds:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
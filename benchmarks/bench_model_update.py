@@ -0,0 +1,64 @@
+"""Time per SalesInvoice.update: full dump-and-revalidate vs. incoming keys only.
+
+Builds an invoice with 500 detail lines and applies the kinds of updates the
+client makes after a request: a single changed field (pause, send_invoice)
+and a complete API response (load, save).
+
+    python benchmarks/bench_model_update.py [lines] [repeat]
+"""
+
+import sys
+import timeit
+from typing import Any
+
+from moneysnake.sales_invoice import SalesInvoice
+
+
+def invoice_data(lines: int) -> dict[str, Any]:
+    return {
+        "id": 1,
+        "contact_id": 2,
+        "invoice_id": "2026-0001",
+        "state": "draft",
+        "details": [
+            {
+                "id": 1000 + i,
+                "description": f"Line {i}",
+                "price": "10.0",
+                "amount": "1",
+                "tax_rate_id": 3,
+                "ledger_account_id": "4",
+                "row_order": i,
+            }
+            for i in range(lines)
+        ],
+        "payments": [{"id": 9, "price": "10.0", "payment_date": "2026-01-01"}],
+    }
+
+
+def full_revalidate(invoice: SalesInvoice, data: dict[str, Any]) -> None:
+    """The previous implementation of update."""
+    validated = invoice.model_validate({**invoice.model_dump(), **data})
+    for key in type(invoice).model_fields:
+        object.__setattr__(invoice, key, getattr(validated, key))
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    data = invoice_data(lines)
+    invoice = SalesInvoice(**data)
+
+    for label, change in (("one field", {"state": "open"}), ("full body", data)):
+        before = timeit.timeit(lambda: full_revalidate(invoice, change), number=repeat)
+        after = timeit.timeit(lambda: invoice.update(change), number=repeat)
+        print(
+            f"{label:9} ({lines} lines): "
+            f"dump+revalidate {before / repeat * 1e3:7.3f} ms, "
+            f"incoming keys {after / repeat * 1e3:7.3f} ms "
+            f"({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Time to build a SalesInvoice with many detail lines.
+
+Compares the previous after-validators, which walked the validated details
+and payments again with ensure_list_of, with the current before-validators
+that only turn null into an empty list.
+
+    python benchmarks/bench_nested_validation.py [lines] [repeat]
+"""
+
+import sys
+import timeit
+from typing import Any
+
+from pydantic import field_validator
+
+from moneysnake.payment import Payment
+from moneysnake.sales_invoice import SalesInvoice, SalesInvoiceDetailsAttribute
+
+
+def ensure_list_of(model_cls: type, value: list) -> list:
+    return [
+        item if isinstance(item, model_cls) else model_cls(**item) for item in value
+    ]
+
+
+class OldSalesInvoice(SalesInvoice):
+    """SalesInvoice with the previous nested-collection validators."""
+
+    @field_validator("payments")
+    def ensure_payments(cls, value: list[Any] | None) -> list[Payment]:
+        return [] if value is None else ensure_list_of(Payment, value)
+
+    @field_validator("details")
+    def ensure_details(
+        cls, value: list[Any] | None
+    ) -> list[SalesInvoiceDetailsAttribute]:
+        if value is None:
+            return []
+        return ensure_list_of(SalesInvoiceDetailsAttribute, value)
+
+
+def invoice_data(lines: int) -> dict[str, Any]:
+    return {
+        "id": "1",
+        "contact_id": "2",
+        "details": [
+            {
+                "id": str(1000 + i),
+                "description": f"Line {i}",
+                "price": "10.0",
+                "amount": "1",
+                "tax_rate_id": "3",
+                "row_order": i,
+            }
+            for i in range(lines)
+        ],
+        "payments": [{"id": "9", "price": "10.0"}],
+    }
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    data = invoice_data(lines)
+    models = SalesInvoice(**data).model_dump()
+    models["details"] = SalesInvoice(**data).details
+
+    for label, source in (("from dicts", data), ("from models", models)):
+        before = timeit.timeit(lambda: OldSalesInvoice(**source), number=repeat)
+        after = timeit.timeit(lambda: SalesInvoice(**source), number=repeat)
+        print(
+            f"{label:11} ({lines} lines): "
+            f"after-validators {before / repeat * 1e3:7.3f} ms, "
+            f"before-validators {after / repeat * 1e3:7.3f} ms "
+            f"({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Memory held by a large list of financial mutations: full models vs. rows.
+
+Decodes the records page by page, as list_all and search do, once into full
+FinancialMutation models and once into rows of a few fields with
+_row_decoder, and reports the memory still allocated by each result with
+tracemalloc.
+
+    python benchmarks/bench_projection.py [records]
+"""
+
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from moneysnake.financial_mutation import FinancialMutation
+
+FIELDS = ["id", "date", "amount", "message"]
+PER_PAGE = 100
+
+
+def mutation(i: int) -> dict[str, Any]:
+    return {
+        "id": str(10**17 + i),
+        "administration_id": "123",
+        "financial_account_id": "456",
+        "financial_statement_id": str(10**16 + i // 50),
+        "date": "2026-01-01",
+        "amount": "121.00",
+        "message": f"Payment {i}",
+        "contra_account_name": "Acme B.V.",
+        "contra_account_number": "NL00BANK0123456789",
+        "state": "processed",
+        "ledger_account_bookings": [],
+        "payments": [
+            {
+                "id": str(10**17 + 1000 + i),
+                "price": "121.00",
+                "invoice_type": "SalesInvoice",
+            }
+        ],
+        "created_at": "2026-01-01T12:00:00.000Z",
+        "updated_at": "2026-01-01T12:00:00.000Z",
+        "version": 1760000000 + i,
+    }
+
+
+def held(build: Callable[[], list[Any]]) -> tuple[int, int]:
+    """Bytes still allocated by build()'s result, and the peak while building."""
+    tracemalloc.start()
+    result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def main() -> None:
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    pages = [
+        json.dumps([mutation(i) for i in range(start, start + PER_PAGE)]).encode()
+        for start in range(0, records, PER_PAGE)
+    ]
+
+    def models() -> list[Any]:
+        return [m for page in pages for m in FinancialMutation._validate_page(page)]
+
+    def rows() -> list[Any]:
+        decode = FinancialMutation._row_decoder(FIELDS)
+        return [row for page in pages for row in decode(page)]
+
+    results = {"full models": held(models), "rows": held(rows)}
+    full = results["full models"][0]
+    for label, (current, peak) in results.items():
+        print(
+            f"{label:11} {records} records: {current / 2**20:7.1f} MiB held, "
+            f"{current / records:6.0f} B/record, peak {peak / 2**20:7.1f} MiB "
+            f"({full / current:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
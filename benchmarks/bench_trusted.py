@@ -0,0 +1,75 @@
+"""Time to build models from single-record responses: validated vs. trusted.
+
+Trusted mode builds flat records, such as financial mutations, with
+construct instead of validating them. Records with nested models (sales
+invoices with their lines) and whole pages are validated in either mode,
+since pydantic-core does that faster than construct would; the invoice rows
+show that trusted mode then costs nothing extra.
+
+    python benchmarks/bench_trusted.py [records] [repeat]
+"""
+
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from bench_list_validation import invoice
+
+from moneysnake.client import trust_responses
+from moneysnake.financial_mutation import FinancialMutation
+from moneysnake.model import MoneybirdModel
+from moneysnake.sales_invoice import SalesInvoice
+
+
+def mutation(i: int) -> dict[str, Any]:
+    return {
+        "id": str(10**17 + i),
+        "administration_id": "123",
+        "amount": "-121.0",
+        "code": "",
+        "date": "2026-01-01",
+        "message": f"Invoice 2026-{i:05}",
+        "contra_account_name": "Acme",
+        "contra_account_number": "NL00BANK0123456789",
+        "state": "unprocessed",
+        "amount_open": "-121.0",
+        "financial_account_id": "550000000000000003",
+        "currency": "EUR",
+        "created_at": "2026-01-01T00:00:00.000Z",
+        "updated_at": "2026-01-01T00:00:00.000Z",
+        "version": 1760000000 + i,
+        "payments": [],
+        "ledger_account_bookings": [],
+    }
+
+
+def trusted(func: Callable[[], Any]) -> Callable[[], Any]:
+    def run() -> Any:
+        with trust_responses():
+            return func()
+
+    return run
+
+
+def main() -> None:
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    cases: list[tuple[str, type[MoneybirdModel], list[dict[str, Any]]]] = [
+        ("mutation", FinancialMutation, [mutation(i) for i in range(records)]),
+        ("invoice", SalesInvoice, [invoice(i) for i in range(records)]),
+    ]
+    for label, model, data in cases:
+        def load() -> list[MoneybirdModel]:
+            return [model._from_response(record) for record in data]
+
+        validated = min(timeit.repeat(load, number=1, repeat=repeat))
+        unvalidated = min(timeit.repeat(trusted(load), number=1, repeat=repeat))
+        print(
+            f"{label:8} {records} records: validated {validated * 1e3:7.1f} ms, "
+            f"trusted {unvalidated * 1e3:7.1f} ms ({validated / unvalidated:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,37 @@
 from .client import MB_URL as MB_URL
 from .client import MB_VERSION_ID as MB_VERSION_ID
+from .client import AsyncConnectionPool as AsyncConnectionPool
+from .client import ConnectionPool as ConnectionPool
+from .client import MoneybirdClient as MoneybirdClient
+from .client import Page as Page
+from .client import aclose as aclose
+from .client import aiter_items as aiter_items
+from .client import aiter_pages as aiter_pages
+from .client import amake_request as amake_request
+from .client import apaginate as apaginate
+from .client import async_connection_pool as async_connection_pool
+from .client import close as close
+from .client import connection_pool as connection_pool
+from .client import current_client as current_client
+from .client import iter_items as iter_items
+from .client import iter_pages as iter_pages
 from .client import make_request as make_request
 from .client import paginate as paginate
 from .client import set_admin_id as set_admin_id
+from .client import set_coalesce_gets as set_coalesce_gets
 from .client import set_max_retries as set_max_retries
+from .client import set_pool_limits as set_pool_limits
+from .client import set_rate_limiter as set_rate_limiter
+from .client import set_response_cache as set_response_cache
 from .client import set_timeout as set_timeout
 from .client import set_token as set_token
+from .client import set_trusted_responses as set_trusted_responses
+from .client import trust_responses as trust_responses
+from .cache import CacheStats as CacheStats
+from .cache import ResponseCache as ResponseCache
+from .codec import JsonCodec as JsonCodec
+from .codec import get_json_codec as get_json_codec
+from .codec import set_json_codec as set_json_codec
 from .contact import Contact as Contact
 from .contact import ContactPerson as ContactPerson
 from .exceptions import MoneybirdAPIError as MoneybirdAPIError
@@ -13,42 +39,90 @@ from .exceptions import MoneybirdError as MoneybirdError
 from .exceptions import MoneybirdNotFoundError as MoneybirdNotFoundError
 from .exceptions import MoneybirdRateLimitError as MoneybirdRateLimitError
 from .exceptions import MoneybirdValidationError as MoneybirdValidationError
+from .exceptions import MoneybirdWebhookError as MoneybirdWebhookError
 from .external_sales_invoice import ExternalSalesInvoice as ExternalSalesInvoice
 from .external_sales_invoice import (
     ExternalSalesInvoiceDetailsAttribute as ExternalSalesInvoiceDetailsAttribute,
 )
 from .financial_mutation import FinancialMutation as FinancialMutation
 from .financial_statement import FinancialStatement as FinancialStatement
+from .model import BoundModel as BoundModel
 from .model import CrudModel as CrudModel
 from .model import Deletable as Deletable
 from .model import Loadable as Loadable
 from .model import MoneybirdModel as MoneybirdModel
 from .model import Saveable as Saveable
+from .model import FetchResult as FetchResult
+from .model import RefreshResult as RefreshResult
+from .model import SyncDiff as SyncDiff
+from .model import refresh_stale as refresh_stale
 from .model import Synchronizable as Synchronizable
 from .document import Document as Document
 from .document import DocumentDetailsAttribute as DocumentDetailsAttribute
+from .index import LookupIndex as LookupIndex
+from .index import register_index as register_index
+from .index import unregister_index as unregister_index
+from .mirror import Mirror as Mirror
+from .mirror import MirrorStore as MirrorStore
+from .mirror import SQLiteStore as SQLiteStore
+from .mirror import SyncResult as SyncResult
 from .payment import Payment as Payment
 from .purchase_invoice import PurchaseInvoice as PurchaseInvoice
 from .purchase_invoice import (
     PurchaseInvoiceDetailsAttribute as PurchaseInvoiceDetailsAttribute,
 )
+from .rate_limit import RateLimiter as RateLimiter
 from .receipt import Receipt as Receipt
 from .receipt import ReceiptDetailsAttribute as ReceiptDetailsAttribute
 from .sales_invoice import SalesInvoice as SalesInvoice
 from .sales_invoice import (
     SalesInvoiceDetailsAttribute as SalesInvoiceDetailsAttribute,
 )
+from .session import Session as Session
+from .session import current_session as current_session
 from .tax_rate import TaxRate as TaxRate
+from .tax_rate import TaxRateRegistry as TaxRateRegistry
+from .tax_rate import set_tax_rate_registry as set_tax_rate_registry
+from .webhook import WebhookEvent as WebhookEvent
+from .webhook import WebhookHandler as WebhookHandler
 
 __all__ = [
     "MB_URL",
     "MB_VERSION_ID",
+    "aclose",
+    "aiter_items",
+    "aiter_pages",
+    "amake_request",
+    "apaginate",
+    "async_connection_pool",
+    "close",
+    "connection_pool",
+    "current_client",
+    "current_session",
+    "get_json_codec",
+    "iter_items",
+    "iter_pages",
     "make_request",
     "paginate",
+    "refresh_stale",
+    "register_index",
     "set_admin_id",
+    "set_coalesce_gets",
+    "set_json_codec",
     "set_max_retries",
+    "set_pool_limits",
+    "set_rate_limiter",
+    "set_response_cache",
+    "set_tax_rate_registry",
     "set_timeout",
     "set_token",
+    "set_trusted_responses",
+    "trust_responses",
+    "unregister_index",
+    "AsyncConnectionPool",
+    "BoundModel",
+    "CacheStats",
+    "ConnectionPool",
     "Contact",
     "ContactPerson",
     "CrudModel",
@@ -57,23 +131,41 @@ __all__ = [
     "DocumentDetailsAttribute",
     "ExternalSalesInvoice",
     "ExternalSalesInvoiceDetailsAttribute",
+    "FetchResult",
     "FinancialMutation",
     "FinancialStatement",
+    "JsonCodec",
     "Loadable",
+    "LookupIndex",
+    "Mirror",
+    "MirrorStore",
     "MoneybirdAPIError",
+    "MoneybirdClient",
     "MoneybirdError",
     "MoneybirdModel",
     "MoneybirdNotFoundError",
     "MoneybirdRateLimitError",
     "MoneybirdValidationError",
+    "MoneybirdWebhookError",
+    "Page",
     "Payment",
     "PurchaseInvoice",
     "PurchaseInvoiceDetailsAttribute",
+    "RateLimiter",
     "Receipt",
+    "RefreshResult",
+    "ResponseCache",
     "ReceiptDetailsAttribute",
     "SalesInvoice",
     "SalesInvoiceDetailsAttribute",
+    "SQLiteStore",
     "Saveable",
+    "Session",
+    "SyncDiff",
+    "SyncResult",
     "Synchronizable",
     "TaxRate",
+    "TaxRateRegistry",
+    "WebhookEvent",
+    "WebhookHandler",
 ]
@@ -0,0 +1,191 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+# Headers that describe the bytes on the wire rather than the cached body,
+# which is stored decoded.
+_TRANSPORT_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+@dataclass
+class CacheStats:
+    """Counters of a ResponseCache.
+
+    A hit is a GET answered with a cached body, either because the entry was
+    still fresh or because the API confirmed it with a 304 (also counted in
+    ``revalidations``). A miss is a GET that had to download the body.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class CachedResponse:
+    content: bytes
+    headers: list[tuple[str, str]]
+    etag: str | None
+    last_modified: str | None
+    validated_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request | None = None) -> httpx.Response:
+        return httpx.Response(
+            200, headers=self.headers, content=self.content, request=request
+        )
+
+
+class ResponseCache:
+    """LRU cache of GET responses, revalidated with ETag / Last-Modified.
+
+    Cached GETs are sent with If-None-Match / If-Modified-Since and a 304
+    reuses the stored body, which saves the download and the JSON parsing of
+    unchanged records. Entries younger than ``max_age`` seconds are served
+    without asking the API at all, which also saves the request against the
+    rate limit; the default of 0 always revalidates.
+
+    The cache holds at most ``max_entries`` responses and ``max_bytes`` of
+    body, evicting the least recently used first. Entries not confirmed by the
+    API for ``ttl`` seconds are dropped. Successful POST, PATCH and DELETE
+    requests evict the cached responses of the resource they changed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: float | None = 3600.0,
+        max_age: float = 0.0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_age = max_age
+        self.stats = CacheStats()
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached bodies."""
+        return self._size
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any] | None = None) -> CacheKey:
+        return url, tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        """Return the entry for ``key`` unless it expired, marking it as used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and self._age(entry) > self.ttl:
+                self._remove(key)
+                self.stats.evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return self._age(entry) < self.max_age
+
+    def hit(self, entry: CachedResponse) -> httpx.Response:
+        """Count a fresh entry served without a request and return it."""
+        with self._lock:
+            self.stats.hits += 1
+        return entry.to_response()
+
+    def revalidated(
+        self, key: CacheKey, entry: CachedResponse, response: httpx.Response
+    ) -> httpx.Response:
+        """Handle a 304 for ``entry`` and return the cached response."""
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.revalidations += 1
+            entry.validated_at = time.monotonic()
+            entry.etag = response.headers.get("ETag", entry.etag)
+            entry.last_modified = response.headers.get(
+                "Last-Modified", entry.last_modified
+            )
+        return entry.to_response(response.request)
+
+    def store(self, key: CacheKey, response: httpx.Response) -> None:
+        """Count a miss and cache ``response`` if it can be revalidated."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        cacheable = (etag or last_modified or self.max_age > 0) and (
+            "no-store" not in response.headers.get("Cache-Control", "")
+        )
+        with self._lock:
+            self.stats.misses += 1
+            self._remove(key)
+            if not cacheable or len(response.content) > self.max_bytes:
+                return
+            self._entries[key] = CachedResponse(
+                content=response.content,
+                headers=[
+                    (name, value)
+                    for name, value in response.headers.items()
+                    if name.lower() not in _TRANSPORT_HEADERS
+                ],
+                etag=etag,
+                last_modified=last_modified,
+                validated_at=time.monotonic(),
+            )
+            self._size += len(response.content)
+            while (
+                len(self._entries) > self.max_entries or self._size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop all entries whose URL starts with ``prefix``."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0].startswith(prefix)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _age(self, entry: CachedResponse) -> float:
+        return time.monotonic() - entry.validated_at
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
@@ -1,17 +1,39 @@
+import asyncio
+import contextvars
+import importlib
 import logging
 import math
+import mmap
+import os
+import threading
 import time
-from typing import Any
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, Self, cast
+from weakref import WeakKeyDictionary
 
 import httpx
 from httpx import Response
 
+from .cache import CacheKey, CachedResponse, ResponseCache
+from .codec import get_json_codec
 from .exceptions import (
     MoneybirdAPIError,
     MoneybirdNotFoundError,
     MoneybirdRateLimitError,
     MoneybirdValidationError,
 )
+from .rate_limit import RateLimiter
+from .singleflight import AsyncSingleFlight, SingleFlight
+
+if TYPE_CHECKING:
+    from .model import BoundModel
 
 logger = logging.getLogger("moneysnake")
 
@@ -23,6 +45,10 @@ admin_id_ = 0
 token_ = ""
 timeout_ = 20
 max_retries_ = 3
+rate_limiter_: RateLimiter | None = None
+cache_: ResponseCache | None = None
+coalesce_gets_ = False
+trusted_responses_ = False
 
 
 def set_admin_id(admin_id: int) -> None:
@@ -45,13 +71,491 @@ def set_max_retries(max_retries: int) -> None:
     max_retries_ = max_retries
 
 
+def set_rate_limiter(rate_limiter: RateLimiter | None) -> None:
+    """Pace requests with a client-side rate limiter; None disables pacing."""
+    global rate_limiter_
+    rate_limiter_ = rate_limiter
+
+
+def set_coalesce_gets(enabled: bool) -> None:
+    """Share one request between identical concurrent GETs (off by default).
+
+    A GET sent after a write to the same resource has completed never joins a
+    request that was already in flight before it.
+    """
+    global coalesce_gets_
+    coalesce_gets_ = enabled
+
+
+def set_trusted_responses(enabled: bool) -> None:
+    """Build flat records from API responses unvalidated (off by default).
+
+    Records with nested models, and whole pages and lists, are validated
+    either way: pydantic-core builds those faster than construct does.
+    """
+    global trusted_responses_
+    trusted_responses_ = enabled
+
+
+def set_response_cache(cache: ResponseCache | None) -> None:
+    """Cache and revalidate GET responses; None disables caching."""
+    global cache_
+    cache_ = cache
+
+
+class ConnectionPool:
+    """Lazily created ``httpx.Client`` shared by all requests.
+
+    Reusing one client keeps TCP/TLS connections to Moneybird alive between
+    calls instead of paying a fresh handshake for every request. The client is
+    created on first use and can be closed explicitly (or by using the pool as
+    a context manager); a closed pool transparently reopens on the next request.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+    ) -> None:
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> httpx.Client:
+        client = self._client
+        if client is None or client.is_closed:
+            with self._lock:
+                client = self._client
+                if client is None or client.is_closed:
+                    client = httpx.Client(limits=self.limits)
+                    self._client = client
+        return client
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class AsyncConnectionPool:
+    """Lazily created ``httpx.AsyncClient`` shared by all async requests.
+
+    An AsyncClient's connections belong to the event loop that opened them, so
+    the pool keeps one client per loop: threads that each run their own loop
+    all get connection reuse. Each client is closed in its own loop when that
+    loop shuts down its async generators, as ``asyncio.run`` does before it
+    closes the loop. With a loop that is closed by hand, call ``aclose`` in it
+    first.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+    ) -> None:
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._clients: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = WeakKeyDictionary()
+        # Suspended async generators that close a client at loop shutdown.
+        # The loop only holds them weakly.
+        self._closers: set[AsyncGenerator[None, None]] = set()
+        self._lock = threading.Lock()
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._clients[loop] = httpx.AsyncClient(limits=self.limits)
+                self._close_at_shutdown(loop, client)
+        return client
+
+    def _close_at_shutdown(
+        self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> None:
+        async def closer() -> AsyncGenerator[None, None]:
+            try:
+                yield
+            finally:
+                self._closers.discard(agen)
+                with self._lock:
+                    if self._clients.get(loop) is client:
+                        del self._clients[loop]
+                await client.aclose()
+
+        async def start() -> None:
+            # Once started, the loop's shutdown_asyncgens runs its finally.
+            await anext(agen)
+
+        agen = closer()
+        self._closers.add(agen)
+        loop.create_task(start())
+
+    async def aclose(self) -> None:
+        """Close the client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+pool_ = ConnectionPool()
+async_pool_ = AsyncConnectionPool()
+
+
+def set_pool_limits(
+    max_connections: int | None = 100,
+    max_keepalive_connections: int | None = 20,
+    keepalive_expiry: float | None = 5.0,
+) -> None:
+    """Configure the shared connection pools; open sync connections are closed.
+
+    The async pool is replaced as well; its clients are closed when the event
+    loops that own them shut down.
+    """
+    global pool_, async_pool_
+    old_pool = pool_
+    pool_ = ConnectionPool(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    async_pool_ = AsyncConnectionPool(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    old_pool.close()
+
+
+def connection_pool() -> ConnectionPool:
+    """Return the shared connection pool, e.g. ``with connection_pool(): ...``."""
+    return pool_
+
+
+def async_connection_pool() -> AsyncConnectionPool:
+    """Return the shared async pool (usable with ``async with``)."""
+    return async_pool_
+
+
+def close() -> None:
+    """Close all pooled connections. The pool reopens on the next request."""
+    pool_.close()
+
+
+async def aclose() -> None:
+    """Close the pooled async connections of the running event loop."""
+    await async_pool_.aclose()
+
+
+class MoneybirdClient:
+    """Credentials, connection pools and retry policy for one administration.
+
+    Requests made while a client is bound (``with client.bind(): ...``) use its
+    settings instead of the module-level ones. Binding is tracked in a context
+    variable, so threads and asyncio tasks can each work with a different
+    administration at the same time. Models created while a client is bound
+    remember it and use it for their own requests::
+
+        client = MoneybirdClient(admin_id=123, token="...")
+        invoices = client.SalesInvoice.list_all(state="open")
+        contact = Contact.find_by_id(1, client=client)
+        contact.save()  # also sent to administration 123
+    """
+
+    def __init__(
+        self,
+        admin_id: int,
+        token: str,
+        *,
+        timeout: int = 20,
+        max_retries: int = 3,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        coalesce_gets: bool = False,
+        trusted_responses: bool = False,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+    ) -> None:
+        self.admin_id = admin_id
+        self.token = token
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.coalesce_gets = coalesce_gets
+        self.trusted_responses = trusted_responses
+        self.pool = ConnectionPool(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.async_pool = AsyncConnectionPool(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(admin_id={self.admin_id!r})"
+
+    # Models keep a reference to their client, which holds connection pools
+    # and locks: copies of a model share the client rather than copying it.
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+    def __reduce__(self) -> Any:
+        raise TypeError(
+            f"{self.__class__.__name__} cannot be pickled; "
+            "create a new client with the same credentials instead"
+        )
+
+    @contextmanager
+    def bind(self) -> Iterator[Self]:
+        """Route all requests in this context through this client."""
+        token = _active_client.set(self)
+        try:
+            yield self
+        finally:
+            _active_client.reset(token)
+
+    def __getattr__(self, name: str) -> "BoundModel[Any]":
+        """Give access to models bound to this client, e.g. ``client.Contact``."""
+        from .model import BoundModel, MoneybirdModel
+
+        package = importlib.import_module(__package__ or "moneysnake")
+        model_cls = getattr(package, name, None) if name[:1].isupper() else None
+        if not (isinstance(model_cls, type) and issubclass(model_cls, MoneybirdModel)):
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            )
+        return BoundModel(self, model_cls)
+
+    def make_request(
+        self,
+        path: str,
+        data: dict[str, Any] | None = None,
+        method: str = "post",
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        with self.bind():
+            return make_request(path, data=data, method=method, params=params)
+
+    async def amake_request(
+        self,
+        path: str,
+        data: dict[str, Any] | None = None,
+        method: str = "post",
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        with self.bind():
+            return await amake_request(path, data=data, method=method, params=params)
+
+    def paginate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        per_page: int = 100,
+        concurrency: int = 1,
+    ) -> list[Any]:
+        with self.bind():
+            return paginate(path, params, per_page, concurrency)
+
+    async def apaginate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        per_page: int = 100,
+        concurrency: int = 1,
+    ) -> list[Any]:
+        with self.bind():
+            return await apaginate(path, params, per_page, concurrency)
+
+    def close(self) -> None:
+        self.pool.close()
+
+    async def aclose(self) -> None:
+        await self.async_pool.aclose()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+class _DefaultClient(MoneybirdClient):
+    """The client used when none is bound, backed by the module-level settings.
+
+    Reads and writes go to the globals managed by set_admin_id, set_token,
+    set_timeout, set_max_retries, set_rate_limiter, set_response_cache,
+    set_coalesce_gets, set_trusted_responses and set_pool_limits.
+    """
+
+    def __init__(self) -> None:
+        pass
+
+    @property  # type: ignore[override]
+    def admin_id(self) -> int:
+        return admin_id_
+
+    @admin_id.setter
+    def admin_id(self, value: int) -> None:
+        set_admin_id(value)
+
+    @property  # type: ignore[override]
+    def token(self) -> str:
+        return token_
+
+    @token.setter
+    def token(self, value: str) -> None:
+        set_token(value)
+
+    @property  # type: ignore[override]
+    def timeout(self) -> int:
+        return timeout_
+
+    @timeout.setter
+    def timeout(self, value: int) -> None:
+        set_timeout(value)
+
+    @property  # type: ignore[override]
+    def max_retries(self) -> int:
+        return max_retries_
+
+    @max_retries.setter
+    def max_retries(self, value: int) -> None:
+        set_max_retries(value)
+
+    @property  # type: ignore[override]
+    def rate_limiter(self) -> RateLimiter | None:
+        return rate_limiter_
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: RateLimiter | None) -> None:
+        set_rate_limiter(value)
+
+    @property  # type: ignore[override]
+    def cache(self) -> ResponseCache | None:
+        return cache_
+
+    @cache.setter
+    def cache(self, value: ResponseCache | None) -> None:
+        set_response_cache(value)
+
+    @property  # type: ignore[override]
+    def coalesce_gets(self) -> bool:
+        return coalesce_gets_
+
+    @coalesce_gets.setter
+    def coalesce_gets(self, value: bool) -> None:
+        set_coalesce_gets(value)
+
+    @property  # type: ignore[override]
+    def trusted_responses(self) -> bool:
+        return trusted_responses_
+
+    @trusted_responses.setter
+    def trusted_responses(self, value: bool) -> None:
+        set_trusted_responses(value)
+
+    @property
+    def pool(self) -> ConnectionPool:  # type: ignore[override]
+        return pool_
+
+    @property
+    def async_pool(self) -> AsyncConnectionPool:  # type: ignore[override]
+        return async_pool_
+
+
+default_client = _DefaultClient()
+_active_client: ContextVar[MoneybirdClient | None] = ContextVar(
+    "moneysnake_client", default=None
+)
+
+
+def current_client() -> MoneybirdClient:
+    """Return the client bound to the current context, or the default client."""
+    return _active_client.get() or default_client
+
+
+def bound_client() -> MoneybirdClient | None:
+    """Return the client bound to the current context, if any."""
+    return _active_client.get()
+
+
+_trust_override: ContextVar[bool | None] = ContextVar(
+    "moneysnake_trust_responses", default=None
+)
+
+
+@contextmanager
+def trust_responses(enabled: bool = True) -> Iterator[None]:
+    """Build flat records from API responses in this block without validation.
+
+    See set_trusted_responses for what is still validated. Overrides the
+    ``trusted_responses`` setting of the client, in both directions:
+    ``trust_responses(False)`` validates even for a trusting client.
+    """
+    token = _trust_override.set(enabled)
+    try:
+        yield
+    finally:
+        _trust_override.reset(token)
+
+
+def responses_trusted() -> bool:
+    """Whether API responses are currently built into models unvalidated."""
+    override = _trust_override.get()
+    return current_client().trusted_responses if override is None else override
+
+
 _IDEMPOTENT_METHODS = frozenset({"get", "put", "delete", "head", "options"})
 
 
-def _is_retryable(status_code: int, method: str) -> bool:
+def _is_retryable(
+    status_code: int, method: str, retry_server_errors: bool = False
+) -> bool:
     if status_code == 429:
         return True
-    if status_code >= 500 and method.lower() in _IDEMPOTENT_METHODS:
+    if status_code >= 500 and (
+        retry_server_errors or method.lower() in _IDEMPOTENT_METHODS
+    ):
         return True
     return False
 
@@ -84,104 +588,388 @@ def _retry_delay(retry_after: str | None, attempt: int) -> int:
     return max(value, 1)
 
 
-def make_request(
+_ERROR_CLASSES: dict[int, type[MoneybirdAPIError]] = {
+    404: MoneybirdNotFoundError,
+    422: MoneybirdValidationError,
+    429: MoneybirdRateLimitError,
+}
+
+
+def _headers(
+    client: MoneybirdClient, content_type: str | None = "application/json"
+) -> dict[str, str]:
+    headers = {"Authorization": f"Bearer {client.token}"}
+    if content_type is not None:
+        headers["Content-Type"] = content_type
+    return headers
+
+
+def _full_path(client: MoneybirdClient, path: str) -> str:
+    return f"{MB_URL}/{MB_VERSION_ID}/{client.admin_id}/{path}"
+
+
+def _handle_response(
+    response: Response,
+    method: str,
+    path: str,
+    fullpath: str,
+    attempt: int,
+    max_retries: int,
+    rate_limiter: RateLimiter | None = None,
+    retry_server_errors: bool = False,
+) -> int | None:
+    """Check a response against the retry policy.
+
+    Returns None when the request succeeded and the delay in seconds when it
+    should be retried. Raises the matching MoneybirdAPIError otherwise. A 429
+    also holds back the rate limiter, if any, until the reset time. Server
+    errors are only retried for idempotent methods unless
+    ``retry_server_errors`` is set.
+    """
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        retryable = _is_retryable(response.status_code, method, retry_server_errors)
+        if retryable and attempt < max_retries:
+            delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+            if response.status_code == 429 and rate_limiter is not None:
+                rate_limiter.penalize(delay)
+            logger.warning(
+                "%s %s returned %d, retrying in %ds (attempt %d/%d)",
+                method.upper(),
+                fullpath,
+                response.status_code,
+                delay,
+                attempt + 1,
+                max_retries + 1,
+            )
+            return delay
+
+        body = response.text
+        logger.warning(
+            "%s %s returned %d: %s",
+            method.upper(),
+            fullpath,
+            response.status_code,
+            body,
+        )
+        error_cls = _ERROR_CLASSES.get(response.status_code, MoneybirdAPIError)
+        raise error_cls(
+            status_code=response.status_code,
+            response_body=body,
+            method=method,
+            path=path,
+        ) from exc
+    return None
+
+
+def _decode(response: Response) -> Any:
+    return get_json_codec().loads(response.content) if response.content else {}
+
+
+def _encode(data: dict[str, Any] | None) -> bytes | None:
+    return None if data is None else get_json_codec().dumps(data)
+
+
+def _update_cache(
+    client: MoneybirdClient,
+    method: str,
+    path: str,
+    key: CacheKey,
+    response: Response,
+) -> None:
+    """Store a GET response, or evict what a successful write made stale."""
+    if client.cache is None:
+        return
+    if method.lower() == "get":
+        client.cache.store(key, response)
+    else:
+        client.cache.invalidate(_full_path(client, path.split("/")[0]))
+
+
+_inflight = SingleFlight()
+_ainflight = AsyncSingleFlight()
+# Writes completed per client token and resource. Part of the coalescing key,
+# so a GET sent after a write does not join one that started before it.
+_write_generations: dict[tuple[str, str], int] = {}
+_write_generations_lock = threading.Lock()
+
+
+def _resource_key(client: MoneybirdClient, path: str) -> tuple[str, str]:
+    return client.token, _full_path(client, path.split("/")[0])
+
+
+def _coalesce_key(
+    client: MoneybirdClient, path: str, params: dict[str, Any] | None
+) -> tuple[str, int, CacheKey]:
+    generation = _write_generations.get(_resource_key(client, path), 0)
+    key = ResponseCache.key(_full_path(client, path), params)
+    return client.token, generation, key
+
+
+def _wrote(client: MoneybirdClient, path: str) -> None:
+    """Keep GETs of ``path``'s resource from joining requests sent before now."""
+    key = _resource_key(client, path)
+    with _write_generations_lock:
+        _write_generations[key] = _write_generations.get(key, 0) + 1
+
+
+def _send(
     path: str,
     data: dict[str, Any] | None = None,
     method: str = "post",
     params: dict[str, Any] | None = None,
-) -> Any:
-    headers = {
-        "Authorization": f"Bearer {token_}",
-        "Content-Type": "application/json",
-    }
-    fullpath = f"{MB_URL}/{MB_VERSION_ID}/{admin_id_}/{path}"
-
-    last_exc: httpx.HTTPStatusError | None = None
-    for attempt in range(max_retries_ + 1):
+) -> Response:
+    """Send a request; identical concurrent GETs can share one in-flight request."""
+    client = current_client()
+    if method.lower() != "get":
+        try:
+            return _send_once(path, data=data, method=method, params=params)
+        finally:
+            _wrote(client, path)
+    if not client.coalesce_gets:
+        return _send_once(path, data=data, method=method, params=params)
+    return _inflight.do(
+        _coalesce_key(client, path, params),
+        lambda: _send_once(path, data=data, method=method, params=params),
+    )
+
+
+async def _asend(
+    path: str,
+    data: dict[str, Any] | None = None,
+    method: str = "post",
+    params: dict[str, Any] | None = None,
+) -> Response:
+    """Async counterpart of _send."""
+    client = current_client()
+    if method.lower() != "get":
+        try:
+            return await _asend_once(path, data=data, method=method, params=params)
+        finally:
+            _wrote(client, path)
+    if not client.coalesce_gets:
+        return await _asend_once(path, data=data, method=method, params=params)
+    return await _ainflight.do(
+        _coalesce_key(client, path, params),
+        lambda: _asend_once(path, data=data, method=method, params=params),
+    )
+
+
+def _send_once(
+    path: str,
+    data: dict[str, Any] | None = None,
+    method: str = "post",
+    params: dict[str, Any] | None = None,
+) -> Response:
+    """Send a request under the retry policy and return the successful response."""
+    client = current_client()
+    headers = _headers(client)
+    fullpath = _full_path(client, path)
+    content = _encode(data)
+    cache = client.cache if method.lower() == "get" else None
+    key = ResponseCache.key(fullpath, params)
+    cached: CachedResponse | None = None
+    if cache is not None and (cached := cache.get(key)) is not None:
+        if cache.is_fresh(cached):
+            return cache.hit(cached)
+        headers.update(cached.conditional_headers())
+
+    attempt = 0
+    while True:
         logger.debug("%s %s (attempt %d)", method.upper(), fullpath, attempt + 1)
-        response = httpx.request(
+        if client.rate_limiter is not None:
+            client.rate_limiter.acquire()
+        response = client.pool.get().request(
             method,
             fullpath,
-            json=data,
+            content=content,
             headers=headers,
-            timeout=timeout_,
+            timeout=client.timeout,
             params=params,
         )
+        if cache is not None and cached is not None and response.status_code == 304:
+            return cache.revalidated(key, cached, response)
+        delay = _handle_response(
+            response,
+            method,
+            path,
+            fullpath,
+            attempt,
+            client.max_retries,
+            client.rate_limiter,
+        )
+        if delay is None:
+            logger.debug(
+                "%s %s returned %d", method.upper(), fullpath, response.status_code
+            )
+            _update_cache(client, method, path, key, response)
+            return response
+        time.sleep(delay)
+        attempt += 1
 
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            last_exc = exc
-            if _is_retryable(response.status_code, method) and attempt < max_retries_:
-                delay = _retry_delay(response.headers.get("Retry-After"), attempt)
-                logger.warning(
-                    "%s %s returned %d, retrying in %ds (attempt %d/%d)",
-                    method.upper(),
-                    fullpath,
-                    response.status_code,
-                    delay,
-                    attempt + 1,
-                    max_retries_ + 1,
-                )
-                time.sleep(delay)
-                continue
-
-            body = response.text
-            logger.warning(
-                "%s %s returned %d: %s",
-                method.upper(),
-                fullpath,
-                response.status_code,
-                body,
+
+async def _asend_once(
+    path: str,
+    data: dict[str, Any] | None = None,
+    method: str = "post",
+    params: dict[str, Any] | None = None,
+) -> Response:
+    """Async counterpart of _send_once; retries wait with asyncio.sleep."""
+    client = current_client()
+    headers = _headers(client)
+    fullpath = _full_path(client, path)
+    content = _encode(data)
+    cache = client.cache if method.lower() == "get" else None
+    key = ResponseCache.key(fullpath, params)
+    cached: CachedResponse | None = None
+    if cache is not None and (cached := cache.get(key)) is not None:
+        if cache.is_fresh(cached):
+            return cache.hit(cached)
+        headers.update(cached.conditional_headers())
+
+    attempt = 0
+    while True:
+        logger.debug("%s %s (attempt %d)", method.upper(), fullpath, attempt + 1)
+        if client.rate_limiter is not None:
+            await client.rate_limiter.aacquire()
+        response = await client.async_pool.get().request(
+            method,
+            fullpath,
+            content=content,
+            headers=headers,
+            timeout=client.timeout,
+            params=params,
+        )
+        if cache is not None and cached is not None and response.status_code == 304:
+            return cache.revalidated(key, cached, response)
+        delay = _handle_response(
+            response,
+            method,
+            path,
+            fullpath,
+            attempt,
+            client.max_retries,
+            client.rate_limiter,
+        )
+        if delay is None:
+            logger.debug(
+                "%s %s returned %d", method.upper(), fullpath, response.status_code
             )
-            error_cls: type[MoneybirdAPIError] = {
-                404: MoneybirdNotFoundError,
-                422: MoneybirdValidationError,
-                429: MoneybirdRateLimitError,
-            }.get(response.status_code, MoneybirdAPIError)
-            raise error_cls(
-                status_code=response.status_code,
-                response_body=body,
-                method=method,
-                path=path,
-            ) from exc
-
-        logger.debug("%s %s returned %d", method.upper(), fullpath, response.status_code)
-        return response.json() if response.content else {}
-
-    # All retries exhausted — raise from last exception
-    assert last_exc is not None
-    body = last_exc.response.text
-    status_code = last_exc.response.status_code
-    error_cls = {
-        404: MoneybirdNotFoundError,
-        422: MoneybirdValidationError,
-        429: MoneybirdRateLimitError,
-    }.get(status_code, MoneybirdAPIError)
-    raise error_cls(
-        status_code=status_code,
-        response_body=body,
-        method=method,
-        path=path,
-    ) from last_exc
+            _update_cache(client, method, path, key, response)
+            return response
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def make_request(
+    path: str,
+    data: dict[str, Any] | None = None,
+    method: str = "post",
+    params: dict[str, Any] | None = None,
+) -> Any:
+    return _decode(_send(path, data=data, method=method, params=params))
+
+
+async def amake_request(
+    path: str,
+    data: dict[str, Any] | None = None,
+    method: str = "post",
+    params: dict[str, Any] | None = None,
+) -> Any:
+    """Async counterpart of make_request; retries wait with asyncio.sleep."""
+    return _decode(await _asend(path, data=data, method=method, params=params))
 
 
 def http_get(path: str, params: dict[str, Any] | None = None) -> Any:
     return make_request(path, method="get", params=params)
 
 
+@contextmanager
+def http_get_stream(path: str) -> Iterator[Response]:
+    """GET a (binary) resource as a streamed response.
+
+    Status errors go through the same retry policy as make_request before any
+    of the body is read. Use as ``with http_get_stream(path) as response:``
+    and consume it with ``response.iter_bytes()``.
+    """
+    client = current_client()
+    headers = _headers(client, None)
+    fullpath = _full_path(client, path)
+
+    attempt = 0
+    while True:
+        logger.debug("GET %s (stream, attempt %d)", fullpath, attempt + 1)
+        if client.rate_limiter is not None:
+            client.rate_limiter.acquire()
+        with client.pool.get().stream(
+            "get", fullpath, headers=headers, timeout=client.timeout
+        ) as response:
+            if response.is_error:
+                response.read()  # error bodies are small; needed for the message
+            delay = _handle_response(
+                response,
+                "get",
+                path,
+                fullpath,
+                attempt,
+                client.max_retries,
+                client.rate_limiter,
+            )
+            if delay is None:
+                yield response
+                return
+        time.sleep(delay)
+        attempt += 1
+
+
 def http_get_raw(path: str) -> Response:
-    """Perform a GET and return the raw httpx Response (for binary downloads)."""
-    headers = {
-        "Authorization": f"Bearer {token_}",
-    }
-    fullpath = f"{MB_URL}/{MB_VERSION_ID}/{admin_id_}/{path}"
-    logger.debug("GET %s (raw)", fullpath)
-    response = httpx.get(fullpath, headers=headers, timeout=timeout_)
-    response.raise_for_status()
+    """Perform a GET and return the raw httpx Response (for binary downloads).
+
+    The whole body is read into memory; see http_download and http_iter_bytes
+    for large files.
+    """
+    with http_get_stream(path) as response:
+        response.read()
     return response
 
 
+def http_iter_bytes(path: str, chunk_size: int = 65536) -> Iterator[bytes]:
+    """Yield the body of a GET request in chunks without buffering it."""
+    with http_get_stream(path) as response:
+        yield from response.iter_bytes(chunk_size)
+
+
+def http_download(
+    path: str, destination: str | os.PathLike[str] | BinaryIO, chunk_size: int = 65536
+) -> int:
+    """Stream the body of a GET request to a file path or binary file object.
+
+    A path is written through a temporary ``.part`` file that only replaces the
+    destination once the download completed. Returns the number of bytes.
+    """
+    if not isinstance(destination, (str, os.PathLike)):
+        return _copy_chunks(http_iter_bytes(path, chunk_size), destination)
+
+    target = Path(destination)
+    partial = target.with_name(target.name + ".part")
+    try:
+        with partial.open("wb") as file:
+            written = _copy_chunks(http_iter_bytes(path, chunk_size), file)
+        partial.replace(target)
+    finally:
+        partial.unlink(missing_ok=True)
+    return written
+
+
+def _copy_chunks(chunks: Iterator[bytes], file: BinaryIO) -> int:
+    written = 0
+    for chunk in chunks:
+        file.write(chunk)
+        written += len(chunk)
+    return written
+
+
 def http_post(path: str, data: dict[str, Any] | None = None) -> Any:
     return make_request(path, method="post", data=data)
 
@@ -194,62 +982,300 @@ def http_delete(path: str, data: dict[str, Any] | None = None) -> Any:
     return make_request(path, method="delete", data=data)
 
 
+async def ahttp_get(path: str, params: dict[str, Any] | None = None) -> Any:
+    return await amake_request(path, method="get", params=params)
+
+
+async def ahttp_post(path: str, data: dict[str, Any] | None = None) -> Any:
+    return await amake_request(path, method="post", data=data)
+
+
+async def ahttp_patch(path: str, data: dict[str, Any] | None = None) -> Any:
+    return await amake_request(path, method="patch", data=data)
+
+
+async def ahttp_delete(path: str, data: dict[str, Any] | None = None) -> Any:
+    return await amake_request(path, method="delete", data=data)
+
+
+UploadContent = bytes | str | os.PathLike[str] | BinaryIO | mmap.mmap
+
+
 def http_post_file(
     path: str,
     *,
     field: str,
     filename: str,
-    content: bytes,
+    content: UploadContent,
     content_type: str = "application/octet-stream",
 ) -> Any:
     """POST a multipart/form-data file upload (e.g. document attachments).
 
+    ``content`` is the file itself as bytes, a path to it, or a binary file
+    object or mmap. Paths and files are streamed in chunks instead of being
+    read into memory. File objects and mmaps are always sent from offset 0,
+    whatever their current position: httpx seeks them back to the start for
+    every attempt. 429 and 5xx responses are retried like other requests; a
+    file object that cannot seek is sent only once.
+
     httpx sets the multipart Content-Type (with boundary) itself, so we only
-    pass the Authorization header. Uploads aren't retried.
-    """
-    headers = {"Authorization": f"Bearer {token_}"}
-    fullpath = f"{MB_URL}/{MB_VERSION_ID}/{admin_id_}/{path}"
-    logger.debug("POST %s (multipart upload)", fullpath)
-    response = httpx.post(
-        fullpath,
-        headers=headers,
-        files={field: (filename, content, content_type)},
-        timeout=timeout_,
-    )
-    try:
-        response.raise_for_status()
-    except httpx.HTTPStatusError as exc:
-        body = response.text
-        logger.warning("POST %s returned %d: %s", fullpath, response.status_code, body)
-        error_cls: type[MoneybirdAPIError] = {
-            404: MoneybirdNotFoundError,
-            422: MoneybirdValidationError,
-            429: MoneybirdRateLimitError,
-        }.get(response.status_code, MoneybirdAPIError)
-        raise error_cls(
-            status_code=response.status_code,
-            response_body=body,
-            method="post",
-            path=path,
-        ) from exc
-    return response.json() if response.content else {}
+    pass the Authorization header.
+    """
+    client = current_client()
+    fullpath = _full_path(client, path)
+    with _open_upload(content) as upload:
+        max_retries = client.max_retries if _rewindable(upload) else 0
+        # httpx reads mmaps like files, but its file types do not include them.
+        file = cast(IO[bytes], upload)
+        attempt = 0
+        while True:
+            logger.debug(
+                "POST %s (multipart upload, attempt %d)", fullpath, attempt + 1
+            )
+            if client.rate_limiter is not None:
+                client.rate_limiter.acquire()
+            response = client.pool.get().post(
+                fullpath,
+                headers=_headers(client, None),
+                files={field: (filename, file, content_type)},
+                timeout=client.timeout,
+            )
+            delay = _handle_response(
+                response,
+                "post",
+                path,
+                fullpath,
+                attempt,
+                max_retries,
+                client.rate_limiter,
+                retry_server_errors=True,
+            )
+            if delay is None:
+                _wrote(client, path)
+                return _decode(response)
+            time.sleep(delay)
+            attempt += 1
 
 
-def paginate(path: str, params: dict[str, Any] | None = None, per_page: int = 100) -> list[Any]:
-    """Fetch all pages from a paginated list endpoint."""
-    all_results: list[Any] = []
-    page = 1
-    params = dict(params) if params else {}
-    params["per_page"] = per_page
+@contextmanager
+def _open_upload(
+    content: UploadContent,
+) -> Iterator[bytes | BinaryIO | mmap.mmap]:
+    """Open ``content`` for upload if it is a path; pass anything else through."""
+    if isinstance(content, (str, os.PathLike)):
+        with open(content, "rb") as file:
+            yield file
+    else:
+        yield content
 
-    while True:
-        params["page"] = page
-        results = http_get(path, params=params)
+
+def _rewindable(upload: bytes | BinaryIO | mmap.mmap) -> bool:
+    if isinstance(upload, (bytes, mmap.mmap)):
+        return True
+    seekable = getattr(upload, "seekable", None)
+    return bool(seekable and seekable())
+
+
+@dataclass
+class Page:
+    """One page of results from a paginated list endpoint."""
+
+    items: list[Any]
+    # Whether the Link header points to a next page; None if it was not sent.
+    has_next: bool | None = None
+
+    def is_last(self, per_page: int) -> bool:
+        if self.has_next is not None:
+            return not self.has_next
+        return len(self.items) < per_page
+
+
+# Turns the raw body of a page that is a JSON array into its items, e.g. the
+# validate_json of a TypeAdapter, skipping the intermediate dicts.
+PageDecoder = Callable[[bytes], list[Any]]
+
+
+def _to_page(response: Response, decode: PageDecoder | None = None) -> Page:
+    if decode is not None and response.content.lstrip()[:1] == b"[":
+        results = decode(response.content)
+    else:
+        results = _decode(response)
         if not isinstance(results, list):
-            return [results] if results else []
-        all_results.extend(results)
-        if len(results) < per_page:
-            break
-        page += 1
+            return Page([results] if results else [], has_next=False)
+    has_next = "next" in response.links if "Link" in response.headers else None
+    return Page(results, has_next=has_next)
+
 
-    return all_results
+def _fetch_page(
+    path: str, params: dict[str, Any], decode: PageDecoder | None = None
+) -> Page:
+    return _to_page(_send(path, method="get", params=params), decode)
+
+
+async def _afetch_page(
+    path: str, params: dict[str, Any], decode: PageDecoder | None = None
+) -> Page:
+    return _to_page(await _asend(path, method="get", params=params), decode)
+
+
+def _pages(
+    path: str,
+    params: dict[str, Any] | None,
+    per_page: int,
+    concurrency: int,
+    decode: PageDecoder | None = None,
+) -> Iterator[Page]:
+    """Yield pages in order, stopping after the last one.
+
+    With ``concurrency`` > 1, up to that many pages are fetched ahead in a
+    worker pool. Pages past the end come back empty and are discarded.
+    """
+    base = {**(params or {}), "per_page": per_page}
+    fetch = _fetch_page if decode is None else partial(_fetch_page, decode=decode)
+    if concurrency <= 1:
+        page_number = 1
+        while True:
+            page = fetch(path, params={**base, "page": page_number})
+            yield page
+            if page.is_last(per_page):
+                return
+            page_number += 1
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending: deque[Future[Page]] = deque()
+    next_page_number = 1
+
+    def prefetch() -> None:
+        nonlocal next_page_number
+        # Workers run in a copy of our context so they use the bound client.
+        context = contextvars.copy_context()
+        params = {**base, "page": next_page_number}
+        pending.append(executor.submit(context.run, fetch, path, params=params))
+        next_page_number += 1
+
+    try:
+        for _ in range(concurrency):
+            prefetch()
+        while pending:
+            page = pending.popleft().result()
+            yield page
+            if page.is_last(per_page):
+                return
+            prefetch()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _apages(
+    path: str,
+    params: dict[str, Any] | None,
+    per_page: int,
+    concurrency: int,
+    decode: PageDecoder | None = None,
+) -> AsyncIterator[Page]:
+    """Async counterpart of _pages; prefetching uses tasks instead of threads."""
+    base = {**(params or {}), "per_page": per_page}
+    fetch = _afetch_page if decode is None else partial(_afetch_page, decode=decode)
+    pending: deque[asyncio.Task[Page]] = deque()
+    next_page_number = 1
+
+    def prefetch() -> None:
+        nonlocal next_page_number
+        params = {**base, "page": next_page_number}
+        pending.append(asyncio.ensure_future(fetch(path, params=params)))
+        next_page_number += 1
+
+    try:
+        for _ in range(max(concurrency, 1)):
+            prefetch()
+        while pending:
+            page = await pending.popleft()
+            yield page
+            if page.is_last(per_page):
+                return
+            prefetch()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def iter_pages(
+    path: str,
+    params: dict[str, Any] | None = None,
+    per_page: int = 100,
+    concurrency: int = 1,
+    decode: PageDecoder | None = None,
+) -> Iterator[list[Any]]:
+    """Yield the records of a paginated list endpoint one page at a time.
+
+    Only the current page (plus up to ``concurrency`` prefetched pages) is held
+    in memory, so arbitrarily long lists can be streamed. With ``decode``, each
+    page's records are whatever it makes of the raw response body.
+    """
+    for page in _pages(path, params, per_page, concurrency, decode):
+        yield page.items
+
+
+def iter_items(
+    path: str,
+    params: dict[str, Any] | None = None,
+    per_page: int = 100,
+    concurrency: int = 1,
+    decode: PageDecoder | None = None,
+) -> Iterator[Any]:
+    """Yield the records of a paginated list endpoint one at a time."""
+    for items in iter_pages(path, params, per_page, concurrency, decode):
+        yield from items
+
+
+async def aiter_pages(
+    path: str,
+    params: dict[str, Any] | None = None,
+    per_page: int = 100,
+    concurrency: int = 1,
+    decode: PageDecoder | None = None,
+) -> AsyncIterator[list[Any]]:
+    """Async counterpart of iter_pages."""
+    async for page in _apages(path, params, per_page, concurrency, decode):
+        yield page.items
+
+
+async def aiter_items(
+    path: str,
+    params: dict[str, Any] | None = None,
+    per_page: int = 100,
+    concurrency: int = 1,
+    decode: PageDecoder | None = None,
+) -> AsyncIterator[Any]:
+    """Async counterpart of iter_items."""
+    async for items in aiter_pages(path, params, per_page, concurrency, decode):
+        for item in items:
+            yield item
+
+
+def paginate(
+    path: str,
+    params: dict[str, Any] | None = None,
+    per_page: int = 100,
+    concurrency: int = 1,
+    decode: PageDecoder | None = None,
+) -> list[Any]:
+    """Fetch all pages from a paginated list endpoint.
+
+    Set ``concurrency`` to fetch that many pages ahead in parallel; results are
+    still returned in order. Use iter_items to stream large lists instead.
+    """
+    return list(iter_items(path, params, per_page, concurrency, decode))
+
+
+async def apaginate(
+    path: str,
+    params: dict[str, Any] | None = None,
+    per_page: int = 100,
+    concurrency: int = 1,
+    decode: PageDecoder | None = None,
+) -> list[Any]:
+    """Async counterpart of paginate."""
+    return [
+        item async for item in aiter_items(path, params, per_page, concurrency, decode)
+    ]
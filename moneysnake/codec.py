@@ -0,0 +1,85 @@
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Encodes request bodies to and decodes response bodies from JSON bytes."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+def _stdlib_codec() -> JsonCodec:
+    def dumps(obj: Any) -> bytes:
+        # Same compact output httpx produces for ``json=``.
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    return JsonCodec("json", dumps, json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson  # type: ignore[import-not-found]
+
+    return JsonCodec("orjson", orjson.dumps, orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec  # type: ignore[import-not-found]
+
+    return JsonCodec("msgspec", msgspec.json.encode, msgspec.json.decode)
+
+
+_CODECS: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def load_codec(name: str) -> JsonCodec:
+    """Return the codec called ``name``; raises ImportError if not installed."""
+    try:
+        factory = _CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON codec {name!r}, expected one of {', '.join(_CODECS)}"
+        ) from None
+    return factory()
+
+
+def best_codec() -> JsonCodec:
+    """The fastest installed codec: orjson, then msgspec, then the stdlib."""
+    for factory in (_orjson_codec, _msgspec_codec):
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return _stdlib_codec()
+
+
+codec_: JsonCodec = best_codec()
+
+
+def set_json_codec(codec: JsonCodec | str | None) -> None:
+    """Use ``codec`` for all request and response bodies.
+
+    Pass a JsonCodec, the name of a built-in one ("orjson", "msgspec" or
+    "json"), or None to go back to the fastest installed codec.
+    """
+    global codec_
+    if codec is None:
+        codec_ = best_codec()
+    elif isinstance(codec, str):
+        codec_ = load_codec(codec)
+    else:
+        codec_ = codec
+
+
+def get_json_codec() -> JsonCodec:
+    return codec_
@@ -1,10 +1,9 @@
-from typing import Any
-
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel
 
 from .client import http_get
 from .custom_field_model import CustomFieldModel
-from .model import Synchronizable, ensure_list_of
+from .index import indexed_lookup
+from .model import Synchronizable
 
 
 class ContactPerson(BaseModel):
@@ -47,19 +46,16 @@ class Contact(Synchronizable, CustomFieldModel):
     contact_people: list[ContactPerson] | None = None
     type: str | None = None
     from_checkout: bool = False
+    version: int | None = None
 
     @staticmethod
     def find_by_customer_id(customer_id: str) -> "Contact":
         """
-        Find a contact by customer_id
+        Find a contact by customer_id, in memory if a LookupIndex is registered
         """
-        data = http_get(f"contacts/customer_id/{customer_id}")
-        return Contact(**data)
 
-    @field_validator("contact_people")
-    def ensure_contact_people(
-        cls, value: list[dict[str, Any] | ContactPerson] | None
-    ) -> list[ContactPerson] | None:
-        if value is None:
-            return None
-        return ensure_list_of(ContactPerson, value)
+        def fetch() -> Contact:
+            data = http_get(f"contacts/customer_id/{customer_id}")
+            return Contact._from_response(data)._mark_clean()
+
+        return indexed_lookup(Contact, "customer_id", customer_id, fetch)
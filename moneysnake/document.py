@@ -1,16 +1,32 @@
+from collections.abc import Iterator, Sequence
 from typing import Any, ClassVar, Self
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from .client import (
+    UploadContent,
+    ahttp_delete,
+    ahttp_get,
+    ahttp_patch,
+    ahttp_post,
+    apaginate,
     http_delete,
     http_get,
     http_patch,
     http_post,
     http_post_file,
+    iter_pages,
     paginate,
 )
-from .model import Synchronizable, ensure_list_of
+from .codec import get_json_codec
+from .model import (
+    Synchronizable,
+    _from_session,
+    _remember,
+    filter_params,
+    none_as_empty_list,
+    update_fields,
+)
 from .payment import Payment
 
 
@@ -30,9 +46,7 @@ class DocumentDetailsAttribute(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
     def update(self, data: dict[str, Any]) -> None:
-        validated = self.model_validate({**self.model_dump(), **data})
-        for key in self.__class__.model_fields:
-            object.__setattr__(self, key, getattr(validated, key))
+        update_fields(self, data)
 
 
 class Document(Synchronizable):
@@ -71,22 +85,10 @@ class Document(Synchronizable):
 
     _destroyed_detail_ids: list[int] = PrivateAttr(default_factory=list)
 
-    @field_validator("payments")
-    def ensure_payments(
-        cls, value: list[dict[str, Any]] | list[Payment] | None
-    ) -> list[Payment]:
-        if value is None:
-            return []
-        return ensure_list_of(Payment, value)
-
-    @field_validator("details")
-    def ensure_details(
-        cls,
-        value: list[dict[str, Any]] | list[DocumentDetailsAttribute] | None,
-    ) -> list[DocumentDetailsAttribute]:
-        if value is None:
-            return []
-        return ensure_list_of(DocumentDetailsAttribute, value)
+    @field_validator("details", "payments", mode="before")
+    @classmethod
+    def ensure_lists(cls, value: Any) -> Any:
+        return none_as_empty_list(value)
 
     @classmethod
     def _base_path(cls) -> str:
@@ -97,22 +99,47 @@ class Document(Synchronizable):
         return f"documents/{cls._resource}"
 
     def load(self, id: int) -> None:
+        if (loaded := _from_session(type(self), id)) is not None:
+            if loaded is not self:
+                self._assign(loaded)
+            return
         data = http_get(f"{self._base_path()}/{id}")
-        self.update(data)
+        self._update_from_response(data)
+        _remember(self)
 
     @classmethod
     def find_by_id(cls: type[Self], id: int) -> Self:
+        if (loaded := _from_session(cls, id)) is not None:
+            return loaded
         entity = cls(id=id)
         entity.load(id)
         return entity
 
-    def save(self) -> None:
-        body = self.to_dict()
-        details = body.pop("details", [])
-        for detail_id in self._destroyed_detail_ids:
-            details.append({"id": detail_id, "_destroy": True})
-        body["details_attributes"] = details
+    async def aload(self, id: int) -> None:
+        data = await ahttp_get(f"{self._base_path()}/{id}")
+        self._update_from_response(data)
+
+    @classmethod
+    async def afind_by_id(cls: type[Self], id: int) -> Self:
+        entity = cls(id=id)
+        await entity.aload(id)
+        return entity
 
+    def _save_body(self) -> dict[str, Any]:
+        body = self._changed_dict(rows=("details",))
+        if "details" in body or self._destroyed_detail_ids:
+            details = body.pop("details", [])
+            for detail_id in self._destroyed_detail_ids:
+                details.append({"id": detail_id, "_destroy": True})
+            body["details_attributes"] = details
+        return body
+
+    def payload_size(self) -> int:
+        """Size in bytes of the JSON body the next save() sends."""
+        return len(get_json_codec().dumps({self._resource: self._save_body()}))
+
+    def save(self) -> None:
+        body = self._save_body()
         if self.id is None:
             data = http_post(self._base_path(), data={self._resource: body})
         else:
@@ -120,7 +147,18 @@ class Document(Synchronizable):
                 f"{self._base_path()}/{self.id}", data={self._resource: body}
             )
         self._destroyed_detail_ids.clear()
-        self.update(data)
+        self._update_from_response(data)
+
+    async def asave(self) -> None:
+        body = self._save_body()
+        if self.id is None:
+            data = await ahttp_post(self._base_path(), data={self._resource: body})
+        else:
+            data = await ahttp_patch(
+                f"{self._base_path()}/{self.id}", data={self._resource: body}
+            )
+        self._destroyed_detail_ids.clear()
+        self._update_from_response(data)
 
     def delete(self) -> None:
         if not self.id:
@@ -128,6 +166,12 @@ class Document(Synchronizable):
         http_delete(f"{self._base_path()}/{self.id}")
         self.id = None
 
+    async def adelete(self) -> None:
+        if not self.id:
+            raise ValueError(f"Cannot delete {self.__class__.__name__} without an id")
+        await ahttp_delete(f"{self._base_path()}/{self.id}")
+        self.id = None
+
     def add_detail(self, detail: DocumentDetailsAttribute) -> None:
         self.details.append(detail)
 
@@ -165,12 +209,16 @@ class Document(Synchronizable):
 
     def add_attachment(
         self,
-        content: bytes,
+        content: UploadContent,
         *,
         filename: str,
         content_type: str = "application/pdf",
     ) -> None:
-        """Upload a file attachment to this document (multipart/form-data)."""
+        """Upload a file attachment to this document (multipart/form-data).
+
+        ``content`` may be bytes, a file path, or a binary file object or mmap;
+        paths and files are streamed rather than read into memory.
+        """
         http_post_file(
             f"{self._base_path()}/{self.id}/attachments",
             field="file",
@@ -189,7 +237,7 @@ class Document(Synchronizable):
             f"{self._base_path()}/{self.id}/register_payment",
             data={"payment": payment.to_dict()},
         )
-        self.update(data)
+        self._update_from_response(data)
 
     @classmethod
     def list_all(
@@ -200,19 +248,104 @@ class Document(Synchronizable):
         reference: str | None = None,
     ) -> list[Self]:
         """List documents with optional filters."""
-        filter_parts: list[str] = []
-        if state:
-            filter_parts.append(f"state:{state}")
-        if period:
-            filter_parts.append(f"period:{period}")
-        if contact_id:
-            filter_parts.append(f"contact_id:{contact_id}")
-        if reference:
-            filter_parts.append(f"reference:{reference}")
-
-        params: dict[str, str] = {}
-        if filter_parts:
-            params["filter"] = ",".join(filter_parts)
-
-        data = paginate(cls._base_path(), params=params or None)
-        return [cls(**item) for item in data]
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        data = paginate(cls._base_path(), params=params, decode=cls._validate_page)
+        return cls._validate_list(data)
+
+    @classmethod
+    async def alist_all(
+        cls,
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+    ) -> list[Self]:
+        """Async counterpart of list_all."""
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        data = await apaginate(
+            cls._base_path(), params=params, decode=cls._validate_page
+        )
+        return cls._validate_list(data)
+
+    @classmethod
+    def iter_all(
+        cls,
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+        concurrency: int = 1,
+    ) -> Iterator[Self]:
+        """Like list_all, but yields documents one at a time as pages arrive."""
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        for items in iter_pages(
+            cls._base_path(),
+            params,
+            concurrency=concurrency,
+            decode=cls._validate_page,
+        ):
+            yield from items
+
+    @classmethod
+    def list_rows(
+        cls,
+        fields: Sequence[str],
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """Like list_all, but as read-only named tuples of just ``fields``.
+
+        For reports over many documents: a row takes a fraction of the memory
+        of a full model.
+        """
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        decode = cls._row_decoder(fields)
+        data = paginate(cls._base_path(), params=params, decode=decode)
+        return cls._project_list(data, fields)
+
+    @classmethod
+    async def alist_rows(
+        cls,
+        fields: Sequence[str],
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """Async counterpart of list_rows."""
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        decode = cls._row_decoder(fields)
+        data = await apaginate(cls._base_path(), params=params, decode=decode)
+        return cls._project_list(data, fields)
+
+    @classmethod
+    def iter_rows(
+        cls,
+        fields: Sequence[str],
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+        concurrency: int = 1,
+    ) -> Iterator[tuple[Any, ...]]:
+        """Like list_rows, but yields rows one at a time as pages arrive."""
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        decode = cls._row_decoder(fields)
+        for items in iter_pages(
+            cls._base_path(), params, concurrency=concurrency, decode=decode
+        ):
+            yield from cls._project_list(items, fields)
@@ -31,3 +31,7 @@ class MoneybirdValidationError(MoneybirdAPIError):
 
 class MoneybirdRateLimitError(MoneybirdAPIError):
     """Raised when the API rate limit is exceeded (429)."""
+
+
+class MoneybirdWebhookError(MoneybirdError):
+    """Raised when a webhook payload is malformed or fails verification."""
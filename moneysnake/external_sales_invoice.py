@@ -1,9 +1,18 @@
+from collections.abc import Iterator
 from typing import Any, Self
 
-from pydantic import BaseModel, Field, PrivateAttr, field_validator
-
-from .client import http_delete, http_patch, http_post, paginate
-from .model import CrudModel, Synchronizable, ensure_list_of
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .client import (
+    ahttp_patch,
+    ahttp_post,
+    http_delete,
+    http_patch,
+    http_post,
+    iter_pages,
+    paginate,
+)
+from .model import CrudModel, Synchronizable, update_fields
 from .payment import Payment
 
 
@@ -22,9 +31,7 @@ class ExternalSalesInvoiceDetailsAttribute(BaseModel):
     project_id: str | None = None
 
     def update(self, data: dict[str, Any]) -> None:
-        validated = self.model_validate({**self.model_dump(), **data})
-        for key in self.__class__.model_fields:
-            object.__setattr__(self, key, getattr(validated, key))
+        update_fields(self, data)
 
 
 
@@ -41,6 +48,7 @@ class ExternalSalesInvoice(Synchronizable, CrudModel):
     prices_are_incl_tax: bool | None = None
     source: str | None = None
     source_url: str | None = None
+    version: int | None = None
     details: list[ExternalSalesInvoiceDetailsAttribute] | None = Field(
         default_factory=list
     )
@@ -48,26 +56,22 @@ class ExternalSalesInvoice(Synchronizable, CrudModel):
 
     _destroyed_detail_ids: list[int] = PrivateAttr(default_factory=list)
 
-    @field_validator("payments")
-    def ensure_payments(
-        cls, value: list[dict[str, Any]] | list[Payment] | None
-    ) -> list[Payment] | None:
-        if value is None:
-            return None
-        return ensure_list_of(Payment, value)
+    def _save_body(self) -> dict[str, Any]:
+        invoice_data = self._changed_dict(rows=("details",))
+        # For the POST and PATCH requests we need to use the details_attributes key
+        # instead of details key to match the Moneybird API.
+        if "details" in invoice_data or self._destroyed_detail_ids:
+            details = invoice_data.pop("details", [])
+            for detail_id in self._destroyed_detail_ids:
+                details.append({"id": detail_id, "_destroy": True})
+            invoice_data["details_attributes"] = details
+        return invoice_data
 
     def save(self) -> None:
         """
         Save the external sales invoice. Overrides the save method in MoneybirdModel.
         """
-        invoice_data = self.to_dict()
-        # For the POST and PATCH requests we need to use the details_attributes key
-        # instead of details key to match the Moneybird API.
-        details = invoice_data.pop("details", [])
-        for detail_id in self._destroyed_detail_ids:
-            details.append({"id": detail_id, "_destroy": True})
-        invoice_data["details_attributes"] = details
-
+        invoice_data = self._save_body()
         if self.id is None:
             data = http_post(
                 f"{self.endpoint}s",
@@ -79,7 +83,25 @@ class ExternalSalesInvoice(Synchronizable, CrudModel):
                 data={self.endpoint: invoice_data},
             )
         self._destroyed_detail_ids.clear()
-        self.update(data)
+        self._update_from_response(data)
+
+    async def asave(self) -> None:
+        """
+        Async counterpart of save.
+        """
+        invoice_data = self._save_body()
+        if self.id is None:
+            data = await ahttp_post(
+                f"{self.endpoint}s",
+                data={self.endpoint: invoice_data},
+            )
+        else:
+            data = await ahttp_patch(
+                f"{self.endpoint}s/{self.id}",
+                data={self.endpoint: invoice_data},
+            )
+        self._destroyed_detail_ids.clear()
+        self._update_from_response(data)
 
     def add_detail(self, detail: ExternalSalesInvoiceDetailsAttribute) -> None:
         """
@@ -137,8 +159,27 @@ class ExternalSalesInvoice(Synchronizable, CrudModel):
         data = paginate(
             f"{endpoint}s",
             params={"filter": f"contact_id:{contact_id},state:{state},period:{period}"},
+            decode=cls._validate_page,
         )
-        return [cls(**item) for item in data]
+        return cls._validate_list(data)
+
+    @classmethod
+    def iter_all_by_contact_id(
+        cls,
+        contact_id: int,
+        state: str | None = "all",
+        period: str | None = "this_year",
+    ) -> Iterator[Self]:
+        """
+        Like list_all_by_contact_id, but yields invoices one at a time.
+        """
+        endpoint = cls._sync_endpoint()
+        for items in iter_pages(
+            f"{endpoint}s",
+            params={"filter": f"contact_id:{contact_id},state:{state},period:{period}"},
+            decode=cls._validate_page,
+        ):
+            yield from items
 
     def create_payment(self, payment: Payment) -> Payment:
         """
@@ -1,11 +1,12 @@
 import re
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from enum import Enum, auto
 from typing import Any, Self
 
 from pydantic import Field
 
-from .client import http_delete, http_patch, paginate
+from .client import http_delete, http_patch, iter_pages, paginate
 from .model import Loadable, MoneybirdModel, Synchronizable
 
 
@@ -111,6 +112,77 @@ class FinancialMutation(Synchronizable, Loadable, MoneybirdModel):
         A specific 'period' is required to avoid the 'Too many mutations' error.
         If no period is provided, it defaults to the current day.
         """
+        params = cls._search_params(query_string, period, financial_account_id)
+        results = paginate(
+            "financial_mutations", params=params, decode=cls._validate_page
+        )
+        return cls._validate_list(results)
+
+    @classmethod
+    def iter_search(
+        cls,
+        query_string: str | None = None,
+        period: str | None = None,
+        financial_account_id: str | None = None,
+        concurrency: int = 1,
+    ) -> Iterator[Self]:
+        """
+        Like search, but yields financial mutations one at a time as pages arrive.
+        The period defaults to the current day.
+        """
+        period = period or datetime.now().strftime("%Y%m%d")
+        params = cls._search_params(query_string, period, financial_account_id)
+        for results in iter_pages(
+            "financial_mutations",
+            params,
+            concurrency=concurrency,
+            decode=cls._validate_page,
+        ):
+            yield from results
+
+    @classmethod
+    def search_rows(
+        cls,
+        fields: Sequence[str],
+        query_string: str | None = None,
+        period: str | None = None,
+        financial_account_id: str | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """
+        Like search, but as read-only named tuples of just ``fields``, which take
+        a fraction of the memory of full models. The period defaults to the
+        current day.
+        """
+        period = period or datetime.now().strftime("%Y%m%d")
+        params = cls._search_params(query_string, period, financial_account_id)
+        decode = cls._row_decoder(fields)
+        results = paginate("financial_mutations", params=params, decode=decode)
+        return cls._project_list(results, fields)
+
+    @classmethod
+    def iter_search_rows(
+        cls,
+        fields: Sequence[str],
+        query_string: str | None = None,
+        period: str | None = None,
+        financial_account_id: str | None = None,
+        concurrency: int = 1,
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Like search_rows, but yields rows one at a time as pages arrive.
+        """
+        period = period or datetime.now().strftime("%Y%m%d")
+        params = cls._search_params(query_string, period, financial_account_id)
+        decode = cls._row_decoder(fields)
+        for results in iter_pages(
+            "financial_mutations", params, concurrency=concurrency, decode=decode
+        ):
+            yield from cls._project_list(results, fields)
+
+    @staticmethod
+    def _search_params(
+        query_string: str | None, period: str, financial_account_id: str | None
+    ) -> dict[str, str]:
         formatted_period = (
             f"{period}..{period}" if len(period) == 8 and ".." not in period else period
         )
@@ -124,9 +196,4 @@ class FinancialMutation(Synchronizable, Loadable, MoneybirdModel):
         if financial_account_id:
             filter_parts.append(f"financial_account_id:{financial_account_id}")
 
-        filter_val = ",".join(filter_parts)
-
-        params = {"filter": filter_val}
-
-        results = paginate("financial_mutations", params=params)
-        return [cls(**result) for result in results]
+        return {"filter": ",".join(filter_parts)}
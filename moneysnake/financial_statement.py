@@ -2,10 +2,10 @@ from typing import Any
 
 from pydantic import Field, field_validator
 
-from moneysnake.client import http_patch, http_post
+from moneysnake.client import ahttp_patch, ahttp_post, http_patch, http_post
 
 from .financial_mutation import FinancialMutation
-from .model import Deletable, MoneybirdModel, Saveable, ensure_list_of
+from .model import Deletable, MoneybirdModel, Saveable, none_as_empty_list
 
 
 class FinancialStatement(Saveable, Deletable, MoneybirdModel):
@@ -20,18 +20,12 @@ class FinancialStatement(Saveable, Deletable, MoneybirdModel):
     importer_service: str | None = None
     financial_mutations: list[FinancialMutation] = Field(default_factory=list)
 
-    @field_validator("financial_mutations")
-    def ensure_financial_mutations(
-        cls, value: list[dict[str, Any]] | None
-    ) -> list[FinancialMutation] | None:
-        if value is None:
-            return None
-        return ensure_list_of(FinancialMutation, value)
+    @field_validator("financial_mutations", mode="before")
+    @classmethod
+    def ensure_lists(cls, value: Any) -> Any:
+        return none_as_empty_list(value)
 
-    def save(self) -> None:
-        """
-        Save the financial statement. Overrides the save method in MoneybirdModel.
-        """
+    def _save_body(self) -> dict[str, Any]:
         financial_statement_data = self.to_dict()
 
         # For the POST and PATCH requests we need to use the details_attributes key
@@ -39,7 +33,13 @@ class FinancialStatement(Saveable, Deletable, MoneybirdModel):
         financial_statement_data["financial_mutations_attributes"] = (
             financial_statement_data.pop("financial_mutations", [])
         )
+        return financial_statement_data
 
+    def save(self) -> None:
+        """
+        Save the financial statement. Overrides the save method in MoneybirdModel.
+        """
+        financial_statement_data = self._save_body()
         if self.id is None:
             data = http_post(
                 f"{self.endpoint}s",
@@ -51,7 +51,24 @@ class FinancialStatement(Saveable, Deletable, MoneybirdModel):
                 f"{self.endpoint}s/{self.id}",
                 data={self.endpoint: financial_statement_data},
             )
-        self.update(data)
+        self._update_from_response(data)
+
+    async def asave(self) -> None:
+        """
+        Async counterpart of save.
+        """
+        financial_statement_data = self._save_body()
+        if self.id is None:
+            data = await ahttp_post(
+                f"{self.endpoint}s",
+                data={self.endpoint: financial_statement_data},
+            )
+        else:
+            data = await ahttp_patch(
+                f"{self.endpoint}s/{self.id}",
+                data={self.endpoint: financial_statement_data},
+            )
+        self._update_from_response(data)
 
     def add_financial_mutation(self, financial_mutation: FinancialMutation) -> None:
         """
@@ -0,0 +1,206 @@
+import threading
+import time
+from collections.abc import Callable
+from contextlib import nullcontext
+from typing import Any, Generic, TypeVar
+
+from .client import MoneybirdClient, current_client
+from .exceptions import MoneybirdNotFoundError
+from .model import Synchronizable, Version, _normalize_version
+
+S = TypeVar("S", bound=Synchronizable)
+
+
+class LookupIndex(Generic[S]):
+    """In-memory index of a Synchronizable model by one of its fields.
+
+    ``sync()`` fills the index from the synchronization endpoints and, on
+    later calls, only downloads records whose version changed. Once
+    registered with ``register_index``, lookups such as
+    ``Contact.find_by_customer_id`` are answered from memory::
+
+        index = LookupIndex(Contact, "customer_id", refresh_interval=300)
+        index.sync()
+        register_index(index)
+
+    A key that is not in the index falls back to the API. Keys the API does
+    not know are remembered for ``negative_ttl`` seconds and raise
+    MoneybirdNotFoundError without a request. With ``refresh_interval``, a
+    lookup first syncs the index when it is older than that many seconds.
+    The index belongs to one administration: that of ``client`` or, without
+    one, of the default client when the index is synced.
+    """
+
+    def __init__(
+        self,
+        model: type[S],
+        field: str,
+        *,
+        client: MoneybirdClient | None = None,
+        negative_ttl: float = 300.0,
+        refresh_interval: float | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        if field not in model.model_fields:
+            raise ValueError(f"{model.__name__} has no field {field!r}")
+        self.model = model
+        self.field = field
+        self.client = client
+        self.negative_ttl = negative_ttl
+        self.refresh_interval = refresh_interval
+        self.max_workers = max_workers
+        self.admin_id: int | None = client.admin_id if client else None
+        self.synced_at: float | None = None
+        self._records: dict[int, S] = {}
+        self._versions: dict[int, Version] = {}
+        self._ids_by_key: dict[str, int] = {}
+        self._missing: dict[str, float] = {}
+        self._lock = threading.RLock()
+        # Held for a whole sync, so only one thread talks to the API at a time.
+        self._sync_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def sync(self) -> None:
+        """Fetch new and changed records and drop deleted ones.
+
+        Lookups are answered from the current records while the requests
+        run; concurrent calls wait for the running sync and then sync again.
+        """
+        with self._sync_lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        with self.client.bind() if self.client else nullcontext():
+            admin_id = current_client().admin_id
+            with self._lock:
+                versions = dict(self._versions)
+            diff = self.model.sync_diff(versions)
+            fetched = self.model.sync_fetch_all(
+                diff.changed, max_workers=self.max_workers
+            )
+        with self._lock:
+            self.admin_id = admin_id
+            for id in [*diff.deleted, *fetched.missing]:
+                self.remove(id)
+            for id, record in fetched.records.items():
+                self.add(record, version=diff.versions[id])
+            self.synced_at = time.monotonic()
+
+    def add(self, record: S, version: Version | None = None) -> None:
+        """Index ``record``, replacing the previous version with its id."""
+        if record.id is None:
+            return
+        with self._lock:
+            self.remove(record.id)
+            self._records[record.id] = record
+            if version is None:
+                version = getattr(record, "version", None)
+            self._versions[record.id] = _normalize_version(version) or 0
+            key = self._key(getattr(record, self.field))
+            if key is not None:
+                self._ids_by_key[key] = record.id
+                self._missing.pop(key, None)
+
+    def remove(self, id: int) -> None:
+        with self._lock:
+            record = self._records.pop(id, None)
+            self._versions.pop(id, None)
+            if record is not None:
+                key = self._key(getattr(record, self.field))
+                if key is not None and self._ids_by_key.get(key) == id:
+                    del self._ids_by_key[key]
+
+    def get(self, key: Any) -> S | None:
+        """The indexed record for ``key``, without falling back to the API."""
+        with self._lock:
+            id = self._ids_by_key.get(str(key))
+            return self._records.get(id) if id is not None else None
+
+    def resolve(self, key: Any, fetch: Callable[[], S]) -> S:
+        """Look ``key`` up in the index, calling ``fetch`` if it is unknown.
+
+        Returns a copy, so callers can change it without affecting the index.
+        """
+        key = str(key)
+        if self.admin_id is None:
+            self.admin_id = current_client().admin_id
+        # A lookup during another thread's refresh uses the current records.
+        if self._stale() and self._sync_lock.acquire(blocking=False):
+            try:
+                self._sync()
+            finally:
+                self._sync_lock.release()
+        with self._lock:
+            record = self.get(key)
+            if record is not None:
+                return record.model_copy(deep=True)
+            expires = self._missing.get(key)
+            if expires is not None and expires > time.monotonic():
+                raise MoneybirdNotFoundError(
+                    status_code=404,
+                    response_body="Not found (cached)",
+                    method="get",
+                    path=f"{self.model.__name__}.{self.field}={key}",
+                )
+        try:
+            record = fetch()
+        except MoneybirdNotFoundError:
+            with self._lock:
+                self._missing[key] = time.monotonic() + self.negative_ttl
+            raise
+        self.add(record.model_copy(deep=True))
+        return record
+
+    def _stale(self) -> bool:
+        return self.refresh_interval is not None and (
+            self.synced_at is None
+            or time.monotonic() - self.synced_at > self.refresh_interval
+        )
+
+    @staticmethod
+    def _key(value: Any) -> str | None:
+        return None if value is None or value == "" else str(value)
+
+
+_indexes: list[LookupIndex[Any]] = []
+_indexes_lock = threading.Lock()
+
+
+def register_index(index: LookupIndex[Any]) -> None:
+    """Answer lookups by ``index.field`` from ``index``."""
+    with _indexes_lock:
+        _indexes.append(index)
+
+
+def unregister_index(index: LookupIndex[Any]) -> None:
+    with _indexes_lock:
+        _indexes.remove(index)
+
+
+def registered_indexes(model: type[S]) -> list[LookupIndex[S]]:
+    """The registered indexes of ``model`` for the bound client."""
+    admin_id = current_client().admin_id
+    with _indexes_lock:
+        return [
+            index
+            for index in _indexes
+            if index.model is model and index.admin_id in (None, admin_id)
+        ]
+
+
+def find_index(model: type[S], field: str) -> LookupIndex[S] | None:
+    """The registered index of ``model`` by ``field`` for the bound client."""
+    for index in registered_indexes(model):
+        if index.field == field:
+            return index
+    return None
+
+
+def indexed_lookup(
+    model: type[S], field: str, key: Any, fetch: Callable[[], S]
+) -> S:
+    """Resolve ``key`` through a registered index, or just call ``fetch``."""
+    index = find_index(model, field)
+    return index.resolve(key, fetch) if index is not None else fetch()
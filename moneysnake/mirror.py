@@ -0,0 +1,187 @@
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Protocol, TypeVar
+
+from .model import Synchronizable, Version, _normalize_version
+
+S = TypeVar("S", bound=Synchronizable)
+
+
+class MirrorStore(Protocol):
+    """Storage backend of a Mirror: JSON records per resource, keyed by id."""
+
+    def versions(self, resource: str) -> dict[int, Version]: ...
+
+    def upsert(
+        self, resource: str, records: Iterable[tuple[int, Version, str]]
+    ) -> None:
+        """Insert or replace ``(id, version, json)`` records."""
+        ...
+
+    def delete(self, resource: str, ids: Iterable[int]) -> None: ...
+
+    def get(self, resource: str, id: int) -> str | None: ...
+
+    def iter_all(self, resource: str) -> Iterator[str]: ...
+
+    def count(self, resource: str) -> int: ...
+
+
+class SQLiteStore:
+    """MirrorStore in a SQLite database; ``":memory:"`` keeps it in memory."""
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:") -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                " resource TEXT NOT NULL,"
+                " id INTEGER NOT NULL,"
+                " version INTEGER NOT NULL,"
+                " data TEXT NOT NULL,"
+                " PRIMARY KEY (resource, id)"
+                ") WITHOUT ROWID"
+            )
+
+    def versions(self, resource: str) -> dict[int, Version]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, version FROM records WHERE resource = ?", (resource,)
+            ).fetchall()
+        return {id: _normalize_version(version) or 0 for id, version in rows}
+
+    def upsert(
+        self, resource: str, records: Iterable[tuple[int, Version, str]]
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (resource, id, version, data)"
+                " VALUES (?, ?, ?, ?)",
+                ((resource, *record) for record in records),
+            )
+
+    def delete(self, resource: str, ids: Iterable[int]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM records WHERE resource = ? AND id = ?",
+                ((resource, id) for id in ids),
+            )
+
+    def get(self, resource: str, id: int) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM records WHERE resource = ? AND id = ?",
+                (resource, id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def iter_all(self, resource: str) -> Iterator[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM records WHERE resource = ? ORDER BY id", (resource,)
+            ).fetchall()
+        for (data,) in rows:
+            yield data
+
+    def count(self, resource: str) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM records WHERE resource = ?", (resource,)
+            ).fetchone()
+        return count
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    """What a Mirror.sync changed locally."""
+
+    fetched: int
+    deleted: int
+    unchanged: int
+
+
+class Mirror:
+    """Local copy of Synchronizable resources, refreshed incrementally.
+
+    ``sync(Contact)`` asks the API for the id and version of every contact,
+    downloads only the new and changed ones (through sync_fetch_all) and
+    removes the ones that were deleted, so a refresh costs
+    requests in proportion to what changed. Reads never touch the API::
+
+        mirror = Mirror("moneybird.db")
+        mirror.sync(Contact, SalesInvoice, PurchaseInvoice)
+        contact = mirror.get(Contact, 123)
+
+    Records are stored per resource, not per administration: use one store
+    per administration. Syncs run against the bound client like any request.
+    """
+
+    def __init__(
+        self,
+        store: MirrorStore | str | os.PathLike[str] = ":memory:",
+        max_workers: int = 4,
+    ) -> None:
+        self.store: MirrorStore = (
+            SQLiteStore(store) if isinstance(store, (str, os.PathLike)) else store
+        )
+        self.max_workers = max_workers
+
+    def sync(
+        self, *models: type[Synchronizable], filter: str | None = None
+    ) -> dict[type[Synchronizable], SyncResult]:
+        """Bring the local copy of each model up to date with the API.
+
+        With a ``filter``, the mirror holds only the matching records: stored
+        records that no longer match are removed like deleted ones.
+        """
+        return {model: self._sync(model, filter) for model in models}
+
+    def _sync(self, model: type[Synchronizable], filter: str | None) -> SyncResult:
+        resource = model._sync_endpoint()
+        diff = model.sync_diff(self.store.versions(resource), filter=filter)
+        fetched = model.sync_fetch_all(diff.changed, max_workers=self.max_workers)
+        self.store.upsert(
+            resource,
+            (
+                (id, diff.versions[id], record.model_dump_json())
+                for id, record in fetched.records.items()
+            ),
+        )
+        self.store.delete(resource, [*diff.deleted, *fetched.missing])
+        return SyncResult(
+            fetched=len(fetched.records),
+            deleted=len(diff.deleted) + len(fetched.missing),
+            unchanged=len(diff.versions) - len(diff.changed),
+        )
+
+    def put(self, record: Synchronizable, version: Version) -> None:
+        """Store ``record`` as the local copy of its id."""
+        if record.id is None:
+            return
+        self.store.upsert(
+            record._sync_endpoint(), [(record.id, version, record.model_dump_json())]
+        )
+
+    def remove(self, model: type[Synchronizable], id: int) -> None:
+        self.store.delete(model._sync_endpoint(), [id])
+
+    def get(self, model: type[S], id: int) -> S | None:
+        data = self.store.get(model._sync_endpoint(), id)
+        return model.model_validate_json(data) if data is not None else None
+
+    def iter_all(self, model: type[S]) -> Iterator[S]:
+        for data in self.store.iter_all(model._sync_endpoint()):
+            yield model.model_validate_json(data)
+
+    def all(self, model: type[S]) -> list[S]:
+        return list(self.iter_all(model))
+
+    def count(self, model: type[Synchronizable]) -> int:
+        return self.store.count(model._sync_endpoint())
@@ -1,23 +1,502 @@
-from typing import Any, Self, TypeVar
+import asyncio
+import contextlib
+import contextvars
+import copy
+import dataclasses
+import functools
+import hashlib
+import inspect
+from collections import namedtuple
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Generic,
+    Self,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr, TypeAdapter
+from pydantic_core import PydanticUndefined
 
-from .client import http_delete, http_get, http_patch, http_post, paginate
+from .client import (
+    MoneybirdClient,
+    ahttp_delete,
+    ahttp_get,
+    ahttp_patch,
+    ahttp_post,
+    apaginate,
+    bound_client,
+    http_delete,
+    http_get,
+    http_patch,
+    http_post,
+    paginate,
+    responses_trusted,
+)
+from .codec import get_json_codec
+from .exceptions import MoneybirdNotFoundError
+from .session import WriteOperation, current_session
 
 T = TypeVar("T", bound=BaseModel)
+M = TypeVar("M", bound="MoneybirdModel")
+S = TypeVar("S", bound="Synchronizable")
+L = TypeVar("L", bound="Loadable")
+
+# The synchronization endpoint returns at most this many records per request.
+SYNC_FETCH_LIMIT = 100
 
 
 def ensure_list_of(model_cls: type[T], value: list) -> list[T]:
+    """Deprecated: the models no longer use it, see none_as_empty_list.
+
+    Builds ``model_cls`` from every item that is not an instance yet.
+    """
     return [
         item if isinstance(item, model_cls) else model_cls(**item) for item in value
     ]
 
 
+def none_as_empty_list(value: Any) -> Any:
+    """Before-validator for list fields Moneybird may send as null.
+
+    Use it with ``field_validator(..., mode="before")``. The items are left to
+    the field's own validation, so each nested model is validated just once.
+    """
+    return [] if value is None else value
+
+
+@functools.cache
+def _list_adapter(cls: type[T]) -> TypeAdapter[list[T]]:
+    return TypeAdapter(list[cls])  # type: ignore[valid-type]
+
+
+def _to_int(value: Any) -> Any:
+    try:
+        return int(value) if isinstance(value, str) else value
+    except ValueError:
+        return value
+
+
+def _to_float(value: Any) -> Any:
+    try:
+        return float(value) if isinstance(value, (str, int)) else value
+    except ValueError:
+        return value
+
+
+def _trusted_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """How ``construct`` coerces a value for a field, None to keep it as is."""
+    union = get_origin(annotation) in (Union, UnionType)
+    args = get_args(annotation) if union else (annotation,)
+    types = [arg for arg in args if arg is not NoneType]
+    if len(types) != 1:
+        return None
+    (type_,) = types
+    if type_ is int:
+        # Moneybird sends ids as strings.
+        return _to_int
+    if type_ is float:
+        # Amounts and percentages come as strings, or as ints when whole.
+        return _to_float
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        return lambda value: (
+            construct(type_, value) if isinstance(value, dict) else value
+        )
+    if get_origin(type_) is list and len(get_args(type_)) == 1:
+        (item,) = get_args(type_)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            empty: list[Any] | None = None if NoneType in args else []
+
+            def convert_list(value: Any) -> Any:
+                if value is None:
+                    return empty
+                return [
+                    construct(item, entry) if isinstance(entry, dict) else entry
+                    for entry in value
+                ]
+
+            return convert_list
+    return None
+
+
+def _split_defaults(
+    attrs: Mapping[str, Any],
+) -> tuple[dict[str, Any], tuple[tuple[str, Callable[[], Any]], ...]]:
+    """Immutable defaults of fields or private attributes, and factories."""
+    defaults: dict[str, Any] = {}
+    factories = []
+    for name, attr in attrs.items():
+        factory, default = attr.default_factory, attr.default
+        if factory is None and isinstance(default, (list, dict, set)):
+            factory = (
+                functools.partial(copy.deepcopy, default) if default else type(default)
+            )
+        if factory is not None:
+            defaults[name] = None
+            factories.append((name, factory))
+        elif default is not PydanticUndefined:
+            defaults[name] = default
+    return defaults, tuple(factories)
+
+
+@dataclass(frozen=True)
+class _ConstructPlan:
+    """How construct builds one model class, worked out once per class."""
+
+    fields: frozenset[str]
+    # Whether no field holds nested models; see _trusts_responses.
+    flat: bool
+    converters: tuple[tuple[str, Callable[[Any], Any]], ...]
+    # Immutable defaults; the ones with a factory are filled in per record.
+    defaults: dict[str, Any]
+    factories: tuple[tuple[str, Callable[[], Any]], ...]
+    # None if the class has its own model_post_init, which then has to run.
+    private: tuple[dict[str, Any], tuple[tuple[str, Callable[[], Any]], ...]] | None
+
+
+@functools.cache
+def _construct_plan(cls: type[BaseModel]) -> _ConstructPlan:
+    converters = tuple(
+        (name, convert)
+        for name, field_info in cls.model_fields.items()
+        if (convert := _trusted_converter(field_info.annotation)) is not None
+    )
+    private = None
+    if not cls.__pydantic_post_init__ or (
+        # The one pydantic generates when there is no custom model_post_init.
+        cls.model_post_init.__name__ == "init_private_attributes"
+    ):
+        private = _split_defaults(cls.__private_attributes__)
+    return _ConstructPlan(
+        frozenset(cls.model_fields),
+        not any(_holds_models(info.annotation) for info in cls.model_fields.values()),
+        converters,
+        *_split_defaults(cls.model_fields),
+        private,
+    )
+
+
+def _holds_models(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_holds_models(arg) for arg in get_args(annotation))
+
+
+def _trusts_responses(cls: type[BaseModel]) -> bool:
+    """Whether a response record of ``cls`` is built by construct right now.
+
+    Only flat records are: pydantic-core validates nested models, and whole
+    pages or lists through the cached TypeAdapter, faster than construct
+    builds them (see benchmarks/bench_trusted.py).
+    """
+    return responses_trusted() and _construct_plan(cls).flat
+
+
+def construct(cls: type[T], data: Mapping[str, Any]) -> T:
+    """Build ``cls`` from trusted API data without validating it.
+
+    String ids are turned into ints, strings and ints in float fields into
+    floats, and nested models are built the same way; everything else is
+    taken as it is. Unknown keys are ignored.
+    """
+    plan = _construct_plan(cls)
+    if plan.fields.issuperset(data):
+        values = dict(data)
+    else:
+        values = {key: value for key, value in data.items() if key in plan.fields}
+    for name, convert in plan.converters:
+        if name in values:
+            values[name] = convert(values[name])
+    # What model_construct does, minus its per-record default lookups, which
+    # cost more than validating the record would.
+    fields = {**plan.defaults, **values}
+    for name, factory in plan.factories:
+        if name not in values:
+            fields[name] = factory()
+    model = cls.__new__(cls)
+    object.__setattr__(model, "__dict__", fields)
+    object.__setattr__(model, "__pydantic_fields_set__", set(values))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    if plan.private is None:
+        object.__setattr__(model, "__pydantic_private__", None)
+        model.model_post_init(None)
+    elif cls.__private_attributes__:
+        defaults, factories = plan.private
+        private = defaults.copy()
+        for name, factory in factories:
+            private[name] = factory()
+        object.__setattr__(model, "__pydantic_private__", private)
+    else:
+        object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+@functools.cache
+def _projector(
+    cls: type[BaseModel], fields: tuple[str, ...]
+) -> Callable[[Any], tuple[Any, ...]]:
+    """Turns a record of ``cls`` into a row of ``fields``; rows pass through."""
+    unknown = [name for name in fields if name not in cls.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown {cls.__name__} fields: {', '.join(unknown)}")
+    row = namedtuple(f"{cls.__name__}Row", fields)  # type: ignore[misc]
+    converters = dict(_construct_plan(cls).converters)
+    columns = [(name, converters.get(name)) for name in fields]
+
+    def project(item: Any) -> tuple[Any, ...]:
+        if isinstance(item, row):
+            return item
+        return row._make(
+            item.get(name) if convert is None else convert(item.get(name))
+            for name, convert in columns
+        )
+
+    return project
+
+
+def update_fields(
+    model: BaseModel, data: Mapping[str, Any], trusted: bool = False
+) -> None:
+    """Validate the known keys of ``data`` and set them on ``model``.
+
+    Only the incoming values are validated; the other fields, including
+    nested models, are left untouched instead of being dumped and rebuilt.
+    With ``trusted``, the values are not validated but built by construct.
+    """
+    fields = type(model).model_fields
+    incoming = {key: value for key, value in data.items() if key in fields}
+    if not incoming:
+        return
+    if trusted:
+        validated = construct(type(model), incoming)
+    else:
+        validated = type(model).model_validate(incoming)
+    for key in incoming:
+        object.__setattr__(model, key, getattr(validated, key))
+
+
+def _digest(value: Any) -> bytes:
+    """A short fingerprint of a to_dict() value, stable across processes."""
+    return hashlib.blake2b(repr(value).encode(), digest_size=8).digest()
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """Fingerprints of a model's values as the API has them.
+
+    ``rows`` fingerprints every value of each row with an id, by row id, for
+    the list fields that are compared row by row.
+    """
+
+    fields: dict[str, bytes]
+    rows: dict[str, dict[Any, dict[str, bytes]]]
+
+    @classmethod
+    def of(cls, body: dict[str, Any]) -> "_Snapshot":
+        rows = {}
+        for key, value in body.items():
+            if isinstance(value, list) and (digests := _row_digests(value)):
+                rows[key] = digests
+        return cls({key: _digest(value) for key, value in body.items()}, rows)
+
+
+def _row_digests(rows: list[Any]) -> dict[Any, dict[str, bytes]]:
+    return {
+        row["id"]: {key: _digest(value) for key, value in row.items()}
+        for row in rows
+        if isinstance(row, dict) and row.get("id") is not None
+    }
+
+
+def _changed_rows(
+    rows: list[dict[str, Any]], previous: dict[Any, dict[str, bytes]]
+) -> list[dict[str, Any]]:
+    """New rows in full, and the id and changed values of existing rows."""
+    changed = []
+    for row in rows:
+        old = previous.get(row.get("id"))
+        if old is None:
+            changed.append(row)
+            continue
+        diff = {
+            key: value for key, value in row.items() if old.get(key) != _digest(value)
+        }
+        if diff:
+            changed.append({"id": row["id"], **diff})
+    return changed
+
+
+def filter_params(**filters: Any) -> dict[str, str] | None:
+    """Build list endpoint params from filters, skipping empty values.
+
+    ``filter_params(state="open", period=None)`` -> ``{"filter": "state:open"}``
+    """
+    parts = [f"{key}:{value}" for key, value in filters.items() if value]
+    return {"filter": ",".join(parts)} if parts else None
+
+
+ClientResolver = Callable[[tuple[Any, ...], dict[str, Any]], MoneybirdClient | None]
+
+
+def _with_client(
+    func: Callable[..., Any], resolve: ClientResolver
+) -> Callable[..., Any]:
+    """Wrap ``func`` so it runs with the client that ``resolve`` picks per call.
+
+    Generators are bound for every step of the iteration rather than only
+    while they are created, and the binding never leaks to the caller between
+    items.
+    """
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        async def async_gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+            client = resolve(args, kwargs)
+            iterator = func(*args, **kwargs)
+            while True:
+                with client.bind() if client else contextlib.nullcontext():
+                    try:
+                        item = await anext(iterator)
+                    except StopAsyncIteration:
+                        return
+                yield item
+
+        return async_gen_wrapper
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            client = resolve(args, kwargs)
+            with client.bind() if client else contextlib.nullcontext():
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+            client = resolve(args, kwargs)
+            iterator = func(*args, **kwargs)
+            while True:
+                with client.bind() if client else contextlib.nullcontext():
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                yield item
+
+        return gen_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        client = resolve(args, kwargs)
+        with client.bind() if client else contextlib.nullcontext():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _deferrable(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Queue calls without arguments in the active session instead of running."""
+
+    @functools.wraps(func)
+    def wrapper(self: "MoneybirdModel", *args: Any, **kwargs: Any) -> Any:
+        session = current_session()
+        if session is None or args or kwargs or not session.defers():
+            return func(self, *args, **kwargs)
+        session.queue(cast(WriteOperation, func.__name__), self)
+        return None
+
+    return wrapper
+
+
+def _from_session(cls: type[M], id: int) -> M | None:
+    session = current_session()
+    return session.get(cls, id) if session is not None else None
+
+
+def _remember(model: "MoneybirdModel") -> None:
+    session = current_session()
+    if session is not None:
+        session.add(model)
+
+
+def _instance_client(
+    args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> MoneybirdClient | None:
+    """Instance methods use the client their model is bound to."""
+    return args[0]._client
+
+
+def _client_kwarg(
+    args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> MoneybirdClient | None:
+    """Class and static methods take an optional ``client=`` keyword argument."""
+    return kwargs.pop("client", None)
+
+
 class MoneybirdModel(BaseModel):
     id: int | None = None
     model_config = ConfigDict(extra="ignore")
 
     _endpoint: str | None = None
+    # The client that was bound when this model was created; its requests go
+    # through that client even when called outside of ``client.bind()``.
+    _client: MoneybirdClient | None = PrivateAttr(default_factory=bound_client)
+    # Fingerprints of to_dict() as of the last load or save, to send only
+    # what changed since.
+    _snapshot: _Snapshot | None = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        # Only the field values count; the client and snapshot do not.
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # The client is not pickled along; an unpickled model uses whichever
+        # client is bound when it makes a request.
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private and private.get("_client") is not None:
+            state["__pydantic_private__"] = {**private, "_client": None}
+        return state
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Route the public API of every model through its client: instance
+        # methods use the model's own client, class and static methods accept
+        # an optional ``client=`` keyword argument.
+        decorators = cls.__pydantic_decorators__
+        validators = {
+            name
+            for field in dataclasses.fields(decorators)
+            for name in getattr(decorators, field.name)
+        }
+        for name, attr in list(vars(cls).items()):
+            if name.startswith(("_", "model_")) or name in validators:
+                continue
+            if isinstance(attr, classmethod):
+                func = _with_client(attr.__func__, _client_kwarg)
+                setattr(cls, name, classmethod(func))
+            elif isinstance(attr, staticmethod):
+                func = _with_client(attr.__func__, _client_kwarg)
+                setattr(cls, name, staticmethod(func))
+            elif inspect.isfunction(attr):
+                if name in ("save", "delete"):
+                    # Writes can be deferred to the commit of a Session.
+                    attr = _deferrable(attr)
+                setattr(cls, name, _with_client(attr, _instance_client))
 
     @property
     def endpoint(self) -> str:
@@ -33,44 +512,269 @@ class MoneybirdModel(BaseModel):
     def to_dict(self) -> dict[str, Any]:
         return self.model_dump(exclude_none=True)
 
-    def update(self, data: dict[str, Any]) -> None:
-        # Use model_validate to ensure field validators run
-        validated = self.model_validate({**self.model_dump(), **data})
-        # Copy validated field values directly (not via model_dump which converts to dicts)
+    @classmethod
+    def _validate_list(cls, items: list[Any]) -> list[Self]:
+        """Validate decoded records in one call; instances are passed through.
+
+        Also in trusted mode: the TypeAdapter beats construct on whole lists.
+        """
+        return _list_adapter(cls).validate_python(items)
+
+    @classmethod
+    def _validate_page(cls, content: bytes) -> list[Self]:
+        """Validate a JSON array of records straight from the response body.
+
+        Pass as ``decode`` to paginate and friends to skip building dicts.
+        """
+        return _list_adapter(cls).validate_json(content)
+
+    @classmethod
+    def _project_list(
+        cls, items: Iterable[Any], fields: Sequence[str]
+    ) -> list[tuple[Any, ...]]:
+        """Project records onto read-only rows of ``fields``, see _row_decoder."""
+        project = _projector(cls, tuple(fields))
+        return [project(item) for item in items]
+
+    @classmethod
+    def _row_decoder(
+        cls, fields: Sequence[str]
+    ) -> Callable[[bytes], list[tuple[Any, ...]]]:
+        """A ``decode`` for paginate and friends that keeps only ``fields``.
+
+        Each record becomes a named tuple with just those fields, converted
+        like construct does: ids as ints, nested models built unvalidated.
+        The decoded page is dropped as soon as its rows are made, so large
+        lists take a fraction of the memory of full models.
+        """
+        project = _projector(cls, tuple(fields))
+
+        def decode(content: bytes) -> list[tuple[Any, ...]]:
+            return [project(item) for item in get_json_codec().loads(content)]
+
+        return decode
+
+    @classmethod
+    def _from_response(cls, data: dict[str, Any]) -> Self:
+        """Build a model from the body of an API response."""
+        return construct(cls, data) if _trusts_responses(cls) else cls(**data)
+
+    def _update_from_response(self, data: dict[str, Any]) -> None:
+        """Apply the body of an API response, unvalidated in trusted mode.
+
+        The response is the record as the API now has it, so it also becomes
+        the snapshot later saves are compared with.
+        """
+        update_fields(self, data, trusted=_trusts_responses(type(self)))
+        self._mark_clean()
+
+    def _mark_clean(self) -> Self:
+        """Remember the current values as the ones the API has."""
+        self._snapshot = _Snapshot.of(self.to_dict())
+        return self
+
+    def _changed_dict(self, rows: Iterable[str] = ()) -> dict[str, Any]:
+        """to_dict(), limited to the values changed since the last load or save.
+
+        New records and records that were not loaded one at a time, such as
+        list and sync_fetch results, are returned in full. The list fields in
+        ``rows`` are compared row by row, by id.
+        """
+        body = self.to_dict()
+        snapshot = self._snapshot
+        if self.id is None or snapshot is None:
+            return body
+        changed = {}
+        for key, value in body.items():
+            if key in rows and isinstance(value, list):
+                if value := _changed_rows(value, snapshot.rows.get(key, {})):
+                    changed[key] = value
+            elif snapshot.fields.get(key) != _digest(value):
+                changed[key] = value
+        return changed
+
+    def _assign(self, other: Self) -> None:
+        """Take over copies of all field values of ``other``, of this class.
+
+        Nested values are copied so both models can be edited independently.
+        """
         for key in self.__class__.model_fields:
-            object.__setattr__(self, key, getattr(validated, key))
+            object.__setattr__(self, key, copy.deepcopy(getattr(other, key)))
+        self._snapshot = other._snapshot
+
+    def update(self, data: dict[str, Any]) -> None:
+        update_fields(self, data)
+
+
+# A record version: an int, or a string the API sent that is not a number.
+Version = int | str
+
+
+def _normalize_version(value: Any) -> Version | None:
+    """A record version as compared locally, None if there is none.
+
+    Versions are ints, but some resources send them as strings; numeric ones
+    become ints, so "9" and "10" compare like 9 and 10. Other strings are
+    kept as they are.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+@dataclass(frozen=True)
+class SyncDiff:
+    """Remote changes compared to a set of locally known versions."""
+
+    # Ids that are new or have a different version remotely.
+    changed: list[int]
+    # Ids that are known locally but no longer exist remotely.
+    deleted: list[int]
+    # The remote version of every id.
+    versions: dict[int, Version]
+
+
+@dataclass
+class FetchResult(Generic[M]):
+    """Records loaded by id, in the order the ids were requested."""
+
+    records: dict[int, M] = field(default_factory=dict)
+    # Requested ids the API did not return, e.g. because they were deleted.
+    missing: list[int] = field(default_factory=list)
+
+    @classmethod
+    def collect(cls, ids: list[int], found: Iterable[M]) -> "FetchResult[M]":
+        by_id = {record.id: record for record in found}
+        return cls(
+            records={id: by_id[id] for id in ids if id in by_id},
+            missing=[id for id in ids if id not in by_id],
+        )
+
+
+def _unique_ids(ids: Iterable[int | str]) -> list[int]:
+    return list(dict.fromkeys(int(id) for id in ids))
+
+
+def _find_or_none(cls: type[L], id: int) -> L | None:
+    try:
+        return cls.find_by_id(id)
+    except MoneybirdNotFoundError:
+        return None
 
 
 class Loadable(MoneybirdModel):
-    """Mixin that adds read capabilities (load, find_by_id)."""
+    """Mixin that adds read capabilities (load, find_by_id, find_many)."""
 
     def load(self, id: int) -> None:
+        if (loaded := _from_session(type(self), id)) is not None:
+            if loaded is not self:
+                self._assign(loaded)
+            return
         data = http_get(f"{self.endpoint}s/{id}")
-        self.update(data)
+        self._update_from_response(data)
+        _remember(self)
 
     @classmethod
     def find_by_id(cls: type[Self], id: int) -> Self:
+        if (loaded := _from_session(cls, id)) is not None:
+            return loaded
         entity = cls(id=id)
         entity.load(id)
         return entity
 
+    async def aload(self, id: int) -> None:
+        data = await ahttp_get(f"{self.endpoint}s/{id}")
+        self._update_from_response(data)
+
+    @classmethod
+    async def afind_by_id(cls: type[Self], id: int) -> Self:
+        entity = cls(id=id)
+        await entity.aload(id)
+        return entity
+
+    @classmethod
+    def find_many(
+        cls: type[Self], ids: Iterable[int], max_workers: int = 4
+    ) -> FetchResult[Self]:
+        """Load records by id with up to ``max_workers`` concurrent GETs.
+
+        Ids that do not exist are listed in ``missing`` instead of raising.
+        Synchronizable models override this with the bulk endpoint.
+        """
+        unique = _unique_ids(ids)
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            # Each worker runs in a copy of our context to use the bound client.
+            futures = [
+                executor.submit(contextvars.copy_context().run, _find_or_none, cls, id)
+                for id in unique
+            ]
+            found = [future.result() for future in futures]
+        return FetchResult.collect(unique, filter(None, found))
+
+    @classmethod
+    async def afind_many(
+        cls: type[Self], ids: Iterable[int], max_workers: int = 4
+    ) -> FetchResult[Self]:
+        """Async counterpart of find_many."""
+        unique = _unique_ids(ids)
+        semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+        async def find(id: int) -> Self | None:
+            async with semaphore:
+                try:
+                    return await cls.afind_by_id(id)
+                except MoneybirdNotFoundError:
+                    return None
+
+        found = await asyncio.gather(*(find(id) for id in unique))
+        return FetchResult.collect(unique, filter(None, found))
+
 
 class Saveable(MoneybirdModel):
     """Mixin that adds create/update capabilities (save, update_by_id)."""
 
+    def _save_body(self) -> dict[str, Any]:
+        return self._changed_dict()
+
+    def payload_size(self) -> int:
+        """Size in bytes of the JSON body the next save() sends.
+
+        Creates send every field; updates only the fields changed since the
+        record was loaded or saved.
+        """
+        return len(get_json_codec().dumps({self.endpoint: self._save_body()}))
+
     def save(self) -> None:
         if self.id is None:
             data = http_post(
                 f"{self.endpoint}s",
-                data={self.endpoint: self.to_dict()},
+                data={self.endpoint: self._save_body()},
             )
-            self.update(data)
+            self._update_from_response(data)
         else:
             data = http_patch(
                 f"{self.endpoint}s/{self.id}",
-                data={self.endpoint: self.to_dict()},
+                data={self.endpoint: self._save_body()},
             )
-            self.update(data)
+            self._update_from_response(data)
+
+    async def asave(self) -> None:
+        if self.id is None:
+            data = await ahttp_post(
+                f"{self.endpoint}s",
+                data={self.endpoint: self._save_body()},
+            )
+        else:
+            data = await ahttp_patch(
+                f"{self.endpoint}s/{self.id}",
+                data={self.endpoint: self._save_body()},
+            )
+        self._update_from_response(data)
 
     @classmethod
     def update_by_id(cls: type[Self], id: int, data: dict[str, Any]) -> Self:
@@ -89,6 +793,12 @@ class Deletable(MoneybirdModel):
         http_delete(f"{self.endpoint}s/{self.id}")
         self.id = None
 
+    async def adelete(self) -> None:
+        if not self.id:
+            raise ValueError(f"Cannot delete {self.__class__.__name__} without an id")
+        await ahttp_delete(f"{self.endpoint}s/{self.id}")
+        self.id = None
+
     @classmethod
     def delete_by_id(cls: type[Self], id: int) -> Self:
         entity = cls(id=id)
@@ -111,21 +821,161 @@ class Synchronizable(MoneybirdModel):
             params["filter"] = filter
         return paginate(f"{cls._sync_endpoint()}s/synchronization", params=params or None)
 
+    @classmethod
+    def sync_diff(
+        cls: type[Self], known: Mapping[int, Version], filter: str | None = None
+    ) -> SyncDiff:
+        """Compare locally ``known`` versions (id -> version) with the API.
+
+        Only the id and version list is requested; pass ``diff.changed`` to
+        sync_fetch to download the records that need updating.
+        """
+        versions = {
+            int(item["id"]): _normalize_version(item["version"]) or 0
+            for item in cls.sync_list(filter)
+        }
+        return SyncDiff(
+            changed=[
+                id
+                for id, ver in versions.items()
+                if _normalize_version(known.get(id)) != ver
+            ],
+            deleted=[id for id in known if id not in versions],
+            versions=versions,
+        )
+
     @classmethod
     def sync_fetch(cls: type[Self], ids: list[int]) -> list[Self]:
         """Fetch full records by IDs (max 100 per request).
 
         Use sync_list() first to get IDs, then fetch changed records in bulk.
+        Inside a session, records it already holds are returned from it.
         """
-        if len(ids) > 100:
+        return cls._sync_fetch(ids, use_session=True)
+
+    @classmethod
+    def _sync_fetch(
+        cls: type[Self], ids: list[int], use_session: bool = False
+    ) -> list[Self]:
+        """Fetch records by id, from the API unless ``use_session`` is set.
+
+        Fetched records replace the entries of the active session.
+        """
+        if len(ids) > SYNC_FETCH_LIMIT:
             raise ValueError("sync_fetch supports a maximum of 100 IDs per request")
+        loaded: list[Self] = []
+        if use_session and current_session() is not None:
+            # Only fetch the records the session does not hold yet.
+            missing = []
+            for id in ids:
+                if (model := _from_session(cls, id)) is not None:
+                    loaded.append(model)
+                else:
+                    missing.append(id)
+            if not missing:
+                return loaded
+            ids = missing
         data = http_post(
             f"{cls._sync_endpoint()}s/synchronization",
             data={"ids": ids},
         )
+        if not isinstance(data, list):
+            return loaded
+        records = cls._validate_list(data)
+        for record in records:
+            _remember(record)
+        return loaded + records
+
+    @classmethod
+    def sync_fetch_all(
+        cls: type[Self], ids: Iterable[int], max_workers: int = 4
+    ) -> FetchResult[Self]:
+        """Fetch any number of records by id, 100 per request.
+
+        Up to ``max_workers`` requests run at the same time. Duplicate ids are
+        fetched once; ids the API did not return are listed in ``missing``.
+        """
+        unique = _unique_ids(ids)
+        batches = [
+            unique[start : start + SYNC_FETCH_LIMIT]
+            for start in range(0, len(unique), SYNC_FETCH_LIMIT)
+        ]
+        if len(batches) <= 1 or max_workers <= 1:
+            fetched = (record for batch in batches for record in cls._sync_fetch(batch))
+            return FetchResult.collect(unique, fetched)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            # Each worker runs in a copy of our context to use the bound client.
+            futures = [
+                executor.submit(contextvars.copy_context().run, cls._sync_fetch, batch)
+                for batch in batches
+            ]
+            return FetchResult.collect(
+                unique, (record for future in futures for record in future.result())
+            )
+
+    @classmethod
+    def find_many(
+        cls: type[Self], ids: Iterable[int], max_workers: int = 4
+    ) -> FetchResult[Self]:
+        """Load records by id, 100 per request through the synchronization API.
+
+        Ids that do not exist are listed in ``missing`` instead of raising.
+        """
+        return cls.sync_fetch_all(ids, max_workers=max_workers)
+
+    @classmethod
+    async def async_sync_list(
+        cls: type[Self], filter: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Async counterpart of sync_list."""
+        params: dict[str, str] = {}
+        if filter:
+            params["filter"] = filter
+        return await apaginate(
+            f"{cls._sync_endpoint()}s/synchronization", params=params or None
+        )
+
+    @classmethod
+    async def async_sync_fetch(cls: type[Self], ids: list[int]) -> list[Self]:
+        """Async counterpart of sync_fetch."""
+        if len(ids) > SYNC_FETCH_LIMIT:
+            raise ValueError("sync_fetch supports a maximum of 100 IDs per request")
+        data = await ahttp_post(
+            f"{cls._sync_endpoint()}s/synchronization",
+            data={"ids": ids},
+        )
         if not isinstance(data, list):
             return []
-        return [cls(**item) for item in data]
+        return cls._validate_list(data)
+
+    @classmethod
+    async def async_sync_fetch_all(
+        cls: type[Self], ids: Iterable[int], max_workers: int = 4
+    ) -> FetchResult[Self]:
+        """Async counterpart of sync_fetch_all."""
+        unique = _unique_ids(ids)
+        semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+        async def fetch(batch: list[int]) -> list[Self]:
+            async with semaphore:
+                return await cls.async_sync_fetch(batch)
+
+        batches: list[list[Self]] = await asyncio.gather(
+            *(
+                fetch(unique[start : start + SYNC_FETCH_LIMIT])
+                for start in range(0, len(unique), SYNC_FETCH_LIMIT)
+            )
+        )
+        return FetchResult.collect(
+            unique, (record for batch in batches for record in batch)
+        )
+
+    @classmethod
+    async def afind_many(
+        cls: type[Self], ids: Iterable[int], max_workers: int = 4
+    ) -> FetchResult[Self]:
+        """Async counterpart of find_many."""
+        return await cls.async_sync_fetch_all(ids, max_workers=max_workers)
 
     @classmethod
     def _sync_endpoint(cls) -> str:
@@ -138,5 +988,82 @@ class Synchronizable(MoneybirdModel):
         ).lstrip("_")
 
 
+@dataclass
+class RefreshResult(Generic[M]):
+    """Outcome of refresh_stale."""
+
+    # Models that were out of date and have been updated in place.
+    refreshed: list[M] = field(default_factory=list)
+    # Models whose record no longer exists in Moneybird; left untouched.
+    deleted: list[M] = field(default_factory=list)
+
+
+def refresh_stale(models: Iterable[S], max_workers: int = 4) -> RefreshResult[S]:
+    """Bring in-memory models up to date, fetching only the changed ones.
+
+    Per model class (and client), one sync_list call returns the current
+    version of every record; the synchronization API has no id filter. Models
+    whose ``version`` differs are re-fetched in bulk with sync_fetch_all and
+    updated in place.
+    """
+    groups: dict[tuple[type[S], MoneybirdClient | None], dict[int, list[S]]] = {}
+    for model in models:
+        if model.id is not None:
+            key = (type(model), model._client)
+            groups.setdefault(key, {}).setdefault(model.id, []).append(model)
+
+    result: RefreshResult[S] = RefreshResult()
+    for (cls, client), by_id in groups.items():
+        with client.bind() if client else contextlib.nullcontext():
+            remote = {
+                int(item["id"]): _normalize_version(item["version"])
+                for item in cls.sync_list()
+            }
+            stale = [
+                id
+                for id, group in by_id.items()
+                if id in remote
+                and any(_version(model) != remote[id] for model in group)
+            ]
+            fetched = cls.sync_fetch_all(stale, max_workers=max_workers)
+        for id, fresh in fetched.records.items():
+            for model in by_id[id]:
+                if _version(model) != remote[id]:
+                    model._assign(fresh)
+                    result.refreshed.append(model)
+        for id in [*(id for id in by_id if id not in remote), *fetched.missing]:
+            result.deleted.extend(by_id[id])
+    return result
+
+
+def _version(model: MoneybirdModel) -> Version | None:
+    return _normalize_version(getattr(model, "version", None))
+
+
 class CrudModel(Loadable, Saveable, Deletable, MoneybirdModel):
     """Full CRUD model with load, save, and delete capabilities."""
+
+
+class BoundModel(Generic[M]):
+    """A model class bound to a client, as returned by ``client.SalesInvoice``.
+
+    Calling the bound model creates an instance bound to the client; class
+    methods run against the client.
+    """
+
+    def __init__(self, client: MoneybirdClient, model_cls: type[M]) -> None:
+        self._client = client
+        self._model_cls = model_cls
+
+    def __repr__(self) -> str:
+        return f"<{self._model_cls.__name__} bound to {self._client!r}>"
+
+    def __call__(self, *args: Any, **kwargs: Any) -> M:
+        with self._client.bind():
+            return self._model_cls(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._model_cls, name)
+        if isinstance(attr, type) or not callable(attr):
+            return attr
+        return _with_client(attr, lambda args, kwargs: self._client)
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket that paces requests to a budget.
+
+    Moneybird allows 150 requests per 5 minutes per administration, which is
+    the default budget. Each request takes one token; tokens refill at a
+    constant rate up to ``burst``. Callers reserve their token under a lock and
+    then wait outside of it, so concurrent threads (or tasks, via ``aacquire``)
+    are spread out evenly instead of all firing and stalling together.
+
+    When the API still answers 429, ``penalize`` empties the bucket until the
+    reset time from the Retry-After header, after which requests resume at the
+    sustained rate rather than in a burst.
+    """
+
+    def __init__(
+        self,
+        requests: int = 150,
+        period: float = 300.0,
+        burst: int | None = None,
+    ) -> None:
+        if requests <= 0 or period <= 0:
+            raise ValueError("requests and period must be positive")
+        self.rate = requests / period
+        self.capacity = float(burst if burst is not None else requests)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+            self._tokens -= 1
+            wait = self._updated - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return max(wait, 0.0)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def penalize(self, delay: float) -> None:
+        """Empty the bucket until ``delay`` seconds from now (e.g. after a 429)."""
+        with self._lock:
+            self._updated = max(time.monotonic() + delay, self._updated)
+            self._tokens = min(self._tokens, 0.0)
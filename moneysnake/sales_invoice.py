@@ -1,10 +1,31 @@
-from typing import Any, Self
+import os
+from collections.abc import Iterator, Sequence
+from typing import Any, BinaryIO, Self
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
-from .client import http_delete, http_get, http_get_raw, http_patch, http_post, paginate
+from .client import (
+    ahttp_patch,
+    ahttp_post,
+    apaginate,
+    http_delete,
+    http_download,
+    http_get,
+    http_get_raw,
+    http_iter_bytes,
+    http_patch,
+    http_post,
+    iter_pages,
+    paginate,
+)
 from .custom_field_model import CustomFieldModel
-from .model import Synchronizable, ensure_list_of
+from .index import indexed_lookup
+from .model import (
+    Synchronizable,
+    filter_params,
+    none_as_empty_list,
+    update_fields,
+)
 from .payment import Payment
 
 
@@ -24,9 +45,7 @@ class SalesInvoiceDetailsAttribute(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
     def update(self, data: dict[str, Any]) -> None:
-        validated = self.model_validate({**self.model_dump(), **data})
-        for key in self.__class__.model_fields:
-            object.__setattr__(self, key, getattr(validated, key))
+        update_fields(self, data)
 
 
 class SalesInvoice(Synchronizable, CustomFieldModel):
@@ -84,33 +103,25 @@ class SalesInvoice(Synchronizable, CustomFieldModel):
 
     _destroyed_detail_ids: list[int] = PrivateAttr(default_factory=list)
 
-    @field_validator("payments")
-    def ensure_payments(
-        cls, value: list[dict[str, Any]] | list[Payment] | None
-    ) -> list[Payment]:
-        if value is None:
-            return []
-        return ensure_list_of(Payment, value)
-
-    @field_validator("details")
-    def ensure_details(
-        cls,
-        value: list[dict[str, Any]] | list[SalesInvoiceDetailsAttribute] | None,
-    ) -> list[SalesInvoiceDetailsAttribute]:
-        if value is None:
-            return []
-        return ensure_list_of(SalesInvoiceDetailsAttribute, value)
-
-    def save(self) -> None:
-        """Save the sales invoice."""
-        invoice_data = self.to_dict()
-        details = invoice_data.pop("details", [])
-        for detail_id in self._destroyed_detail_ids:
-            details.append({"id": detail_id, "_destroy": True})
-        invoice_data["details_attributes"] = details
+    @field_validator("details", "payments", mode="before")
+    @classmethod
+    def ensure_lists(cls, value: Any) -> Any:
+        return none_as_empty_list(value)
+
+    def _save_body(self) -> dict[str, Any]:
+        invoice_data = self._changed_dict(rows=("details", "custom_fields"))
+        if "details" in invoice_data or self._destroyed_detail_ids:
+            details = invoice_data.pop("details", [])
+            for detail_id in self._destroyed_detail_ids:
+                details.append({"id": detail_id, "_destroy": True})
+            invoice_data["details_attributes"] = details
         if "custom_fields" in invoice_data:
             invoice_data["custom_fields_attributes"] = invoice_data.pop("custom_fields")
+        return invoice_data
 
+    def save(self) -> None:
+        """Save the sales invoice."""
+        invoice_data = self._save_body()
         if self.id is None:
             data = http_post(
                 f"{self.endpoint}s",
@@ -122,7 +133,23 @@ class SalesInvoice(Synchronizable, CustomFieldModel):
                 data={self.endpoint: invoice_data},
             )
         self._destroyed_detail_ids.clear()
-        self.update(data)
+        self._update_from_response(data)
+
+    async def asave(self) -> None:
+        """Async counterpart of save."""
+        invoice_data = self._save_body()
+        if self.id is None:
+            data = await ahttp_post(
+                f"{self.endpoint}s",
+                data={self.endpoint: invoice_data},
+            )
+        else:
+            data = await ahttp_patch(
+                f"{self.endpoint}s/{self.id}",
+                data={self.endpoint: invoice_data},
+            )
+        self._destroyed_detail_ids.clear()
+        self._update_from_response(data)
 
     # --- Detail management ---
 
@@ -195,7 +222,7 @@ class SalesInvoice(Synchronizable, CustomFieldModel):
             f"{self.endpoint}s/{self.id}/send_invoice",
             data={"sales_invoice_sending": body} if body else None,
         )
-        self.update(data)
+        self._update_from_response(data)
 
     def download_pdf(self) -> bytes:
         """Download the invoice PDF. Returns raw PDF bytes."""
@@ -207,25 +234,45 @@ class SalesInvoice(Synchronizable, CustomFieldModel):
         response = http_get_raw(f"{self.endpoint}s/{self.id}/download_ubl")
         return response.content
 
+    def download_pdf_to(self, destination: str | os.PathLike[str] | BinaryIO) -> int:
+        """Stream the invoice PDF to a path or binary file. Returns the size."""
+        return http_download(f"{self.endpoint}s/{self.id}/download_pdf", destination)
+
+    def download_ubl_to(self, destination: str | os.PathLike[str] | BinaryIO) -> int:
+        """Stream the invoice UBL to a path or binary file. Returns the size."""
+        return http_download(f"{self.endpoint}s/{self.id}/download_ubl", destination)
+
+    def iter_pdf(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield the invoice PDF in chunks."""
+        yield from http_iter_bytes(
+            f"{self.endpoint}s/{self.id}/download_pdf", chunk_size
+        )
+
+    def iter_ubl(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield the invoice UBL in chunks."""
+        yield from http_iter_bytes(
+            f"{self.endpoint}s/{self.id}/download_ubl", chunk_size
+        )
+
     def pause(self) -> None:
         """Pause workflow reminders for this invoice."""
         data = http_post(f"{self.endpoint}s/{self.id}/pause")
-        self.update(data)
+        self._update_from_response(data)
 
     def resume(self) -> None:
         """Resume workflow reminders for this invoice."""
         data = http_post(f"{self.endpoint}s/{self.id}/resume")
-        self.update(data)
+        self._update_from_response(data)
 
     def mark_as_dubious(self) -> None:
         """Mark the invoice as dubious."""
         data = http_patch(f"{self.endpoint}s/{self.id}/mark_as_dubious")
-        self.update(data)
+        self._update_from_response(data)
 
     def mark_as_uncollectible(self) -> None:
         """Mark the invoice as uncollectible."""
         data = http_patch(f"{self.endpoint}s/{self.id}/mark_as_uncollectible")
-        self.update(data)
+        self._update_from_response(data)
 
     def register_payment(self, payment: Payment) -> None:
         """Register a payment via the register_payment endpoint."""
@@ -233,7 +280,7 @@ class SalesInvoice(Synchronizable, CustomFieldModel):
             f"{self.endpoint}s/{self.id}/register_payment",
             data={"payment": payment.to_dict()},
         )
-        self.update(data)
+        self._update_from_response(data)
 
     def duplicate_creditinvoice(self) -> "SalesInvoice":
         """Create a credit invoice for this invoice."""
@@ -251,31 +298,134 @@ class SalesInvoice(Synchronizable, CustomFieldModel):
         reference: str | None = None,
     ) -> list[Self]:
         """List sales invoices with optional filters."""
-        filter_parts: list[str] = []
-        if state:
-            filter_parts.append(f"state:{state}")
-        if period:
-            filter_parts.append(f"period:{period}")
-        if contact_id:
-            filter_parts.append(f"contact_id:{contact_id}")
-        if reference:
-            filter_parts.append(f"reference:{reference}")
-
-        params: dict[str, str] = {}
-        if filter_parts:
-            params["filter"] = ",".join(filter_parts)
-
-        data = paginate("sales_invoices", params=params or None)
-        return [cls(**item) for item in data]
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        data = paginate("sales_invoices", params=params, decode=cls._validate_page)
+        return cls._validate_list(data)
+
+    @classmethod
+    async def alist_all(
+        cls,
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+    ) -> list[Self]:
+        """Async counterpart of list_all."""
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        data = await apaginate(
+            "sales_invoices", params=params, decode=cls._validate_page
+        )
+        return cls._validate_list(data)
+
+    @classmethod
+    def iter_all(
+        cls,
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+        concurrency: int = 1,
+    ) -> Iterator[Self]:
+        """Like list_all, but yields invoices one at a time as pages arrive."""
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        for items in iter_pages(
+            "sales_invoices",
+            params,
+            concurrency=concurrency,
+            decode=cls._validate_page,
+        ):
+            yield from items
+
+    @classmethod
+    def list_rows(
+        cls,
+        fields: Sequence[str],
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """Like list_all, but as read-only named tuples of just ``fields``.
+
+        For reports over many invoices: a row takes a fraction of the memory
+        of a full model.
+        """
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        decode = cls._row_decoder(fields)
+        data = paginate("sales_invoices", params=params, decode=decode)
+        return cls._project_list(data, fields)
+
+    @classmethod
+    async def alist_rows(
+        cls,
+        fields: Sequence[str],
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """Async counterpart of list_rows."""
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        decode = cls._row_decoder(fields)
+        data = await apaginate("sales_invoices", params=params, decode=decode)
+        return cls._project_list(data, fields)
+
+    @classmethod
+    def iter_rows(
+        cls,
+        fields: Sequence[str],
+        state: str | None = None,
+        period: str | None = None,
+        contact_id: int | None = None,
+        reference: str | None = None,
+        concurrency: int = 1,
+    ) -> Iterator[tuple[Any, ...]]:
+        """Like list_rows, but yields rows one at a time as pages arrive."""
+        params = filter_params(
+            state=state, period=period, contact_id=contact_id, reference=reference
+        )
+        decode = cls._row_decoder(fields)
+        for items in iter_pages(
+            "sales_invoices", params, concurrency=concurrency, decode=decode
+        ):
+            yield from cls._project_list(items, fields)
 
     @classmethod
     def find_by_invoice_id(cls, invoice_id: str) -> Self:
-        """Find a sales invoice by its invoice_id (e.g. '2026-0001')."""
-        data = http_get(f"sales_invoices/find_by_invoice_id/{invoice_id}")
-        return cls(**data)
+        """Find a sales invoice by its invoice_id (e.g. '2026-0001').
+
+        Served from memory if a LookupIndex on invoice_id is registered.
+        """
+        return indexed_lookup(
+            cls,
+            "invoice_id",
+            invoice_id,
+            lambda: cls._from_response(
+                http_get(f"sales_invoices/find_by_invoice_id/{invoice_id}")
+            )._mark_clean(),
+        )
 
     @classmethod
     def find_by_reference(cls, reference: str) -> Self:
-        """Find a sales invoice by its reference."""
-        data = http_get(f"sales_invoices/find_by_reference/{reference}")
-        return cls(**data)
+        """Find a sales invoice by its reference.
+
+        Served from memory if a LookupIndex on reference is registered.
+        """
+        return indexed_lookup(
+            cls,
+            "reference",
+            reference,
+            lambda: cls._from_response(
+                http_get(f"sales_invoices/find_by_reference/{reference}")
+            )._mark_clean(),
+        )
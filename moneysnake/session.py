@@ -0,0 +1,191 @@
+import contextvars
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Literal, Self, TypeVar
+
+from .client import bound_client
+
+if TYPE_CHECKING:
+    from .model import MoneybirdModel
+
+M = TypeVar("M", bound="MoneybirdModel")
+
+WriteOperation = Literal["save", "delete"]
+
+
+class Session:
+    """Identity map and unit of work for models, active within a ``with`` block.
+
+    Inside the block, ``find_by_id``, ``load`` and ``sync_fetch`` return the
+    instance already loaded for a (class, id) instead of going to the API, so
+    looking up the same contact once per invoice line costs one request. At
+    most ``max_size`` models are kept, least recently used ones are dropped.
+
+    With ``defer_writes`` (the default) ``save()`` and ``delete()`` are queued
+    instead of sent, and ``commit()`` sends them with up to ``max_workers``
+    requests at a time. Leaving the block commits; an exception discards the
+    queue instead. Queued writes run concurrently and in no particular order,
+    so use ``max_workers=1`` when one write depends on another::
+
+        with Session() as session:
+            for line in lines:
+                contact = Contact.find_by_id(line.contact_id)  # cached
+                contact.city = line.city
+                contact.save()  # queued, saved once at the end
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        defer_writes: bool = True,
+        max_workers: int = 4,
+    ) -> None:
+        self.max_size = max_size
+        self.defer_writes = defer_writes
+        self.max_workers = max_workers
+        self.hits = 0
+        self.misses = 0
+        self._models: OrderedDict[Hashable, MoneybirdModel] = OrderedDict()
+        self._pending: dict[int, tuple[WriteOperation, MoneybirdModel]] = {}
+        self._lock = threading.Lock()
+        self._token: contextvars.Token[Session | None] | None = None
+
+    def __enter__(self) -> Self:
+        self._token = _active_session.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        assert self._token is not None
+        _active_session.reset(self._token)
+        self._token = None
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    @staticmethod
+    def _key(cls: type["MoneybirdModel"], client: Any, id: int) -> Hashable:
+        return cls, client, int(id)
+
+    def get(self, cls: type[M], id: int) -> M | None:
+        """The loaded instance of ``cls`` with ``id`` for the bound client."""
+        key = self._key(cls, bound_client(), id)
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._models.move_to_end(key)
+            return model  # type: ignore[return-value]
+
+    def add(self, model: "MoneybirdModel") -> None:
+        """Remember ``model`` as the instance for its class and id."""
+        if model.id is None:
+            return
+        key = self._key(type(model), model._client, model.id)
+        with self._lock:
+            self._models[key] = model
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+
+    def evict(self, model: "MoneybirdModel") -> None:
+        if model.id is None:
+            return
+        with self._lock:
+            self._models.pop(self._key(type(model), model._client, model.id), None)
+
+    def defers(self) -> bool:
+        """Whether writes should be queued rather than sent right now."""
+        return self.defer_writes and not _flushing.get()
+
+    def queue(self, operation: WriteOperation, model: "MoneybirdModel") -> None:
+        """Queue a save or delete; a delete replaces a pending save."""
+        with self._lock:
+            pending = self._pending.pop(id(model), None)
+            if pending is not None and pending[0] == "delete":
+                operation = "delete"
+            self._pending[id(model)] = (operation, model)
+
+    @property
+    def pending(self) -> list[tuple[WriteOperation, "MoneybirdModel"]]:
+        return list(self._pending.values())
+
+    def commit(self, max_workers: int | None = None) -> None:
+        """Send all queued writes, ``max_workers`` at a time.
+
+        Writes that fail stay queued; their errors are raised together in an
+        ExceptionGroup once all other writes have finished.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        with _flush(), ThreadPoolExecutor(
+            max_workers=max(max_workers or self.max_workers, 1)
+        ) as executor:
+            # Each worker runs in a copy of our context to use the bound client.
+            futures = {
+                key: executor.submit(
+                    contextvars.copy_context().run, self._run, operation, model
+                )
+                for key, (operation, model) in pending.items()
+            }
+        errors: list[Exception] = []
+        for key, future in futures.items():
+            if (error := future.exception()) is not None:
+                if not isinstance(error, Exception):
+                    raise error
+                errors.append(error)
+                with self._lock:
+                    self._pending.setdefault(key, pending[key])
+        if errors:
+            raise ExceptionGroup(f"{len(errors)} queued writes failed", errors)
+
+    def rollback(self) -> None:
+        """Discard all queued writes."""
+        with self._lock:
+            self._pending.clear()
+
+    def _run(self, operation: WriteOperation, model: "MoneybirdModel") -> None:
+        if operation == "delete":
+            self.evict(model)
+            model.delete()  # type: ignore[attr-defined]
+        else:
+            model.save()  # type: ignore[attr-defined]
+            self.add(model)
+
+
+_active_session: ContextVar[Session | None] = ContextVar(
+    "moneysnake_session", default=None
+)
+_flushing: ContextVar[bool] = ContextVar("moneysnake_flushing", default=False)
+
+
+@contextmanager
+def _flush() -> Iterator[None]:
+    token = _flushing.set(True)
+    try:
+        yield
+    finally:
+        _flushing.reset(token)
+
+
+def current_session() -> Session | None:
+    """The session active in this context, if any."""
+    return _active_session.get()
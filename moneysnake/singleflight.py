@@ -0,0 +1,62 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one.
+
+    The first thread to call ``do`` for a key runs the function; threads that
+    call ``do`` with that key while it runs wait for it and receive the same
+    result or exception. Once the call finished, the next one runs again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = Future()
+        if not leader:
+            return call.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            self._finish(key)
+            call.set_exception(exc)
+            raise
+        self._finish(key)
+        call.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """asyncio counterpart of SingleFlight, coalescing calls per event loop.
+
+    The function runs in a task of its own, so cancelling any caller, the
+    first one included, does not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[tuple[int, Hashable], asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        loop_key = (id(asyncio.get_running_loop()), key)
+        call = self._calls.get(loop_key)
+        if call is None:
+            call = self._calls[loop_key] = asyncio.ensure_future(func())
+            call.add_done_callback(lambda _: self._calls.pop(loop_key, None))
+        return await asyncio.shield(call)
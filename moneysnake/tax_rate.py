@@ -1,6 +1,11 @@
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Self
 
-from .client import paginate
+from .client import current_client, iter_pages, paginate
 from .model import Loadable, MoneybirdModel
 
 
@@ -24,24 +29,165 @@ class TaxRate(Loadable, MoneybirdModel):
         """
         List all available tax rates for the administration.
         """
-        data = paginate("tax_rates")
-        return [cls(**rate) for rate in data]
+        if tax_rate_registry_ is not None:
+            return tax_rate_registry_.rates()  # type: ignore[return-value]
+        data = paginate("tax_rates", decode=cls._validate_page)
+        return cls._validate_list(data)
+
+    @classmethod
+    def iter_all_rates(cls) -> Iterator[Self]:
+        """
+        Like list_all_rates, but yields tax rates one at a time.
+        """
+        for rates in iter_pages("tax_rates", decode=cls._validate_page):
+            yield from rates
 
     @classmethod
     def list_sales_rates(cls) -> list[Self]:
         """
         List all sales tax rates.
         """
-        data = paginate("tax_rates", params={"filter": "tax_rate_type:sales_invoice"})
-        return [cls(**rate) for rate in data]
+        if tax_rate_registry_ is not None:
+            return tax_rate_registry_.find(  # type: ignore[return-value]
+                tax_rate_type="sales_invoice"
+            )
+        data = paginate(
+            "tax_rates",
+            params={"filter": "tax_rate_type:sales_invoice"},
+            decode=cls._validate_page,
+        )
+        return cls._validate_list(data)
 
     @classmethod
     def find_sales_rate_by_country(cls, country: str) -> list[Self]:
         """
         Find sales tax rates by country.
         """
+        if tax_rate_registry_ is not None:
+            return tax_rate_registry_.find(  # type: ignore[return-value]
+                country=country, tax_rate_type="sales_invoice"
+            )
         data = paginate(
             "tax_rates",
             params={"filter": f"country:{country},tax_rate_type:sales_invoice"},
+            decode=cls._validate_page,
+        )
+        return cls._validate_list(data)
+
+
+@dataclass
+class _TaxRateIndex:
+    rates: list[TaxRate]
+    loaded_at: float
+    by_id: dict[int, TaxRate] = field(init=False)
+    by_country: dict[str | None, list[TaxRate]] = field(init=False)
+    by_type: dict[str | None, list[TaxRate]] = field(init=False)
+    by_percentage: dict[float | None, list[TaxRate]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.by_id = {rate.id: rate for rate in self.rates if rate.id is not None}
+        self.by_country = defaultdict(list)
+        self.by_type = defaultdict(list)
+        self.by_percentage = defaultdict(list)
+        for rate in self.rates:
+            self.by_country[rate.country].append(rate)
+            self.by_type[rate.tax_rate_type].append(rate)
+            self.by_percentage[rate.percentage].append(rate)
+
+
+class TaxRateRegistry:
+    """All tax rates of an administration, loaded once and indexed.
+
+    Rates are indexed by id, country, ``tax_rate_type`` and percentage and
+    reloaded when they are older than ``ttl`` seconds (None never expires)
+    or on ``refresh()``. Each administration gets its own set of rates.
+    Enable it with ``set_tax_rate_registry`` to serve ``TaxRate.list_*`` and
+    ``find_sales_rate_by_country`` from memory. The returned TaxRate objects
+    are shared, so treat them as read-only.
+    """
+
+    def __init__(self, ttl: float | None = 3600.0) -> None:
+        self.ttl = ttl
+        self._indexes: dict[int, _TaxRateIndex] = {}
+        # One lock per administration so only one thread loads its rates,
+        # without blocking lookups for other administrations meanwhile.
+        self._loading: dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _index(self) -> _TaxRateIndex:
+        admin_id = current_client().admin_id
+        with self._lock:
+            index = self._indexes.get(admin_id)
+            if index is not None and not self._expired(index):
+                return index
+            loading = self._loading.setdefault(admin_id, threading.Lock())
+        with loading:
+            # Another thread may have loaded the rates while we waited.
+            with self._lock:
+                index = self._indexes.get(admin_id)
+            if index is None or self._expired(index):
+                index = self._load()
+                with self._lock:
+                    self._indexes[admin_id] = index
+            return index
+
+    def _expired(self, index: _TaxRateIndex) -> bool:
+        return self.ttl is not None and time.monotonic() - index.loaded_at > self.ttl
+
+    def _load(self) -> _TaxRateIndex:
+        rates = TaxRate._validate_list(
+            paginate("tax_rates", decode=TaxRate._validate_page)
         )
-        return [cls(**rate) for rate in data]
+        return _TaxRateIndex(rates, loaded_at=time.monotonic())
+
+    def refresh(self) -> None:
+        """Reload the rates of the bound administration now."""
+        admin_id = current_client().admin_id
+        index = self._load()
+        with self._lock:
+            self._indexes[admin_id] = index
+
+    def clear(self) -> None:
+        """Forget the rates of all administrations."""
+        with self._lock:
+            self._indexes.clear()
+
+    def rates(self) -> list[TaxRate]:
+        return list(self._index().rates)
+
+    def get(self, id: int) -> TaxRate | None:
+        return self._index().by_id.get(int(id))
+
+    def find(
+        self,
+        country: str | None = None,
+        tax_rate_type: str | None = None,
+        percentage: float | None = None,
+    ) -> list[TaxRate]:
+        """Rates matching all given criteria, in the order the API lists them."""
+        index = self._index()
+        # Start from the smallest matching index bucket, then check the rest.
+        buckets = []
+        if country is not None:
+            buckets.append(index.by_country.get(country, []))
+        if tax_rate_type is not None:
+            buckets.append(index.by_type.get(tax_rate_type, []))
+        if percentage is not None:
+            buckets.append(index.by_percentage.get(percentage, []))
+        rates = min(buckets, key=len) if buckets else index.rates
+        return [
+            rate
+            for rate in rates
+            if (country is None or rate.country == country)
+            and (tax_rate_type is None or rate.tax_rate_type == tax_rate_type)
+            and (percentage is None or rate.percentage == percentage)
+        ]
+
+
+tax_rate_registry_: TaxRateRegistry | None = None
+
+
+def set_tax_rate_registry(registry: TaxRateRegistry | None) -> None:
+    """Serve TaxRate lookups from ``registry``; None queries the API again."""
+    global tax_rate_registry_
+    tax_rate_registry_ = registry
@@ -0,0 +1,206 @@
+import hmac
+from collections.abc import Iterable, Mapping
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import ValidationError
+
+from .cache import ResponseCache
+from .client import MoneybirdClient, _full_path, current_client
+from .codec import get_json_codec
+from .contact import Contact
+from .exceptions import MoneybirdWebhookError
+from .external_sales_invoice import ExternalSalesInvoice
+from .financial_mutation import FinancialMutation
+from .index import registered_indexes
+from .mirror import Mirror
+from .model import Synchronizable, _normalize_version
+from .purchase_invoice import PurchaseInvoice
+from .receipt import Receipt
+from .sales_invoice import SalesInvoice
+from .session import current_session
+
+# Webhook entity types, and the document types of "Document" entities.
+WEBHOOK_MODELS: dict[str, type[Synchronizable]] = {
+    "Contact": Contact,
+    "SalesInvoice": SalesInvoice,
+    "ExternalSalesInvoice": ExternalSalesInvoice,
+    "FinancialMutation": FinancialMutation,
+    "PurchaseInvoice": PurchaseInvoice,
+    "Receipt": Receipt,
+}
+
+_DELETE_ACTIONS = ("_destroyed", "_deleted")
+
+
+@dataclass(frozen=True)
+class WebhookEvent:
+    """A verified webhook notification."""
+
+    action: str
+    administration_id: int | None
+    entity_type: str | None
+    entity_id: int | None
+    # The model class of the entity, None for entity types we do not map.
+    model: type[Synchronizable] | None
+    # The entity as sent in the payload, None if there was none.
+    record: Synchronizable | None
+    deleted: bool
+    payload: dict[str, Any] = field(repr=False)
+
+
+class WebhookHandler:
+    """Verifies Moneybird webhook payloads and applies them to local state.
+
+    The handler is framework-agnostic: pass it the raw request body and
+    answer the request with a 200 once it returns::
+
+        handler = WebhookHandler(webhook.token, mirrors=[mirror])
+
+        @app.post("/moneybird")
+        def moneybird(request):
+            handler.handle(request.body)
+            return Response(status=200)
+
+    The ``webhook_token`` in the payload must match ``token``, the token
+    Moneybird returned when the webhook was created. A change to a contact,
+    invoice, financial mutation or document then
+
+    * drops the responses for that resource from the response cache,
+    * evicts the record from the active Session, which may hold unsaved
+      changes and so is not overwritten,
+    * updates or removes the record in the given mirrors and in the
+      registered LookupIndexes.
+
+    Events are applied for the administration of ``client`` or, without
+    one, of the client bound when ``handle`` is called.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        client: MoneybirdClient | None = None,
+        cache: ResponseCache | None = None,
+        mirrors: Iterable[Mirror] = (),
+    ) -> None:
+        self.token = token
+        self.client = client
+        self.cache = cache
+        self.mirrors = list(mirrors)
+
+    def __call__(self, body: bytes | str | Mapping[str, Any]) -> WebhookEvent:
+        return self.handle(body)
+
+    def handle(self, body: bytes | str | Mapping[str, Any]) -> WebhookEvent:
+        """Verify a webhook request body and apply it."""
+        payload = self.parse(body)
+        self.verify(payload)
+        with self.client.bind() if self.client else nullcontext():
+            event = self._event(payload)
+            self.apply(event)
+        return event
+
+    @staticmethod
+    def parse(body: bytes | str | Mapping[str, Any]) -> dict[str, Any]:
+        if isinstance(body, Mapping):
+            return dict(body)
+        if isinstance(body, str):
+            body = body.encode()
+        try:
+            payload = get_json_codec().loads(body)
+        except ValueError as exc:
+            raise MoneybirdWebhookError(f"Invalid webhook payload: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise MoneybirdWebhookError("Webhook payload is not a JSON object")
+        return payload
+
+    def verify(self, payload: Mapping[str, Any]) -> None:
+        """Raise MoneybirdWebhookError unless the payload has our token."""
+        token = payload.get("webhook_token")
+        if not isinstance(token, str) or not hmac.compare_digest(
+            token.encode(), self.token.encode()
+        ):
+            raise MoneybirdWebhookError("Webhook token does not match")
+
+    def apply(self, event: WebhookEvent) -> None:
+        """Update or evict the entity of ``event`` in all local state."""
+        if event.model is None or event.entity_id is None:
+            return
+        client = current_client()
+        cache = self.cache or client.cache
+        if cache is not None:
+            cache.invalidate(_full_path(client, f"{event.model._sync_endpoint()}s"))
+
+        session = current_session()
+        if session is not None:
+            session.evict(event.record or event.model(id=event.entity_id))
+
+        indexes = registered_indexes(event.model)
+        if event.deleted or event.record is None:
+            for index in indexes:
+                index.remove(event.entity_id)
+            for mirror in self.mirrors:
+                mirror.remove(event.model, event.entity_id)
+            return
+        version = _normalize_version(event.payload["entity"].get("version")) or 0
+        for index in indexes:
+            index.add(event.record.model_copy(deep=True), version=version)
+        for mirror in self.mirrors:
+            mirror.put(event.record, version)
+
+    def _event(self, payload: dict[str, Any]) -> WebhookEvent:
+        administration_id = _int_or_none(payload.get("administration_id"))
+        bound_admin_id = _int_or_none(current_client().admin_id or None)
+        if None not in (administration_id, bound_admin_id) and (
+            administration_id != bound_admin_id
+        ):
+            raise MoneybirdWebhookError(
+                f"Webhook for administration {administration_id}, "
+                f"expected {bound_admin_id}"
+            )
+
+        action = str(payload.get("action") or "")
+        entity_type = payload.get("entity_type")
+        entity = payload.get("entity")
+        if not isinstance(entity, dict):
+            entity = None
+        model = _model_for(entity_type, entity)
+        entity_id = _int_or_none(
+            payload.get("entity_id") or (entity or {}).get("id")
+        )
+        record = None
+        if model is not None and entity is not None:
+            try:
+                record = model(**{**entity, "id": entity_id})
+            except ValidationError as exc:
+                raise MoneybirdWebhookError(
+                    f"Invalid {model.__name__} in webhook payload: {exc}"
+                ) from exc
+        return WebhookEvent(
+            action=action,
+            administration_id=administration_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            model=model,
+            record=record,
+            deleted=action.endswith(_DELETE_ACTIONS),
+            payload=payload,
+        )
+
+
+def _model_for(
+    entity_type: Any, entity: dict[str, Any] | None
+) -> type[Synchronizable] | None:
+    if entity_type == "Document" and entity is not None:
+        # e.g. {"type": "PurchaseInvoice"} or {"type": "Documents::Receipt"}
+        entity_type = str(entity.get("type", "")).rpartition("::")[2]
+    return WEBHOOK_MODELS.get(entity_type) if isinstance(entity_type, str) else None
+
+
+def _int_or_none(value: Any) -> int | None:
+    try:
+        return int(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
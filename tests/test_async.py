@@ -0,0 +1,206 @@
+import asyncio
+import threading
+from typing import Any
+
+import httpx
+import pytest
+from pytest_mock import MockType
+
+import moneysnake.client as client
+from moneysnake.client import Page, amake_request, apaginate, set_max_retries
+from moneysnake.contact import Contact
+from moneysnake.exceptions import MoneybirdNotFoundError
+from moneysnake.model import CrudModel
+from moneysnake.purchase_invoice import PurchaseInvoice
+from moneysnake.sales_invoice import SalesInvoice
+
+
+@pytest.fixture(autouse=True)
+def _reset_retries():
+    original = client.max_retries_
+    yield
+    client.max_retries_ = original
+
+
+def _make_response(
+    status_code: int, json_data: Any = None, headers: dict | None = None
+) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        json=json_data,
+        headers=headers or {},
+        request=httpx.Request("GET", "https://example.com"),
+    )
+
+
+class TestAmakeRequest:
+    def test_returns_decoded_json(self, mocker: MockType):
+        mock_request = mocker.patch(
+            "moneysnake.client.httpx.AsyncClient.request",
+            return_value=_make_response(200, {"id": 1}),
+        )
+        result = asyncio.run(amake_request("contacts/1", method="get"))
+        assert result == {"id": 1}
+        assert mock_request.await_count == 1
+
+    def test_retry_uses_asyncio_sleep(self, mocker: MockType):
+        set_max_retries(1)
+        mock_sleep = mocker.patch("moneysnake.client.asyncio.sleep")
+        mock_time_sleep = mocker.patch("moneysnake.client.time.sleep")
+        mocker.patch(
+            "moneysnake.client.httpx.AsyncClient.request",
+            side_effect=[
+                _make_response(429, headers={"Retry-After": "3"}),
+                _make_response(200, {"ok": True}),
+            ],
+        )
+        result = asyncio.run(amake_request("contacts", method="get"))
+        assert result == {"ok": True}
+        mock_sleep.assert_awaited_once_with(3)
+        mock_time_sleep.assert_not_called()
+
+    def test_error_mapping(self, mocker: MockType):
+        mocker.patch(
+            "moneysnake.client.httpx.AsyncClient.request",
+            return_value=_make_response(404),
+        )
+        with pytest.raises(MoneybirdNotFoundError):
+            asyncio.run(amake_request("contacts/999", method="get"))
+
+    def test_concurrent_requests_share_one_loop(self, mocker: MockType):
+        mocker.patch(
+            "moneysnake.client.httpx.AsyncClient.request",
+            return_value=_make_response(200, {"id": 1}),
+        )
+
+        async def run() -> list[Any]:
+            return await asyncio.gather(
+                *(amake_request(f"contacts/{i}", method="get") for i in range(20))
+            )
+
+        assert len(asyncio.run(run())) == 20
+
+
+def test_async_pool_keeps_one_client_per_loop():
+    pool = client.AsyncConnectionPool()
+
+    async def get_twice() -> httpx.AsyncClient:
+        first = pool.get()
+        assert pool.get() is first
+        return first
+
+    results: list[httpx.AsyncClient] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(asyncio.run(get_twice())))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(result) for result in results}) == 3
+    # asyncio.run shut each loop down, which closed its client.
+    assert all(result.is_closed for result in results)
+
+
+def test_async_pool_aclose_closes_client_of_running_loop():
+    pool = client.AsyncConnectionPool()
+
+    async def run() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        first = pool.get()
+        await pool.aclose()
+        return first, pool.get()
+
+    first, second = asyncio.run(run())
+    assert first.is_closed
+    assert second is not first and second.is_closed
+
+
+def test_apaginate_multiple_pages(mocker: MockType):
+    mock_get = mocker.patch(
+        "moneysnake.client._afetch_page",
+        side_effect=[Page([{"id": 1}, {"id": 2}]), Page([{"id": 3}])],
+    )
+    results = asyncio.run(apaginate("contacts", per_page=2))
+    assert [r["id"] for r in results] == [1, 2, 3]
+    assert mock_get.await_count == 2
+
+
+class TestAsyncModelMethods:
+    def test_afind_by_id(self, mocker: MockType):
+        mocker.patch("moneysnake.model.ahttp_get", return_value={"id": 1})
+        model = asyncio.run(CrudModel.afind_by_id(1))
+        assert model.id == 1
+
+    def test_asave_create(self, mocker: MockType):
+        mock_post = mocker.patch("moneysnake.model.ahttp_post", return_value={"id": 1})
+        model = CrudModel()
+        asyncio.run(model.asave())
+        assert model.id == 1
+        mock_post.assert_awaited_once()
+
+    def test_adelete(self, mocker: MockType):
+        mock_delete = mocker.patch("moneysnake.model.ahttp_delete")
+        model = CrudModel(id=1)
+        asyncio.run(model.adelete())
+        assert model.id is None
+        mock_delete.assert_awaited_once_with("crud_models/1")
+
+    def test_adelete_without_id(self):
+        with pytest.raises(ValueError):
+            asyncio.run(CrudModel().adelete())
+
+    def test_async_sync_fetch(self, mocker: MockType):
+        mock_post = mocker.patch(
+            "moneysnake.model.ahttp_post",
+            return_value=[{"id": 1, "company_name": "Acme"}],
+        )
+        result = asyncio.run(Contact.async_sync_fetch([1]))
+        assert isinstance(result[0], Contact)
+        mock_post.assert_awaited_once_with(
+            "contacts/synchronization", data={"ids": [1]}
+        )
+
+    def test_async_sync_fetch_max_100(self):
+        with pytest.raises(ValueError, match="maximum of 100"):
+            asyncio.run(Contact.async_sync_fetch(list(range(101))))
+
+    def test_sales_invoice_asave_uses_details_attributes(self, mocker: MockType):
+        mock_post = mocker.patch(
+            "moneysnake.sales_invoice.ahttp_post", return_value={"id": 5}
+        )
+        invoice = SalesInvoice(contact_id=1)
+        asyncio.run(invoice.asave())
+        assert invoice.id == 5
+        body = mock_post.call_args[1]["data"]["sales_invoice"]
+        assert "details_attributes" in body
+
+    def test_sales_invoice_alist_all(self, mocker: MockType):
+        mock_paginate = mocker.patch(
+            "moneysnake.sales_invoice.apaginate", return_value=[{"id": 1}]
+        )
+        invoices = asyncio.run(SalesInvoice.alist_all(state="open"))
+        assert invoices[0].id == 1
+        mock_paginate.assert_awaited_once_with(
+            "sales_invoices",
+            params={"filter": "state:open"},
+            decode=SalesInvoice._validate_page,
+        )
+
+    def test_document_afind_by_id(
+        self, mocker: MockType, document_data: dict[str, Any]
+    ):
+        mock_get = mocker.patch(
+            "moneysnake.document.ahttp_get", return_value=document_data
+        )
+        invoice = asyncio.run(PurchaseInvoice.afind_by_id(480487019028416410))
+        assert invoice.reference == "2026-01234"
+        mock_get.assert_awaited_once_with(
+            "documents/purchase_invoices/480487019028416410"
+        )
+
+    def test_document_alist_all(self, mocker: MockType, document_data: dict[str, Any]):
+        mocker.patch("moneysnake.document.apaginate", return_value=[document_data])
+        invoices = asyncio.run(PurchaseInvoice.alist_all(period="this_year"))
+        assert len(invoices) == 1
@@ -0,0 +1,168 @@
+import json
+from typing import Any
+
+import httpx
+import pytest
+from pytest_mock import MockType
+
+import moneysnake.client as client
+from moneysnake.cache import ResponseCache
+from moneysnake.client import MoneybirdClient, http_get, http_patch, paginate
+from moneysnake.contact import Contact
+
+
+@pytest.fixture(name="cache")
+def fixture_cache():
+    cache = ResponseCache()
+    client.set_response_cache(cache)
+    yield cache
+    client.set_response_cache(None)
+
+
+def _response(status_code: int, content: bytes = b"", **headers: str) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        content=content,
+        headers=headers,
+        request=httpx.Request("GET", "https://example.com"),
+    )
+
+
+def test_304_reuses_cached_body(mocker: MockType, cache: ResponseCache):
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[
+            _response(200, b'{"id": 1, "city": "Utrecht"}', ETag='"v1"'),
+            _response(304, ETag='"v1"'),
+        ],
+    )
+
+    assert http_get("contacts/1") == {"id": 1, "city": "Utrecht"}
+    assert http_get("contacts/1") == {"id": 1, "city": "Utrecht"}
+
+    first, second = mock_request.call_args_list
+    assert "If-None-Match" not in first.kwargs["headers"]
+    assert second.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert cache.stats.hits == cache.stats.misses == cache.stats.revalidations == 1
+
+
+def test_changed_resource_is_replaced(mocker: MockType, cache: ResponseCache):
+    mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[
+            _response(200, b'{"v": 1}', **{"Last-Modified": "Mon, 01 Jan 2024"}),
+            _response(200, b'{"v": 2}', **{"Last-Modified": "Tue, 02 Jan 2024"}),
+            _response(304),
+        ],
+    )
+    assert http_get("contacts/1") == {"v": 1}
+    assert http_get("contacts/1") == {"v": 2}
+    assert http_get("contacts/1") == {"v": 2}
+    assert cache.stats.misses == 2
+    assert cache.stats.hits == 1
+
+
+def test_params_are_part_of_the_key(mocker: MockType, cache: ResponseCache):
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[
+            _response(200, b"[]", ETag='"a"'),
+            _response(200, b"[]", ETag='"b"'),
+        ],
+    )
+    http_get("contacts", params={"page": 1})
+    http_get("contacts", params={"page": 2})
+    assert "If-None-Match" not in mock_request.call_args.kwargs["headers"]
+    assert len(cache) == 2
+
+
+def test_fresh_entries_skip_the_request(mocker: MockType):
+    cache = ResponseCache(max_age=60)
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        return_value=_response(200, b'{"id": 1}'),
+    )
+    api = MoneybirdClient(admin_id=1, token="t", cache=cache)
+    assert api.make_request("contacts/1", method="get") == {"id": 1}
+    assert api.make_request("contacts/1", method="get") == {"id": 1}
+    assert mock_request.call_count == 1
+    assert cache.stats.hit_ratio == 0.5
+
+
+def test_write_evicts_resource(mocker: MockType, cache: ResponseCache):
+    mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[
+            _response(200, b'{"id": 1}', ETag='"v1"'),
+            _response(200, b"[]", ETag='"list"'),
+            _response(200, b'{"id": 1}'),
+        ],
+    )
+    http_get("contacts/1")
+    http_get("contacts")
+    http_patch("contacts/1", data={"contact": {}})
+    assert len(cache) == 0
+
+
+def test_lru_eviction_by_count_and_size():
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    for name, body in [("a", b"1234"), ("b", b"1234"), ("c", b"12")]:
+        cache.store(ResponseCache.key(name), _response(200, body, ETag=name))
+    assert cache.get(ResponseCache.key("a")) is None
+    assert len(cache) == 2
+    assert cache.size == 6
+
+    cache.store(ResponseCache.key("d"), _response(200, b"123456789", ETag="d"))
+    assert len(cache) == 1
+    assert cache.stats.evictions == 3
+
+
+def test_ttl_eviction(mocker: MockType):
+    now = mocker.patch("moneysnake.cache.time.monotonic", return_value=100.0)
+    cache = ResponseCache(ttl=10)
+    key = ResponseCache.key("contacts/1")
+    cache.store(key, _response(200, b"{}", ETag="x"))
+    now.return_value = 109.0
+    assert cache.get(key) is not None
+    now.return_value = 111.0
+    assert cache.get(key) is None
+    assert cache.stats.evictions == 1
+
+
+def test_responses_without_validators_are_not_cached():
+    cache = ResponseCache()
+    cache.store(ResponseCache.key("contacts/1"), _response(200, b"{}"))
+    assert len(cache) == 0
+    assert cache.stats.misses == 1
+
+
+def test_cached_pages_keep_link_headers(mocker: MockType, cache: ResponseCache):
+    link = '<https://example.com/contacts?page=2>; rel="next"'
+    mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[
+            _response(200, b'[{"id": 1}]', ETag='"p1"', Link=link),
+            _response(200, b"[]", ETag='"p2"'),
+            _response(304),
+            _response(304),
+        ],
+    )
+    assert paginate("contacts") == [{"id": 1}]
+    assert paginate("contacts") == [{"id": 1}]
+    assert cache.stats.revalidations == 2
+
+
+def test_find_by_id_uses_cache(
+    mocker: MockType, cache: ResponseCache, contact_data: dict[str, Any]
+):
+    mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[
+            _response(200, json.dumps(contact_data).encode(), ETag='"c"'),
+            _response(304),
+        ],
+    )
+    first = Contact.find_by_id(1)
+    second = Contact.find_by_id(1)
+    assert first.company_name == second.company_name == "Foobar Holding B.V."
+    assert cache.stats.hits == 1
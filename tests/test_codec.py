@@ -0,0 +1,67 @@
+import json
+
+import httpx
+import pytest
+from pytest_mock import MockType
+
+from moneysnake import codec
+from moneysnake.client import make_request
+from moneysnake.codec import JsonCodec, get_json_codec, set_json_codec
+
+
+@pytest.fixture(autouse=True)
+def _reset_codec():
+    original = codec.codec_
+    yield
+    codec.codec_ = original
+
+
+def test_best_installed_codec_is_default():
+    set_json_codec(None)
+    assert get_json_codec().name in {"orjson", "msgspec", "json"}
+
+
+def test_select_codec_by_name():
+    set_json_codec("json")
+    assert get_json_codec().name == "json"
+
+
+def test_unknown_codec_name():
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        set_json_codec("yaml")
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec", "json"])
+def test_codecs_round_trip(name: str):
+    try:
+        set_json_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    data = {"contact": {"company_name": "Café Ü", "id": 1, "tags": [None, True]}}
+    encoded = get_json_codec().dumps(data)
+    assert json.loads(encoded) == data
+    assert get_json_codec().loads(encoded) == data
+
+
+def test_make_request_uses_codec(mocker: MockType):
+    calls: list[object] = []
+
+    def dumps(obj: object) -> bytes:
+        calls.append(obj)
+        return json.dumps(obj).encode()
+
+    def loads(data: bytes) -> object:
+        calls.append(data)
+        return {"decoded": True}
+
+    set_json_codec(JsonCodec("custom", dumps, loads))
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        return_value=httpx.Response(
+            200, content=b'{"id": 1}', request=httpx.Request("POST", "http://test")
+        ),
+    )
+
+    assert make_request("contacts", data={"contact": {}}) == {"decoded": True}
+    assert calls == [{"contact": {}}, b'{"id": 1}']
+    assert mock_request.call_args.kwargs["content"] == b'{"contact": {}}'
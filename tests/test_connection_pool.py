@@ -0,0 +1,77 @@
+import httpx
+import pytest
+from pytest_mock import MockType
+
+import moneysnake.client as client
+from moneysnake.client import (
+    ConnectionPool,
+    close,
+    connection_pool,
+    make_request,
+    set_pool_limits,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_pool():
+    """Restore the shared pool after each test."""
+    original = client.pool_
+    yield
+    client.pool_.close()
+    client.pool_ = original
+
+
+def _ok_response() -> httpx.Response:
+    return httpx.Response(
+        200, json={"id": 1}, request=httpx.Request("GET", "https://example.com")
+    )
+
+
+def test_pool_is_created_lazily():
+    pool = ConnectionPool()
+    assert pool._client is None
+    http_client = pool.get()
+    assert isinstance(http_client, httpx.Client)
+    assert pool.get() is http_client
+    pool.close()
+
+
+def test_pool_reopens_after_close():
+    pool = ConnectionPool()
+    first = pool.get()
+    pool.close()
+    assert first.is_closed
+    second = pool.get()
+    assert second is not first
+    assert not second.is_closed
+    pool.close()
+
+
+def test_pool_as_context_manager_closes_client():
+    with ConnectionPool() as pool:
+        http_client = pool.get()
+    assert http_client.is_closed
+
+
+def test_requests_reuse_the_shared_client(mocker: MockType):
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request", return_value=_ok_response()
+    )
+    make_request("contacts/1", method="get")
+    make_request("contacts/2", method="get")
+    assert mock_request.call_count == 2
+    assert connection_pool().get() is connection_pool().get()
+
+
+def test_set_pool_limits_replaces_pool():
+    old_client = connection_pool().get()
+    set_pool_limits(max_connections=5, max_keepalive_connections=2)
+    assert old_client.is_closed
+    assert connection_pool().limits.max_connections == 5
+    assert connection_pool().limits.max_keepalive_connections == 2
+
+
+def test_module_close_closes_shared_client():
+    http_client = connection_pool().get()
+    close()
+    assert http_client.is_closed
@@ -0,0 +1,70 @@
+import io
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_mock import MockType
+
+from moneysnake.client import http_download, http_get_raw, http_iter_bytes
+from moneysnake.exceptions import MoneybirdNotFoundError
+
+PDF = b"%PDF-1.4" + b"x" * 1000
+
+
+def _response(status_code: int, content: bytes = b"", **headers: str) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        content=content,
+        headers=headers,
+        request=httpx.Request("GET", "https://example.com"),
+    )
+
+
+@pytest.fixture(name="mock_send")
+def fixture_mock_send(mocker: MockType) -> MockType:
+    mocker.patch("moneysnake.client.time.sleep")
+    return mocker.patch("moneysnake.client.httpx.Client.send")
+
+
+def test_iter_bytes_yields_chunks(mock_send: MockType):
+    mock_send.return_value = _response(200, PDF)
+    chunks = list(http_iter_bytes("sales_invoices/1/download_pdf", chunk_size=100))
+    assert b"".join(chunks) == PDF
+    assert max(len(chunk) for chunk in chunks) == 100
+    assert mock_send.call_args.kwargs["stream"] is True
+
+
+def test_download_retries_on_429(mock_send: MockType):
+    mock_send.side_effect = [
+        _response(429, b"slow down", **{"Retry-After": "1"}),
+        _response(200, PDF),
+    ]
+    buffer = io.BytesIO()
+    assert http_download("sales_invoices/1/download_pdf", buffer) == len(PDF)
+    assert buffer.getvalue() == PDF
+    assert mock_send.call_count == 2
+
+
+def test_get_raw_raises_api_errors(mock_send: MockType):
+    mock_send.return_value = _response(404, b"Not found")
+    with pytest.raises(MoneybirdNotFoundError) as exc_info:
+        http_get_raw("sales_invoices/1/download_pdf")
+    assert exc_info.value.response_body == "Not found"
+
+
+def test_download_to_path(mock_send: MockType, tmp_path: Path):
+    mock_send.return_value = _response(200, PDF)
+    target = tmp_path / "invoice.pdf"
+    assert http_download("sales_invoices/1/download_pdf", target) == len(PDF)
+    assert target.read_bytes() == PDF
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_failed_download_keeps_existing_file(mock_send: MockType, tmp_path: Path):
+    mock_send.return_value = _response(404, b"Not found")
+    target = tmp_path / "invoice.pdf"
+    target.write_bytes(b"old")
+    with pytest.raises(MoneybirdNotFoundError):
+        http_download("sales_invoices/1/download_pdf", target)
+    assert target.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [target]
@@ -38,7 +38,7 @@ def test_404_raises_not_found(mocker: MockType):
     response = httpx.Response(
         404, text="Not found", request=httpx.Request("GET", "http://test")
     )
-    mocker.patch("moneysnake.client.httpx.request", return_value=response)
+    mocker.patch("moneysnake.client.httpx.Client.request", return_value=response)
 
     with pytest.raises(MoneybirdNotFoundError) as exc_info:
         make_request("contacts/1", method="get")
@@ -50,7 +50,7 @@ def test_422_raises_validation_error(mocker: MockType):
     response = httpx.Response(
         422, text="Unprocessable", request=httpx.Request("POST", "http://test")
     )
-    mocker.patch("moneysnake.client.httpx.request", return_value=response)
+    mocker.patch("moneysnake.client.httpx.Client.request", return_value=response)
 
     with pytest.raises(MoneybirdValidationError) as exc_info:
         make_request("contacts", method="post")
@@ -62,7 +62,7 @@ def test_429_raises_rate_limit_error(mocker: MockType):
     response = httpx.Response(
         429, text="Too many requests", request=httpx.Request("GET", "http://test")
     )
-    mocker.patch("moneysnake.client.httpx.request", return_value=response)
+    mocker.patch("moneysnake.client.httpx.Client.request", return_value=response)
 
     with pytest.raises(MoneybirdRateLimitError) as exc_info:
         make_request("contacts", method="get")
@@ -74,7 +74,7 @@ def test_500_raises_generic_api_error(mocker: MockType):
     response = httpx.Response(
         500, text="Internal error", request=httpx.Request("GET", "http://test")
     )
-    mocker.patch("moneysnake.client.httpx.request", return_value=response)
+    mocker.patch("moneysnake.client.httpx.Client.request", return_value=response)
 
     with pytest.raises(MoneybirdAPIError) as exc_info:
         make_request("contacts", method="get")
@@ -1,4 +1,5 @@
 import importlib
+import pytest
 from moneysnake.financial_mutation import FinancialMutation
 from pytest_mock import MockType
 from freezegun import freeze_time
@@ -34,7 +35,9 @@ def test_search_financial_mutations(mocker: MockType):
     # Verify http_get was called with correct params
     expected_filter = "query:test,period:20230101..20230101,financial_account_id:123"
     mock_http_get.assert_called_once_with(
-        "financial_mutations", params={"filter": expected_filter}
+        "financial_mutations",
+        params={"filter": expected_filter},
+        decode=FinancialMutation._validate_page,
     )
 
     # Verify results are FinancialMutation objects
@@ -59,7 +62,9 @@ def test_search_financial_mutations_simple_period(mocker: MockType):
 
     expected_filter = "query:test,period:202301"
     mock_http_get.assert_called_once_with(
-        "financial_mutations", params={"filter": expected_filter}
+        "financial_mutations",
+        params={"filter": expected_filter},
+        decode=FinancialMutation._validate_page,
     )
 
 
@@ -84,5 +89,33 @@ def test_search_financial_mutations_default_period(mocker: MockType):
     expected_filter = f"query:test,period:{expected_period}"
 
     mock_http_get.assert_called_once_with(
-        "financial_mutations", params={"filter": expected_filter}
+        "financial_mutations",
+        params={"filter": expected_filter},
+        decode=FM._validate_page,
     )
+
+
+def test_search_rows(mocker: MockType):
+    """
+    Test that search_rows keeps only the requested fields of each mutation.
+    """
+    content = (
+        b'[{"id": "1", "amount": "10.0", "message": "Rent", "payments": []},'
+        b' {"id": "2", "amount": "-5.0"}]'
+    )
+    mock_paginate = mocker.patch(
+        "moneysnake.financial_mutation.paginate",
+        side_effect=lambda path, params, decode: decode(content),
+    )
+
+    rows = FinancialMutation.search_rows(["id", "message"], period="202301")
+
+    assert [tuple(row) for row in rows] == [(1, "Rent"), (2, None)]
+    assert rows[0].message == "Rent"
+    assert not hasattr(rows[0], "__dict__")
+    assert mock_paginate.call_args.kwargs["params"] == {"filter": "period:202301"}
+
+
+def test_search_rows_unknown_field():
+    with pytest.raises(ValueError, match="Unknown FinancialMutation fields: nope"):
+        FinancialMutation.search_rows(["id", "nope"])
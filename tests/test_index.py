@@ -0,0 +1,176 @@
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from pytest_mock import MockType
+
+from moneysnake.client import MoneybirdClient
+from moneysnake.contact import Contact
+from moneysnake.exceptions import MoneybirdNotFoundError
+from moneysnake.index import LookupIndex, register_index, unregister_index
+from moneysnake.sales_invoice import SalesInvoice
+
+CONTACTS = {
+    1: {"id": 1, "version": 10, "customer_id": "C-1", "company_name": "Acme"},
+    2: {"id": 2, "version": 20, "customer_id": "C-2", "company_name": "Globex"},
+}
+
+
+@pytest.fixture(name="sync_api")
+def fixture_sync_api(mocker: MockType) -> dict[int, dict[str, Any]]:
+    records = {id: dict(record) for id, record in CONTACTS.items()}
+    mocker.patch(
+        "moneysnake.model.paginate",
+        side_effect=lambda path, params=None: [
+            {"id": r["id"], "version": r["version"]} for r in records.values()
+        ],
+    )
+    mocker.patch(
+        "moneysnake.model.http_post",
+        side_effect=lambda path, data: [records[id] for id in data["ids"]],
+    )
+    return records
+
+
+@pytest.fixture(name="index")
+def fixture_index(sync_api: dict[int, dict[str, Any]]) -> Iterator[LookupIndex]:
+    index = LookupIndex(Contact, "customer_id")
+    index.sync()
+    register_index(index)
+    yield index
+    unregister_index(index)
+
+
+def test_lookup_is_served_from_index(mocker: MockType, index: LookupIndex):
+    mock_get = mocker.patch("moneysnake.contact.http_get")
+    contact = Contact.find_by_customer_id("C-2")
+    assert contact.company_name == "Globex"
+    mock_get.assert_not_called()
+
+    contact.company_name = "Changed locally"
+    assert Contact.find_by_customer_id("C-2").company_name == "Globex"
+
+
+def test_unknown_key_falls_back_and_is_indexed(mocker: MockType, index: LookupIndex):
+    mock_get = mocker.patch(
+        "moneysnake.contact.http_get",
+        return_value={"id": 3, "version": 30, "customer_id": "C-3"},
+    )
+    assert Contact.find_by_customer_id("C-3").id == 3
+    assert Contact.find_by_customer_id("C-3").id == 3
+    mock_get.assert_called_once_with("contacts/customer_id/C-3")
+
+
+def test_missing_key_is_negatively_cached(mocker: MockType, index: LookupIndex):
+    mock_get = mocker.patch(
+        "moneysnake.contact.http_get",
+        side_effect=MoneybirdNotFoundError(404, "Not found", "get", "contacts"),
+    )
+    for _ in range(3):
+        with pytest.raises(MoneybirdNotFoundError):
+            Contact.find_by_customer_id("nope")
+    assert mock_get.call_count == 1
+
+
+def test_negative_cache_expires(mocker: MockType, sync_api: dict[int, Any]):
+    now = mocker.patch("moneysnake.index.time.monotonic", return_value=0.0)
+    index = LookupIndex(Contact, "customer_id", negative_ttl=10)
+    mock_fetch = mocker.Mock(
+        side_effect=MoneybirdNotFoundError(404, "Not found", "get", "contacts")
+    )
+    with pytest.raises(MoneybirdNotFoundError):
+        index.resolve("C-9", mock_fetch)
+    now.return_value = 11.0
+    with pytest.raises(MoneybirdNotFoundError):
+        index.resolve("C-9", mock_fetch)
+    assert mock_fetch.call_count == 2
+
+
+def test_sync_is_incremental(index: LookupIndex, sync_api: dict[int, Any]):
+    sync_api[1] = {**sync_api[1], "version": 11, "customer_id": "C-1b"}
+    del sync_api[2]
+    sync_api[3] = {"id": 3, "version": 30, "customer_id": "C-3"}
+    index.sync()
+
+    assert index.get("C-1") is None
+    assert index.get("C-1b").id == 1
+    assert index.get("C-2") is None
+    assert index.get("C-3").id == 3
+    assert len(index) == 2
+
+
+def test_lookups_do_not_wait_for_sync(
+    mocker: MockType, index: LookupIndex, sync_api: dict[int, Any]
+):
+    started, release = threading.Event(), threading.Event()
+    post = mocker.patch("moneysnake.model.http_post")
+
+    def slow_post(path: str, data: dict[str, Any]) -> list[dict[str, Any]]:
+        started.set()
+        release.wait(5)
+        return [sync_api[id] for id in data["ids"]]
+
+    post.side_effect = slow_post
+    sync_api[1] = {**sync_api[1], "version": 11, "company_name": "Acme Inc"}
+    syncer = threading.Thread(target=index.sync)
+    syncer.start()
+    started.wait(5)
+    assert Contact.find_by_customer_id("C-1").company_name == "Acme"
+    assert syncer.is_alive()
+    release.set()
+    syncer.join()
+    assert Contact.find_by_customer_id("C-1").company_name == "Acme Inc"
+    assert post.call_count == 1
+
+
+def test_index_is_per_administration(mocker: MockType, index: LookupIndex):
+    mock_get = mocker.patch(
+        "moneysnake.contact.http_get", return_value={"id": 99, "customer_id": "C-1"}
+    )
+    with MoneybirdClient(admin_id=12345, token="t").bind():
+        assert Contact.find_by_customer_id("C-1").id == 99
+    mock_get.assert_called_once()
+
+
+def test_index_with_client(mocker: MockType, sync_api: dict[int, Any]):
+    tenant = MoneybirdClient(7, "t")
+    index = LookupIndex(Contact, "customer_id", client=tenant)
+    index.sync()
+    register_index(index)
+    try:
+        mock_get = mocker.patch("moneysnake.contact.http_get")
+        contact = Contact.find_by_customer_id("C-1", client=tenant)
+        assert contact.company_name == "Acme"
+        mock_get.assert_not_called()
+    finally:
+        unregister_index(index)
+
+
+def test_sales_invoice_lookups(mocker: MockType):
+    records = [
+        {"id": 5, "version": 1, "invoice_id": "2026-0001", "reference": "PO-1"}
+    ]
+    mocker.patch(
+        "moneysnake.model.paginate",
+        return_value=[{"id": 5, "version": 1}],
+    )
+    mocker.patch("moneysnake.model.http_post", return_value=records)
+    mock_get = mocker.patch("moneysnake.sales_invoice.http_get")
+    by_invoice_id = LookupIndex(SalesInvoice, "invoice_id")
+    by_reference = LookupIndex(SalesInvoice, "reference")
+    for index in (by_invoice_id, by_reference):
+        index.sync()
+        register_index(index)
+    try:
+        assert SalesInvoice.find_by_invoice_id("2026-0001").id == 5
+        assert SalesInvoice.find_by_reference("PO-1").id == 5
+    finally:
+        unregister_index(by_invoice_id)
+        unregister_index(by_reference)
+    mock_get.assert_not_called()
+
+
+def test_unknown_field():
+    with pytest.raises(ValueError, match="no field"):
+        LookupIndex(Contact, "nickname")
@@ -0,0 +1,107 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockType
+
+from moneysnake.contact import Contact
+from moneysnake.financial_mutation import FinancialMutation
+from moneysnake.mirror import Mirror, SQLiteStore
+from moneysnake.purchase_invoice import PurchaseInvoice
+
+
+class FakeSyncApi:
+    """Stands in for the synchronization endpoints of one resource."""
+
+    def __init__(self, records: dict[int, dict[str, Any]]) -> None:
+        self.records = records
+        self.fetched: list[list[int]] = []
+
+    def sync_list(self, path: str, params: Any = None) -> list[dict[str, Any]]:
+        return [
+            {"id": str(id), "version": record["version"]}
+            for id, record in self.records.items()
+        ]
+
+    def sync_fetch(self, path: str, data: dict[str, Any]) -> list[dict[str, Any]]:
+        self.fetched.append(data["ids"])
+        return [{"id": id, **self.records[id]} for id in data["ids"]]
+
+
+@pytest.fixture(name="api")
+def fixture_api(mocker: MockType) -> FakeSyncApi:
+    api = FakeSyncApi(
+        {
+            id: {"version": 1, "company_name": f"Company {id}"}
+            for id in range(1, 251)
+        }
+    )
+    mocker.patch("moneysnake.model.paginate", side_effect=api.sync_list)
+    mocker.patch("moneysnake.model.http_post", side_effect=api.sync_fetch)
+    return api
+
+
+def test_initial_sync_fetches_everything_in_batches(api: FakeSyncApi):
+    mirror = Mirror()
+    result = mirror.sync(Contact)[Contact]
+    assert (result.fetched, result.deleted, result.unchanged) == (250, 0, 0)
+    assert sorted(len(batch) for batch in api.fetched) == [50, 100, 100]
+    assert mirror.count(Contact) == 250
+    contact = mirror.get(Contact, 7)
+    assert contact is not None
+    assert contact.company_name == "Company 7"
+
+
+def test_resync_fetches_only_changes(api: FakeSyncApi):
+    mirror = Mirror()
+    mirror.sync(Contact)
+    api.fetched.clear()
+
+    api.records[3] = {"version": 2, "company_name": "Renamed"}
+    api.records[999] = {"version": 1, "company_name": "New"}
+    del api.records[5]
+
+    result = mirror.sync(Contact)[Contact]
+    assert api.fetched == [[3, 999]]
+    assert (result.fetched, result.deleted, result.unchanged) == (2, 1, 248)
+    assert mirror.get(Contact, 3).company_name == "Renamed"
+    assert mirror.get(Contact, 5) is None
+    assert mirror.count(Contact) == 250
+
+
+def test_nothing_changed_fetches_nothing(api: FakeSyncApi):
+    mirror = Mirror()
+    mirror.sync(Contact)
+    api.fetched.clear()
+    mirror.sync(Contact)
+    assert api.fetched == []
+
+
+def test_string_versions(api: FakeSyncApi):
+    api.records = {1: {"version": "9"}, 2: {"version": "v1"}}
+    mirror = Mirror()
+    mirror.sync(FinancialMutation)
+    api.fetched.clear()
+
+    api.records[1] = {"version": "10"}
+    result = mirror.sync(FinancialMutation)[FinancialMutation]
+    assert api.fetched == [[1]]
+    assert (result.fetched, result.unchanged) == (1, 1)
+
+
+def test_resources_are_stored_separately(api: FakeSyncApi):
+    mirror = Mirror()
+    mirror.sync(Contact, PurchaseInvoice)
+    assert mirror.count(Contact) == mirror.count(PurchaseInvoice) == 250
+    assert mirror.get(PurchaseInvoice, 1).id == 1
+
+
+def test_store_persists_between_mirrors(api: FakeSyncApi, tmp_path: Path):
+    Mirror(tmp_path / "mirror.db").sync(Contact)
+    api.fetched.clear()
+
+    mirror = Mirror(SQLiteStore(tmp_path / "mirror.db"))
+    assert mirror.count(Contact) == 250
+    assert len(mirror.all(Contact)) == 250
+    mirror.sync(Contact)
+    assert api.fetched == []
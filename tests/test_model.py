@@ -1,6 +1,9 @@
+import pytest
 from pytest_mock import MockType
 from pydantic import field_validator
 from typing import Any
+from moneysnake.contact import Contact
+from moneysnake.exceptions import MoneybirdAPIError, MoneybirdNotFoundError
 from moneysnake.model import CrudModel, MoneybirdModel
 
 
@@ -67,6 +70,15 @@ def test_update_with_none_value():
     assert model.items is None
 
 
+def test_update_keeps_untouched_nested_models():
+    model = ModelWithValidator(items=[NestedModel(id=1, name="existing")])
+    items = model.items
+    model.update({"id": "5", "unknown": "ignored"})
+
+    assert model.id == 5
+    assert model.items is items
+
+
 def test_load(mocker: MockType):
     """
     Test that the load method fetches the data from the API and updates the model.
@@ -98,6 +110,37 @@ def test_save_update(mocker: MockType):
     assert model.id == 1
 
 
+def test_save_update_sends_changed_fields(mocker: MockType):
+    mocker.patch(
+        "moneysnake.model.http_get", return_value={"id": 1, "city": "Utrecht"}
+    )
+    mock_patch = mocker.patch("moneysnake.model.http_patch", return_value={"id": 1})
+    contact = Contact.find_by_id(1)
+    contact.company_name = "Acme"
+    contact.save()
+    mock_patch.assert_called_once_with(
+        "contacts/1", data={"contact": {"company_name": "Acme"}}
+    )
+
+
+def test_loaded_model_equals_constructed_model(mocker: MockType):
+    mocker.patch(
+        "moneysnake.model.http_get", return_value={"id": 1, "city": "Utrecht"}
+    )
+    contact = Contact.find_by_id(1)
+    assert contact == Contact(id=1, city="Utrecht")
+    assert contact != Contact(id=1, city="Amsterdam")
+    assert contact != MoneybirdModel(id=1)
+
+
+def test_save_without_load_sends_all_fields(mocker: MockType):
+    mock_patch = mocker.patch("moneysnake.model.http_patch", return_value={"id": 1})
+    contact = Contact(id=1, city="Utrecht")
+    contact.save()
+    sent = mock_patch.call_args.kwargs["data"]["contact"]
+    assert sent == Contact(id=1, city="Utrecht").to_dict()
+
+
 def test_delete(mocker: MockType):
     """
     Test that the delete method removes the id from the model.
@@ -152,3 +195,27 @@ def test_delete_by_id(mocker: MockType):
     mocker.patch("moneysnake.model.http_delete")
     model = CrudModel.delete_by_id(1)
     assert model.id is None
+
+
+def test_find_many_reports_missing_ids(mocker: MockType):
+    def get(path: str) -> dict[str, Any]:
+        id = int(path.rsplit("/", 1)[1])
+        if id == 2:
+            raise MoneybirdNotFoundError(404, "Not found", "get", path)
+        return {"id": id, "items": [{"name": f"item {id}"}]}
+
+    mock_get = mocker.patch("moneysnake.model.http_get", side_effect=get)
+    result = ModelWithValidator.find_many([3, 2, 1, 3])
+    assert list(result.records) == [3, 1]
+    assert result.records[1].items[0].name == "item 1"
+    assert result.missing == [2]
+    assert mock_get.call_count == 3
+
+
+def test_find_many_propagates_other_errors(mocker: MockType):
+    mocker.patch(
+        "moneysnake.model.http_get",
+        side_effect=MoneybirdAPIError(500, "Oops", "get", "model_with_validators/1"),
+    )
+    with pytest.raises(MoneybirdAPIError):
+        ModelWithValidator.find_many([1])
@@ -0,0 +1,170 @@
+import asyncio
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+from pytest_mock import MockType
+
+import moneysnake.client as client
+from moneysnake.client import (
+    MoneybirdClient,
+    current_client,
+    default_client,
+    make_request,
+)
+from moneysnake.contact import Contact
+from moneysnake.exceptions import MoneybirdAPIError
+from moneysnake.model import BoundModel
+from moneysnake.sales_invoice import SalesInvoice
+
+
+def _echo_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Respond with the URL and token each request was sent with."""
+    token = kwargs["headers"]["Authorization"]
+    return httpx.Response(
+        200,
+        json={"id": 1, "reference": url, "language": token, "city": token},
+        request=httpx.Request(method, url),
+    )
+
+
+@pytest.fixture(name="tenant_a")
+def fixture_tenant_a():
+    with MoneybirdClient(admin_id=111, token="token-a") as c:
+        yield c
+
+
+@pytest.fixture(name="tenant_b")
+def fixture_tenant_b():
+    with MoneybirdClient(admin_id=222, token="token-b", max_retries=0) as c:
+        yield c
+
+
+def test_default_client_reads_module_settings():
+    original = client.admin_id_
+    try:
+        client.set_admin_id(42)
+        assert current_client() is default_client
+        assert default_client.admin_id == 42
+        assert default_client.pool is client.connection_pool()
+    finally:
+        client.admin_id_ = original
+
+
+def test_bind_routes_requests(mocker: MockType, tenant_a: MoneybirdClient):
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request", side_effect=_echo_request
+    )
+    with tenant_a.bind():
+        assert current_client() is tenant_a
+        make_request("contacts/1", method="get")
+    assert current_client() is default_client
+    args, kwargs = mock_request.call_args
+    assert args[1] == "https://moneybird.com/api/v2/111/contacts/1"
+    assert kwargs["headers"]["Authorization"] == "Bearer token-a"
+
+
+def test_client_kwarg_on_classmethod(mocker: MockType, tenant_a: MoneybirdClient):
+    mocker.patch("moneysnake.client.httpx.Client.request", side_effect=_echo_request)
+    invoice = SalesInvoice.find_by_id(1, client=tenant_a)
+    assert invoice.reference == "https://moneybird.com/api/v2/111/sales_invoices/1"
+
+
+def test_models_remember_their_client(mocker: MockType, tenant_a: MoneybirdClient):
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request", side_effect=_echo_request
+    )
+    invoice = SalesInvoice.find_by_id(1, client=tenant_a)
+    invoice.save()  # called outside of any bind()
+    args, _ = mock_request.call_args
+    assert args[0] == "patch"
+    assert args[1] == "https://moneybird.com/api/v2/111/sales_invoices/1"
+
+
+def test_models_with_a_client_can_be_copied_and_pickled(
+    mocker: MockType, tenant_a: MoneybirdClient
+):
+    mocker.patch(
+        "moneysnake.client.httpx.Client.request", side_effect=_echo_request
+    )
+    invoice = SalesInvoice.find_by_id(1, client=tenant_a)
+
+    assert invoice.model_copy(deep=True)._client is tenant_a
+    assert copy.deepcopy(invoice)._client is tenant_a
+    unpickled = pickle.loads(pickle.dumps(invoice))
+    assert unpickled.reference == invoice.reference
+    assert unpickled._client is None
+    with pytest.raises(TypeError, match="cannot be pickled"):
+        pickle.dumps(tenant_a)
+
+
+def test_bound_model_proxy(mocker: MockType, tenant_b: MoneybirdClient):
+    mock_paginate = mocker.patch(
+        "moneysnake.sales_invoice.paginate", return_value=[{"id": 1}]
+    )
+    bound = tenant_b.SalesInvoice
+    assert isinstance(bound, BoundModel)
+    invoices = bound.list_all(state="open")
+    assert invoices[0]._client is tenant_b
+    mock_paginate.assert_called_once_with(
+        "sales_invoices",
+        params={"filter": "state:open"},
+        decode=SalesInvoice._validate_page,
+    )
+    assert tenant_b.Contact(company_name="Acme")._client is tenant_b
+
+
+def test_unknown_attribute_raises(tenant_a: MoneybirdClient):
+    with pytest.raises(AttributeError):
+        tenant_a.NotAModel
+    with pytest.raises(AttributeError):
+        tenant_a.make_request_typo
+
+
+def test_concurrent_tenants_in_threads(
+    mocker: MockType, tenant_a: MoneybirdClient, tenant_b: MoneybirdClient
+):
+    mocker.patch("moneysnake.client.httpx.Client.request", side_effect=_echo_request)
+
+    def work(c: MoneybirdClient, id: int) -> str | None:
+        return Contact.find_by_id(id, client=c).city
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = list(pool.map(work, [tenant_a, tenant_b] * 20, range(40)))
+    assert tokens == ["Bearer token-a", "Bearer token-b"] * 20
+
+
+def test_concurrent_tenants_in_tasks(
+    mocker: MockType, tenant_a: MoneybirdClient, tenant_b: MoneybirdClient
+):
+    async def echo(method: str, url: str, **kwargs: Any) -> httpx.Response:
+        await asyncio.sleep(0)
+        return _echo_request(method, url, **kwargs)
+
+    mocker.patch("moneysnake.client.httpx.AsyncClient.request", side_effect=echo)
+
+    async def run() -> list[Any]:
+        return await asyncio.gather(
+            *(
+                Contact.afind_by_id(i, client=c)
+                for i, c in enumerate([tenant_a, tenant_b] * 10)
+            )
+        )
+
+    contacts = asyncio.run(run())
+    assert [c.city for c in contacts] == ["Bearer token-a", "Bearer token-b"] * 10
+
+
+def test_client_retry_policy(mocker: MockType, tenant_b: MoneybirdClient):
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        return_value=httpx.Response(
+            500, request=httpx.Request("GET", "https://example.com")
+        ),
+    )
+    with pytest.raises(MoneybirdAPIError):
+        tenant_b.make_request("contacts/1", method="get")
+    assert mock_request.call_count == 1  # max_retries=0 on this client
@@ -1,11 +1,24 @@
+import asyncio
+import threading
+import time
+
+import httpx
 from pytest_mock import MockType
-from moneysnake.client import paginate
+
+from moneysnake.client import (
+    MoneybirdClient,
+    Page,
+    apaginate,
+    current_client,
+    paginate,
+)
+from moneysnake.sales_invoice import SalesInvoice
 
 
 def test_paginate_single_page(mocker: MockType):
     """When results fit in one page, return them all."""
     mock_get = mocker.patch(
-        "moneysnake.client.http_get", return_value=[{"id": 1}, {"id": 2}]
+        "moneysnake.client._fetch_page", return_value=Page([{"id": 1}, {"id": 2}])
     )
 
     results = paginate("contacts", per_page=100)
@@ -16,9 +29,9 @@ def test_paginate_single_page(mocker: MockType):
 
 def test_paginate_multiple_pages(mocker: MockType):
     """When first page is full, fetch next page."""
-    page1 = [{"id": i} for i in range(3)]
-    page2 = [{"id": 3}]
-    mock_get = mocker.patch("moneysnake.client.http_get", side_effect=[page1, page2])
+    page1 = Page([{"id": i} for i in range(3)])
+    page2 = Page([{"id": 3}])
+    mock_get = mocker.patch("moneysnake.client._fetch_page", side_effect=[page1, page2])
 
     results = paginate("contacts", per_page=3)
 
@@ -28,7 +41,7 @@ def test_paginate_multiple_pages(mocker: MockType):
 
 def test_paginate_empty_result(mocker: MockType):
     """Empty list returns empty."""
-    mocker.patch("moneysnake.client.http_get", return_value=[])
+    mocker.patch("moneysnake.client._fetch_page", return_value=Page([]))
 
     results = paginate("contacts")
 
@@ -36,22 +49,158 @@ def test_paginate_empty_result(mocker: MockType):
 
 
 def test_paginate_passes_params(mocker: MockType):
-    """Extra params are forwarded to http_get."""
-    mocker.patch("moneysnake.client.http_get", return_value=[])
+    """Extra params are forwarded to each page request."""
+    mock_get = mocker.patch("moneysnake.client._fetch_page", return_value=Page([]))
 
     paginate("contacts", params={"filter": "name:test"}, per_page=50)
 
-    from moneysnake.client import http_get
-
-    http_get.assert_called_once_with(
+    mock_get.assert_called_once_with(
         "contacts", params={"filter": "name:test", "per_page": 50, "page": 1}
     )
 
 
 def test_paginate_non_list_response(mocker: MockType):
     """If API returns a non-list, wrap it."""
-    mocker.patch("moneysnake.client.http_get", return_value={"id": 1})
+    mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        return_value=httpx.Response(
+            200, json={"id": 1}, request=httpx.Request("GET", "https://example.com")
+        ),
+    )
 
     results = paginate("contacts")
 
     assert results == [{"id": 1}]
+
+
+def test_decode_validates_pages_from_bytes(mocker: MockType):
+    """With ``decode``, list pages go straight from bytes to models."""
+    mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[
+            httpx.Response(
+                200,
+                content=b'[{"id": "1", "reference": "a"}, {"id": 2}]',
+                request=httpx.Request("GET", "https://example.com"),
+            ),
+            httpx.Response(
+                200, json={"id": 3}, request=httpx.Request("GET", "https://example.com")
+            ),
+        ],
+    )
+    tenant = MoneybirdClient(admin_id=7, token="t")
+    with tenant.bind():
+        invoices = SalesInvoice.list_all()
+        single = paginate("contacts", decode=SalesInvoice._validate_page)
+
+    assert [invoice.id for invoice in invoices] == [1, 2]
+    assert invoices[0].reference == "a"
+    assert invoices[0]._client is tenant
+    assert single == [{"id": 3}]
+
+
+def _full_page_with_link(link: str | None) -> httpx.Response:
+    headers = {"Link": link} if link is not None else {}
+    return httpx.Response(
+        200,
+        json=[{"id": 1}, {"id": 2}],
+        headers=headers,
+        request=httpx.Request("GET", "https://example.com"),
+    )
+
+
+def test_link_header_without_next_skips_empty_request(mocker: MockType):
+    """A full last page with a Link header but no rel=next ends pagination."""
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[
+            _full_page_with_link('<https://example.com?page=2>; rel="next"'),
+            _full_page_with_link('<https://example.com?page=1>; rel="prev"'),
+        ],
+    )
+
+    results = paginate("contacts", per_page=2)
+
+    assert len(results) == 4
+    assert mock_request.call_count == 2
+
+
+def test_without_link_header_full_page_fetches_next(mocker: MockType):
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[_full_page_with_link(None), _full_page_with_link(None)]
+        + [
+            httpx.Response(
+                200, json=[], request=httpx.Request("GET", "https://example.com")
+            )
+        ],
+    )
+
+    assert len(paginate("contacts", per_page=2)) == 4
+    assert mock_request.call_count == 3
+
+
+def _fake_pages(total: int, per_page: int):
+    """Serve ``total`` records, with later pages answering faster."""
+    calls: list[int] = []
+    lock = threading.Lock()
+
+    def fetch(path: str, params: dict) -> Page:
+        page = params["page"]
+        with lock:
+            calls.append(page)
+        time.sleep(0.02 / page)
+        start = (page - 1) * per_page
+        return Page([{"id": i} for i in range(start, min(start + per_page, total))])
+
+    return fetch, calls
+
+
+def test_concurrent_paginate_keeps_order(mocker: MockType):
+    fetch, calls = _fake_pages(total=25, per_page=5)
+    mocker.patch("moneysnake.client._fetch_page", side_effect=fetch)
+
+    results = paginate("contacts", per_page=5, concurrency=4)
+
+    assert [r["id"] for r in results] == list(range(25))
+    # Page 6 is the empty terminator; anything beyond it is bounded by the window.
+    assert 6 in calls
+    assert max(calls) <= 6 + 3
+
+
+def test_concurrent_paginate_stops_at_short_page(mocker: MockType):
+    fetch, calls = _fake_pages(total=7, per_page=5)
+    mocker.patch("moneysnake.client._fetch_page", side_effect=fetch)
+
+    results = paginate("contacts", per_page=5, concurrency=3)
+
+    assert [r["id"] for r in results] == list(range(7))
+    assert max(calls) <= 2 + 2
+
+
+def test_concurrent_paginate_uses_bound_client(mocker: MockType):
+    seen: list[int] = []
+
+    def fetch(path: str, params: dict) -> Page:
+        seen.append(current_client().admin_id)
+        return Page([{"id": 1}] if params["page"] == 1 else [])
+
+    mocker.patch("moneysnake.client._fetch_page", side_effect=fetch)
+    tenant = MoneybirdClient(admin_id=77, token="t")
+
+    tenant.paginate("contacts", per_page=1, concurrency=3)
+
+    assert seen and set(seen) == {77}
+
+
+def test_apaginate_concurrent_keeps_order(mocker: MockType):
+    async def fetch(path: str, params: dict) -> Page:
+        await asyncio.sleep(0.01 / params["page"])
+        page = params["page"]
+        return Page([{"id": page}] if page <= 5 else [])
+
+    mocker.patch("moneysnake.client._afetch_page", side_effect=fetch)
+
+    results = asyncio.run(apaginate("contacts", per_page=1, concurrency=4))
+
+    assert [r["id"] for r in results] == [1, 2, 3, 4, 5]
@@ -121,6 +121,23 @@ def test_delete_detail_sends_destroy_on_save(
     assert invoice._destroyed_detail_ids == []
 
 
+def test_update_sends_only_changed_details(
+    mocker: MockType, document_data: dict[str, Any]
+):
+    mocker.patch("moneysnake.document.http_get", return_value=document_data)
+    mock_patch = mocker.patch(
+        "moneysnake.document.http_patch", return_value=document_data
+    )
+    invoice = PurchaseInvoice.find_by_id(document_data["id"])
+    invoice.update_detail(480487019122788274, {"description": "Paper"})
+    invoice.save()
+
+    sent = mock_patch.call_args[1]["data"]["purchase_invoice"]
+    assert sent == {
+        "details_attributes": [{"id": 480487019122788274, "description": "Paper"}]
+    }
+
+
 def test_delete_detail_destroy_cleared_only_after_successful_save(
     mocker: MockType, document_data: dict[str, Any]
 ):
@@ -241,7 +258,11 @@ def test_list_all_no_filters(mocker: MockType, document_data: dict[str, Any]):
     mock_paginate.return_value = [document_data]
     invoices = PurchaseInvoice.list_all()
     assert len(invoices) == 1
-    mock_paginate.assert_called_once_with("documents/purchase_invoices", params=None)
+    mock_paginate.assert_called_once_with(
+        "documents/purchase_invoices",
+        params=None,
+        decode=PurchaseInvoice._validate_page,
+    )
 
 
 
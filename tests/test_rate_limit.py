@@ -0,0 +1,118 @@
+import asyncio
+
+import httpx
+import pytest
+from pytest_mock import MockType
+
+import moneysnake.client as client
+from moneysnake.client import MoneybirdClient, make_request, set_rate_limiter
+from moneysnake.rate_limit import RateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(mocker: MockType) -> FakeClock:
+    clock = FakeClock()
+    mocker.patch("moneysnake.rate_limit.time.monotonic", side_effect=clock.monotonic)
+    mocker.patch("moneysnake.rate_limit.time.sleep", side_effect=clock.sleep)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limiter():
+    yield
+    client.rate_limiter_ = None
+
+
+def test_burst_is_not_delayed(clock: FakeClock):
+    limiter = RateLimiter(requests=10, period=10)
+    for _ in range(10):
+        limiter.acquire()
+    assert clock.now == 1000.0
+
+
+def test_requests_paced_once_bucket_is_empty(clock: FakeClock):
+    limiter = RateLimiter(requests=2, period=10, burst=1)
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.now == pytest.approx(1005.0)
+    limiter.acquire()
+    assert clock.now == pytest.approx(1010.0)
+
+
+def test_tokens_refill_over_time(clock: FakeClock):
+    limiter = RateLimiter(requests=1, period=1, burst=1)
+    limiter.acquire()
+    clock.now += 5
+    limiter.acquire()
+    assert clock.now == pytest.approx(1005.0)
+
+
+def test_reservations_are_spread_out(clock: FakeClock):
+    limiter = RateLimiter(requests=1, period=2, burst=1)
+    waits = [limiter._reserve() for _ in range(4)]
+    assert waits == pytest.approx([0.0, 2.0, 4.0, 6.0])
+
+
+def test_penalize_holds_back_until_reset(clock: FakeClock):
+    limiter = RateLimiter(requests=10, period=10)
+    limiter.penalize(30)
+    limiter.acquire()
+    assert clock.now == pytest.approx(1031.0)
+
+
+def test_aacquire_uses_asyncio_sleep(clock: FakeClock, mocker: MockType):
+    mock_sleep = mocker.patch("moneysnake.rate_limit.asyncio.sleep")
+    limiter = RateLimiter(requests=1, period=3, burst=1)
+    asyncio.run(limiter.aacquire())
+    asyncio.run(limiter.aacquire())
+    mock_sleep.assert_awaited_once_with(pytest.approx(3.0))
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        RateLimiter(requests=0)
+
+
+def test_make_request_acquires_and_penalizes_on_429(mocker: MockType):
+    limiter = RateLimiter()
+    mock_acquire = mocker.patch.object(limiter, "acquire")
+    mock_penalize = mocker.patch.object(limiter, "penalize")
+    mocker.patch("moneysnake.client.time.sleep")
+    request = httpx.Request("GET", "https://example.com")
+    mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "7"}, request=request),
+            httpx.Response(200, json={"id": 1}, request=request),
+        ],
+    )
+    set_rate_limiter(limiter)
+    assert make_request("contacts/1", method="get") == {"id": 1}
+    assert mock_acquire.call_count == 2
+    mock_penalize.assert_called_once_with(7)
+
+
+def test_client_owns_its_limiter(mocker: MockType):
+    limiter = RateLimiter()
+    mock_acquire = mocker.patch.object(limiter, "acquire")
+    mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        return_value=httpx.Response(
+            200, json={}, request=httpx.Request("GET", "https://example.com")
+        ),
+    )
+    tenant = MoneybirdClient(admin_id=1, token="t", rate_limiter=limiter)
+    tenant.make_request("contacts", method="get")
+    make_request("contacts", method="get")
+    assert mock_acquire.call_count == 1
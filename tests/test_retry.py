@@ -45,7 +45,7 @@ class TestRetryOn429:
             _make_response(200, json_data={"id": 1}),
         ]
         mock_request = mocker.patch(
-            "moneysnake.client.httpx.request", side_effect=responses
+            "moneysnake.client.httpx.Client.request", side_effect=responses
         )
         result = make_request("contacts/1", method="get")
         assert result == {"id": 1}
@@ -58,7 +58,7 @@ class TestRetryOn429:
             _make_response(429, headers={"Retry-After": "0"}),
             _make_response(429),
         ]
-        mocker.patch("moneysnake.client.httpx.request", side_effect=responses)
+        mocker.patch("moneysnake.client.httpx.Client.request", side_effect=responses)
         with pytest.raises(MoneybirdRateLimitError):
             make_request("contacts/1", method="get")
 
@@ -72,7 +72,7 @@ class TestRetryOn5xx:
             _make_response(200, json_data={"id": 1}),
         ]
         mock_request = mocker.patch(
-            "moneysnake.client.httpx.request", side_effect=responses
+            "moneysnake.client.httpx.Client.request", side_effect=responses
         )
         result = make_request("contacts/1", method="get")
         assert result == {"id": 1}
@@ -85,7 +85,7 @@ class TestRetryOn5xx:
             _make_response(502),
             _make_response(200, json_data={"ok": True}),
         ]
-        mocker.patch("moneysnake.client.httpx.request", side_effect=responses)
+        mocker.patch("moneysnake.client.httpx.Client.request", side_effect=responses)
         result = make_request("test", method="get")
         assert result == {"ok": True}
 
@@ -96,7 +96,7 @@ class TestRetryOn5xx:
             _make_response(500),
             _make_response(500),
         ]
-        mocker.patch("moneysnake.client.httpx.request", side_effect=responses)
+        mocker.patch("moneysnake.client.httpx.Client.request", side_effect=responses)
         with pytest.raises(MoneybirdAPIError) as exc_info:
             make_request("contacts/1", method="get")
         assert exc_info.value.status_code == 500
@@ -106,7 +106,7 @@ class TestNoRetryOnMutating5xx:
     def test_post_500_not_retried(self, mocker: MockType):
         set_max_retries(3)
         mock_request = mocker.patch(
-            "moneysnake.client.httpx.request",
+            "moneysnake.client.httpx.Client.request",
             return_value=_make_response(500),
         )
         with pytest.raises(MoneybirdAPIError):
@@ -116,7 +116,7 @@ class TestNoRetryOnMutating5xx:
     def test_patch_502_not_retried(self, mocker: MockType):
         set_max_retries(3)
         mock_request = mocker.patch(
-            "moneysnake.client.httpx.request",
+            "moneysnake.client.httpx.Client.request",
             return_value=_make_response(502),
         )
         with pytest.raises(MoneybirdAPIError):
@@ -132,7 +132,7 @@ class TestNoRetryOnMutating5xx:
             _make_response(200, json_data={"id": 1}),
         ]
         mock_request = mocker.patch(
-            "moneysnake.client.httpx.request", side_effect=responses
+            "moneysnake.client.httpx.Client.request", side_effect=responses
         )
         result = make_request("contacts", method="post", data={"name": "test"})
         assert result == {"id": 1}
@@ -143,7 +143,7 @@ class TestNoRetryOnClientErrors:
     def test_404_not_retried(self, mocker: MockType):
         set_max_retries(3)
         mock_request = mocker.patch(
-            "moneysnake.client.httpx.request",
+            "moneysnake.client.httpx.Client.request",
             return_value=_make_response(404),
         )
         with pytest.raises(MoneybirdNotFoundError):
@@ -153,7 +153,7 @@ class TestNoRetryOnClientErrors:
     def test_422_not_retried(self, mocker: MockType):
         set_max_retries(3)
         mock_request = mocker.patch(
-            "moneysnake.client.httpx.request",
+            "moneysnake.client.httpx.Client.request",
             return_value=_make_response(422),
         )
         with pytest.raises(MoneybirdAPIError):
@@ -171,7 +171,7 @@ class TestRetryBackoff:
             _make_response(500),
             _make_response(200, json_data={"id": 1}),
         ]
-        mocker.patch("moneysnake.client.httpx.request", side_effect=responses)
+        mocker.patch("moneysnake.client.httpx.Client.request", side_effect=responses)
         make_request("test", method="get")
         delays = [call.args[0] for call in mock_sleep.call_args_list]
         assert delays == [1, 2, 4]  # 2^0, 2^1, 2^2
@@ -183,7 +183,7 @@ class TestRetryBackoff:
             _make_response(429, headers={"Retry-After": "5"}),
             _make_response(200, json_data={"ok": True}),
         ]
-        mocker.patch("moneysnake.client.httpx.request", side_effect=responses)
+        mocker.patch("moneysnake.client.httpx.Client.request", side_effect=responses)
         make_request("test", method="get")
         assert mock_sleep.call_args[0][0] == 5
 
@@ -197,7 +197,7 @@ class TestRetryBackoff:
             _make_response(429, headers={"Retry-After": "1700000005"}),
             _make_response(200, json_data={"ok": True}),
         ]
-        mocker.patch("moneysnake.client.httpx.request", side_effect=responses)
+        mocker.patch("moneysnake.client.httpx.Client.request", side_effect=responses)
         make_request("test", method="get")
         assert mock_sleep.call_args[0][0] == 5
 
@@ -210,7 +210,7 @@ class TestRetryBackoff:
             _make_response(429, headers={"Retry-After": "1700000000"}),
             _make_response(200, json_data={"ok": True}),
         ]
-        mocker.patch("moneysnake.client.httpx.request", side_effect=responses)
+        mocker.patch("moneysnake.client.httpx.Client.request", side_effect=responses)
         make_request("test", method="get")
         assert mock_sleep.call_args[0][0] == 1
 
@@ -223,7 +223,7 @@ class TestRetryBackoff:
             ),
             _make_response(200, json_data={"ok": True}),
         ]
-        mocker.patch("moneysnake.client.httpx.request", side_effect=responses)
+        mocker.patch("moneysnake.client.httpx.Client.request", side_effect=responses)
         make_request("test", method="get")
         assert mock_sleep.call_args[0][0] == 1  # 2^0 = 1
 
@@ -232,7 +232,7 @@ class TestZeroRetries:
     def test_no_retries_when_max_is_zero(self, mocker: MockType):
         set_max_retries(0)
         mock_request = mocker.patch(
-            "moneysnake.client.httpx.request",
+            "moneysnake.client.httpx.Client.request",
             return_value=_make_response(500),
         )
         with pytest.raises(MoneybirdAPIError):
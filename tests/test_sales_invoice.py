@@ -1,4 +1,5 @@
 from typing import Any
+from pathlib import Path
 
 import pytest
 from pytest_mock import MockType
@@ -186,9 +187,61 @@ def test_update_by_id(mocker: MockType, invoice_data: dict[str, Any]):
     assert invoice.reference == "Updated"
 
 
+def test_update_sends_only_changes(mocker: MockType, invoice_data: dict[str, Any]):
+    mocker.patch("moneysnake.model.http_get", return_value=invoice_data)
+    mock_patch = mocker.patch(
+        "moneysnake.sales_invoice.http_patch", return_value=invoice_data
+    )
+    invoice = SalesInvoice.find_by_id(550000000000000001)
+    invoice.reference = "PO-42"
+    invoice.update_detail(550000000000000100, {"amount": "3"})
+    invoice.add_detail(SalesInvoiceDetailsAttribute(description="Travel", price="25"))
+    not_loaded = SalesInvoice(**invoice.to_dict())
+    assert invoice.payload_size() < not_loaded.payload_size() / 5
+    invoice.save()
+
+    sent = mock_patch.call_args[1]["data"]["sales_invoice"]
+    assert sent == {
+        "reference": "PO-42",
+        "details_attributes": [
+            {"id": 550000000000000100, "amount": "3"},
+            {"description": "Travel", "price": "25"},
+        ],
+    }
+
+
+def test_unchanged_invoice_sends_empty_patch(
+    mocker: MockType, invoice_data: dict[str, Any]
+):
+    mocker.patch("moneysnake.model.http_get", return_value=invoice_data)
+    mock_patch = mocker.patch(
+        "moneysnake.sales_invoice.http_patch", return_value=invoice_data
+    )
+    invoice = SalesInvoice.find_by_id(550000000000000001)
+    invoice.reference = "PO-42"
+    invoice.save()
+    invoice.save()
+    assert mock_patch.call_args[1]["data"] == {"sales_invoice": {}}
+
+
 # --- Detail management ---
 
 
+def test_null_lists_become_empty(invoice_data: dict[str, Any]):
+    invoice = SalesInvoice(**{**invoice_data, "details": None, "payments": None})
+    assert invoice.details == []
+    assert invoice.payments == []
+
+
+def test_nested_models_are_not_rebuilt(invoice_data: dict[str, Any]):
+    detail = SalesInvoiceDetailsAttribute(id=1, description="Work")
+    payment = Payment(id=2, price="10.0")
+    invoice = SalesInvoice(details=[detail, {"id": "3"}], payments=[payment])
+    assert invoice.details[0] is detail
+    assert invoice.details[1].id == 3
+    assert invoice.payments[0] is payment
+
+
 def test_add_detail(invoice_data: dict[str, Any]):
     invoice = SalesInvoice(**invoice_data)
     detail = SalesInvoiceDetailsAttribute(
@@ -296,6 +349,21 @@ def test_send_invoice(mocker: MockType, invoice_data: dict[str, Any]):
     assert call_data["sales_invoice_sending"]["delivery_method"] == "Email"
 
 
+def test_save_after_action_sends_only_local_changes(
+    mocker: MockType, invoice_data: dict[str, Any]
+):
+    mocker.patch("moneysnake.model.http_get", return_value=invoice_data)
+    sent = {**invoice_data, "state": "open", "sent_at": "2026-03-31"}
+    mock_patch = mocker.patch(
+        "moneysnake.sales_invoice.http_patch", side_effect=[sent, sent]
+    )
+    invoice = SalesInvoice.find_by_id(invoice_data["id"])
+    invoice.send_invoice()
+    invoice.reference = "PO-2"
+    invoice.save()
+    assert mock_patch.call_args[1]["data"] == {"sales_invoice": {"reference": "PO-2"}}
+
+
 def test_send_invoice_no_options(mocker: MockType, invoice_data: dict[str, Any]):
     mock_patch = mocker.patch("moneysnake.sales_invoice.http_patch")
     mock_patch.return_value = {**invoice_data, "state": "open"}
@@ -380,6 +448,30 @@ def test_download_ubl(mocker: MockType, invoice_data: dict[str, Any]):
     assert result == b"<xml>ubl</xml>"
 
 
+def test_sales_invoice_download_pdf_to(
+    mocker: MockType, invoice_data: dict[str, Any], tmp_path: Path
+):
+    mock_download = mocker.patch(
+        "moneysnake.sales_invoice.http_download", return_value=8
+    )
+    invoice = SalesInvoice(**invoice_data)
+    assert invoice.download_pdf_to(tmp_path / "invoice.pdf") == 8
+    mock_download.assert_called_once_with(
+        "sales_invoices/550000000000000001/download_pdf", tmp_path / "invoice.pdf"
+    )
+
+
+def test_sales_invoice_iter_ubl(mocker: MockType, invoice_data: dict[str, Any]):
+    mock_iter = mocker.patch(
+        "moneysnake.sales_invoice.http_iter_bytes", return_value=iter([b"<xml>", b"ubl"])
+    )
+    invoice = SalesInvoice(**invoice_data)
+    assert list(invoice.iter_ubl(chunk_size=4)) == [b"<xml>", b"ubl"]
+    mock_iter.assert_called_once_with(
+        "sales_invoices/550000000000000001/download_ubl", 4
+    )
+
+
 # --- Lookup helpers ---
 
 
@@ -398,7 +490,9 @@ def test_list_all_no_filters(mocker: MockType, invoice_data: dict[str, Any]):
     mock_paginate.return_value = [invoice_data]
     invoices = SalesInvoice.list_all()
     assert len(invoices) == 1
-    mock_paginate.assert_called_once_with("sales_invoices", params=None)
+    mock_paginate.assert_called_once_with(
+        "sales_invoices", params=None, decode=SalesInvoice._validate_page
+    )
 
 
 def test_find_by_invoice_id(mocker: MockType, invoice_data: dict[str, Any]):
@@ -450,3 +544,25 @@ def test_save_with_custom_fields(mocker: MockType, invoice_data: dict[str, Any])
 def test_endpoint_is_sales_invoice():
     invoice = SalesInvoice()
     assert invoice.endpoint == "sales_invoice"
+
+
+def test_list_rows(mocker: MockType):
+    content = b'[{"id": "1", "state": "open", "total_unpaid": "12.1", "payments": []}]'
+    mocker.patch(
+        "moneysnake.sales_invoice.paginate",
+        side_effect=lambda path, params, decode: decode(content),
+    )
+    (row,) = SalesInvoice.list_rows(["id", "state", "total_unpaid"], state="open")
+    assert row == (1, "open", "12.1")
+    assert (row.id, row.state, row.total_unpaid) == (1, "open", "12.1")
+    assert type(row).__name__ == "SalesInvoiceRow"
+
+
+def test_iter_rows(mocker: MockType):
+    pages = [b'[{"id": "1", "state": "open"}]', b'[{"id": "2", "state": "paid"}]']
+    mocker.patch(
+        "moneysnake.sales_invoice.iter_pages",
+        side_effect=lambda path, params, concurrency, decode: map(decode, pages),
+    )
+    rows = SalesInvoice.iter_rows(["id", "state"], concurrency=2)
+    assert list(rows) == [(1, "open"), (2, "paid")]
@@ -0,0 +1,166 @@
+from typing import Any
+
+import pytest
+from pytest_mock import MockType
+
+from moneysnake.contact import Contact
+from moneysnake.exceptions import MoneybirdAPIError
+from moneysnake.model import refresh_stale
+from moneysnake.purchase_invoice import PurchaseInvoice
+from moneysnake.session import Session, current_session
+
+
+def test_session_is_only_active_inside_block():
+    assert current_session() is None
+    with Session() as session:
+        assert current_session() is session
+    assert current_session() is None
+
+
+def test_find_by_id_is_served_from_session(
+    mocker: MockType, contact_data: dict[str, Any]
+):
+    mock_get = mocker.patch("moneysnake.model.http_get", return_value=contact_data)
+    with Session() as session:
+        first = Contact.find_by_id(433546185192506620)
+        second = Contact.find_by_id(433546185192506620)
+        reloaded = Contact()
+        reloaded.load(433546185192506620)
+    assert first is second
+    assert reloaded.company_name == first.company_name
+    assert mock_get.call_count == 1
+    assert session.hits == 2
+
+
+def test_without_session_every_call_is_a_request(
+    mocker: MockType, contact_data: dict[str, Any]
+):
+    mock_get = mocker.patch("moneysnake.model.http_get", return_value=contact_data)
+    Contact.find_by_id(1)
+    Contact.find_by_id(1)
+    assert mock_get.call_count == 2
+
+
+def test_documents_use_session(mocker: MockType, document_data: dict[str, Any]):
+    mock_get = mocker.patch("moneysnake.document.http_get", return_value=document_data)
+    with Session():
+        first = PurchaseInvoice.find_by_id(document_data["id"])
+        assert PurchaseInvoice.find_by_id(document_data["id"]) is first
+    assert mock_get.call_count == 1
+
+
+def test_sync_fetch_only_requests_unknown_ids(mocker: MockType):
+    mock_post = mocker.patch(
+        "moneysnake.model.http_post",
+        side_effect=lambda path, data: [{"id": id} for id in data["ids"]],
+    )
+    with Session():
+        first = Contact.sync_fetch([1, 2])
+        second = Contact.sync_fetch([2, 3])
+        third = Contact.sync_fetch([1, 3])
+    assert second[0] is first[1]
+    assert {c.id for c in third} == {1, 3}
+    assert [call.kwargs["data"]["ids"] for call in mock_post.call_args_list] == [
+        [1, 2],
+        [3],
+    ]
+
+
+def test_sync_fetch_all_bypasses_session(mocker: MockType):
+    mock_post = mocker.patch(
+        "moneysnake.model.http_post",
+        side_effect=[[{"id": 1, "version": 5}], [{"id": 1, "version": 6}]],
+    )
+    with Session() as session:
+        [cached] = Contact.sync_fetch([1])
+        fetched = Contact.sync_fetch_all([1])
+        assert session.get(Contact, 1) is fetched.records[1]
+    assert cached.version == 5
+    assert fetched.records[1].version == 6
+    assert mock_post.call_count == 2
+
+
+def test_refresh_stale_in_session_fetches_fresh_records(mocker: MockType):
+    mocker.patch("moneysnake.model.paginate", return_value=[{"id": 1, "version": 6}])
+    mocker.patch(
+        "moneysnake.model.http_post",
+        side_effect=[[{"id": 1, "version": 5}], [{"id": 1, "version": 6}]],
+    )
+    with Session():
+        [contact] = Contact.sync_fetch([1])
+        result = refresh_stale([contact])
+    assert result.refreshed == [contact]
+    assert contact.version == 6
+
+
+def test_loaded_model_does_not_share_nested_values(
+    mocker: MockType, contact_data: dict[str, Any]
+):
+    mocker.patch("moneysnake.model.http_get", return_value=contact_data)
+    with Session():
+        cached = Contact.find_by_id(433546185192506620)
+        reloaded = Contact()
+        reloaded.load(433546185192506620)
+    assert cached.contact_people and reloaded.contact_people
+    assert reloaded.contact_people is not cached.contact_people
+    reloaded.contact_people[0].firstname = "Jane"
+    assert cached.contact_people[0].firstname == "John"
+
+
+def test_lru_eviction():
+    session = Session(max_size=2)
+    contacts = [Contact(id=id) for id in (1, 2, 3)]
+    for contact in contacts:
+        session.add(contact)
+    assert len(session) == 2
+    assert session.get(Contact, 1) is None
+    assert session.get(Contact, 3) is contacts[2]
+
+
+def test_writes_are_queued_until_commit(mocker: MockType):
+    mock_patch = mocker.patch("moneysnake.model.http_patch", return_value={})
+    mock_delete = mocker.patch("moneysnake.model.http_delete")
+    with Session() as session:
+        contact = Contact(id=1, city="Utrecht")
+        contact.save()
+        contact.save()
+        doomed = Contact(id=2)
+        doomed.save()
+        doomed.delete()
+        assert len(session.pending) == 2
+        mock_patch.assert_not_called()
+    mock_patch.assert_called_once()
+    mock_delete.assert_called_once_with("contacts/2")
+    assert doomed.id is None
+    assert session.pending == []
+
+
+def test_exception_discards_queued_writes(mocker: MockType):
+    mock_patch = mocker.patch("moneysnake.model.http_patch")
+    with pytest.raises(RuntimeError), Session() as session:
+        Contact(id=1).save()
+        raise RuntimeError("abort")
+    mock_patch.assert_not_called()
+    assert session.pending == []
+
+
+def test_failed_writes_stay_queued(mocker: MockType):
+    def patch(path: str, data: dict[str, Any]) -> dict[str, Any]:
+        if path == "contacts/2":
+            raise MoneybirdAPIError(422, "Invalid", "patch", path)
+        return {}
+
+    mocker.patch("moneysnake.model.http_patch", side_effect=patch)
+    session = Session(max_workers=2)
+    with pytest.raises(ExceptionGroup) as exc_info, session:
+        for id in (1, 2, 3):
+            Contact(id=id).save()
+    assert len(exc_info.value.exceptions) == 1
+    assert [model.id for _, model in session.pending] == [2]
+
+
+def test_immediate_writes(mocker: MockType):
+    mock_patch = mocker.patch("moneysnake.model.http_patch", return_value={})
+    with Session(defer_writes=False):
+        Contact(id=1).save()
+        mock_patch.assert_called_once()
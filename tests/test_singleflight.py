@@ -0,0 +1,226 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+from pytest_mock import MockType
+
+import moneysnake.client as client
+from moneysnake.client import MoneybirdClient, amake_request, http_get, http_patch
+from moneysnake.exceptions import MoneybirdNotFoundError
+from moneysnake.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _response(status_code: int, json_data: Any = None) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        json=json_data,
+        request=httpx.Request("GET", "https://example.com"),
+    )
+
+
+def _concurrently(count: int, func: Any) -> list[Any]:
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(func) for _ in range(count)]
+    return [future.exception() or future.result() for future in futures]
+
+
+@pytest.fixture(name="coalesce_gets", autouse=True)
+def fixture_coalesce_gets():
+    client.set_coalesce_gets(True)
+    yield
+    client.set_coalesce_gets(False)
+
+
+@pytest.fixture(name="slow_request")
+def fixture_slow_request(mocker: MockType):
+    """Mocked request that holds the first call until the others joined it."""
+    release = threading.Event()
+    threading.Timer(0.1, release.set).start()
+    responses: list[httpx.Response] = []
+
+    def request(*args: Any, **kwargs: Any) -> httpx.Response:
+        release.wait(timeout=5)
+        return responses.pop(0)
+
+    mock = mocker.patch("moneysnake.client.httpx.Client.request", side_effect=request)
+    mock.responses = responses
+    return mock
+
+
+def test_threads_share_one_request(slow_request: MockType):
+    slow_request.responses.append(_response(200, {"id": 1}))
+
+    results = _concurrently(8, lambda: http_get("contacts/1"))
+
+    assert results == [{"id": 1}] * 8
+    assert slow_request.call_count == 1
+
+
+def test_threads_share_the_exception(slow_request: MockType):
+    slow_request.responses.append(_response(404, {"error": "Not found"}))
+
+    results = _concurrently(4, lambda: http_get("contacts/999"))
+
+    assert all(isinstance(result, MoneybirdNotFoundError) for result in results)
+    assert slow_request.call_count == 1
+
+
+def test_sequential_requests_are_not_coalesced(mocker: MockType):
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        return_value=_response(200, {"id": 1}),
+    )
+    http_get("contacts/1")
+    http_get("contacts/1")
+    assert mock_request.call_count == 2
+
+
+def test_get_after_a_write_does_not_join_an_earlier_get(mocker: MockType):
+    started, release = threading.Event(), threading.Event()
+    threading.Timer(2, release.set).start()
+    gets = 0
+
+    def request(method: str, *args: Any, **kwargs: Any) -> httpx.Response:
+        nonlocal gets
+        if method.lower() != "get":
+            return _response(200, {"id": 1, "company_name": "new"})
+        gets += 1
+        if gets == 1:
+            started.set()
+            release.wait(timeout=5)
+            return _response(200, {"id": 1, "company_name": "old"})
+        return _response(200, {"id": 1, "company_name": "new"})
+
+    mocker.patch("moneysnake.client.httpx.Client.request", side_effect=request)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        before = executor.submit(http_get, "contacts/1")
+        started.wait(timeout=5)
+        http_patch("contacts/1", data={"contact": {"company_name": "new"}})
+        after = http_get("contacts/1")
+        release.set()
+    assert after["company_name"] == "new"
+    assert before.result()["company_name"] == "old"
+    assert gets == 2
+
+
+def test_clients_do_not_coalesce_by_default():
+    assert not MoneybirdClient(1, "t").coalesce_gets
+
+
+def test_coalesce_only_identical_requests():
+    flight = SingleFlight()
+    started = threading.Barrier(2, timeout=5)
+
+    def call(value: int) -> int:
+        started.wait()
+        return value
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(flight.do, "a", lambda: call(1))
+        second = executor.submit(flight.do, "b", lambda: call(2))
+    assert (first.result(), second.result()) == (1, 2)
+
+
+def test_asyncio_tasks_share_one_request(mocker: MockType):
+    async def request(*args: Any, **kwargs: Any) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return _response(200, {"id": 1})
+
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.AsyncClient.request", side_effect=request
+    )
+
+    async def main() -> list[Any]:
+        return await asyncio.gather(
+            *(amake_request("contacts/1", method="get") for _ in range(10)),
+            amake_request("contacts/2", method="get"),
+        )
+
+    results = asyncio.run(main())
+    assert results == [{"id": 1}] * 11
+    assert mock_request.call_count == 2
+
+
+def test_asyncio_tasks_share_the_exception():
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def fail() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main() -> list[Any]:
+        return await asyncio.gather(
+            *(flight.do("key", fail) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == 1
+
+
+def test_cancelled_follower_does_not_cancel_the_call():
+    flight = AsyncSingleFlight()
+
+    async def slow() -> int:
+        await asyncio.sleep(0.02)
+        return 42
+
+    async def main() -> int:
+        leader = asyncio.create_task(flight.do("key", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", slow))
+        await asyncio.sleep(0)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(main()) == 42
+
+
+def test_cancelled_leader_does_not_cancel_the_followers():
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def slow() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return 42
+
+    async def main() -> list[int]:
+        leader = asyncio.create_task(flight.do("key", slow))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("key", slow)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(main()) == [42, 42]
+    assert calls == 1
+
+
+def test_coalescing_can_be_disabled(mocker: MockType):
+    async def request(*args: Any, **kwargs: Any) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return _response(200, {"id": 1})
+
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.AsyncClient.request", side_effect=request
+    )
+
+    async def main() -> list[Any]:
+        return await asyncio.gather(
+            *(amake_request("contacts/1", method="get") for _ in range(3))
+        )
+
+    client.set_coalesce_gets(False)
+    try:
+        asyncio.run(main())
+    finally:
+        client.set_coalesce_gets(True)
+    assert mock_request.call_count == 3
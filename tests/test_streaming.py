@@ -0,0 +1,155 @@
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+from freezegun import freeze_time
+from pytest_mock import MockType
+
+from moneysnake.client import (
+    MoneybirdClient,
+    Page,
+    PageDecoder,
+    aiter_items,
+    current_client,
+    iter_items,
+    iter_pages,
+)
+from moneysnake.external_sales_invoice import ExternalSalesInvoice
+from moneysnake.financial_mutation import FinancialMutation
+from moneysnake.purchase_invoice import PurchaseInvoice
+from moneysnake.sales_invoice import SalesInvoice
+from moneysnake.tax_rate import TaxRate
+
+
+def _pages(*pages: list[dict[str, Any]]) -> list[Page]:
+    return [Page(items) for items in pages]
+
+
+def _json_pages(*pages: list[dict[str, Any]]) -> Callable[..., Page]:
+    """A _fetch_page that decodes each page from its JSON like the API's."""
+    remaining = iter(pages)
+
+    def fetch(
+        path: str, params: dict[str, Any], decode: PageDecoder | None = None
+    ) -> Page:
+        items = next(remaining)
+        return Page(decode(json.dumps(items).encode()) if decode else items)
+
+    return fetch
+
+
+def test_iter_pages_is_lazy(mocker: MockType):
+    mock_fetch = mocker.patch(
+        "moneysnake.client._fetch_page",
+        side_effect=_pages([{"id": 1}, {"id": 2}], [{"id": 3}]),
+    )
+
+    pages = iter_pages("contacts", per_page=2)
+    assert mock_fetch.call_count == 0
+    assert next(pages) == [{"id": 1}, {"id": 2}]
+    assert mock_fetch.call_count == 1
+    assert list(pages) == [[{"id": 3}]]
+    assert mock_fetch.call_count == 2
+
+
+def test_iter_items_flattens_pages(mocker: MockType):
+    mocker.patch(
+        "moneysnake.client._fetch_page",
+        side_effect=_pages([{"id": 1}, {"id": 2}], []),
+    )
+    assert [item["id"] for item in iter_items("contacts", per_page=2)] == [1, 2]
+
+
+def test_aiter_items(mocker: MockType):
+    mocker.patch(
+        "moneysnake.client._afetch_page",
+        side_effect=_pages([{"id": 1}, {"id": 2}], [{"id": 3}]),
+    )
+
+    async def collect() -> list[Any]:
+        return [item async for item in aiter_items("contacts", per_page=2)]
+
+    assert [item["id"] for item in asyncio.run(collect())] == [1, 2, 3]
+
+
+def test_sales_invoice_iter_all(mocker: MockType):
+    mock_fetch = mocker.patch(
+        "moneysnake.client._fetch_page",
+        side_effect=_json_pages([{"id": 1, "state": "open"}]),
+    )
+
+    invoices = SalesInvoice.iter_all(state="open")
+    invoice = next(invoices)
+
+    assert isinstance(invoice, SalesInvoice)
+    assert invoice.state == "open"
+    mock_fetch.assert_called_once_with(
+        "sales_invoices",
+        params={"filter": "state:open", "per_page": 100, "page": 1},
+        decode=SalesInvoice._validate_page,
+    )
+
+
+def test_document_iter_all(mocker: MockType, document_data: dict[str, Any]):
+    mock_fetch = mocker.patch(
+        "moneysnake.client._fetch_page", side_effect=_json_pages([document_data])
+    )
+
+    invoices = list(PurchaseInvoice.iter_all())
+
+    assert invoices[0].reference == "2026-01234"
+    assert mock_fetch.call_args[0][0] == "documents/purchase_invoices"
+
+
+def test_tax_rate_iter_all_rates(mocker: MockType):
+    mocker.patch(
+        "moneysnake.client._fetch_page",
+        side_effect=_json_pages([{"id": 1, "country": "NL"}]),
+    )
+    assert [rate.country for rate in TaxRate.iter_all_rates()] == ["NL"]
+
+
+def test_external_sales_invoice_iter_all_by_contact_id(mocker: MockType):
+    mock_fetch = mocker.patch(
+        "moneysnake.client._fetch_page", side_effect=_json_pages([{"id": 1}])
+    )
+    invoices = list(ExternalSalesInvoice.iter_all_by_contact_id(5))
+    assert invoices[0].id == 1
+    assert mock_fetch.call_args[1]["params"]["filter"] == (
+        "contact_id:5,state:all,period:this_year"
+    )
+
+
+@freeze_time("2023-10-25")
+def test_financial_mutation_iter_search_defaults_to_today(mocker: MockType):
+    mock_fetch = mocker.patch(
+        "moneysnake.client._fetch_page", side_effect=_json_pages([{"id": 1}])
+    )
+    mutations = list(FinancialMutation.iter_search(query_string="state:open"))
+    assert mutations[0].id == 1
+    assert mock_fetch.call_args[1]["params"]["filter"] == (
+        "state:open,period:20231025..20231025"
+    )
+
+
+def test_iter_all_binds_client_for_whole_iteration(mocker: MockType):
+    seen: list[int] = []
+
+    def fetch(path: str, params: dict[str, Any], decode: PageDecoder) -> Page:
+        seen.append(current_client().admin_id)
+        items = json.dumps([{"id": params["page"]}]).encode()
+        return Page(decode(items), has_next=params["page"] < 2)
+
+    mocker.patch("moneysnake.client._fetch_page", side_effect=fetch)
+    tenant = MoneybirdClient(admin_id=9, token="t")
+
+    invoices = SalesInvoice.iter_all(client=tenant)
+    first = next(invoices)
+    # Between items the caller is not bound to the tenant.
+    assert current_client() is not tenant
+    rest = list(invoices)
+
+    assert [i.id for i in [first, *rest]] == [1, 2]
+    assert seen == [9, 9]
+    assert first._client is tenant
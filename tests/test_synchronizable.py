@@ -1,11 +1,15 @@
+import asyncio
 from typing import Any
 
 import pytest
 from pytest_mock import MockType
 
+from moneysnake.client import MoneybirdClient, current_client
 from moneysnake.contact import Contact
 from moneysnake.external_sales_invoice import ExternalSalesInvoice
 from moneysnake.financial_mutation import FinancialMutation
+from moneysnake.model import refresh_stale
+from moneysnake.purchase_invoice import PurchaseInvoice
 from moneysnake.sales_invoice import SalesInvoice
 
 
@@ -80,6 +84,8 @@ class TestSyncFetch:
         mock_post.assert_called_once_with(
             "contacts/synchronization", data={"ids": [1, 2]}
         )
+        # Bulk results are not snapshotted; saving one sends all its fields.
+        assert result[0]._snapshot is None
 
     def test_sync_fetch_sales_invoices(self, mocker: MockType):
         invoice_data = [{"id": 1, "state": "draft"}, {"id": 2, "state": "open"}]
@@ -101,3 +107,165 @@ class TestSyncFetch:
         mocker.patch("moneysnake.model.http_post", return_value=[])
         result = Contact.sync_fetch([])
         assert result == []
+
+
+def test_sync_diff(mocker: MockType, sync_ids: list[dict[str, Any]]):
+    mocker.patch("moneysnake.model.paginate", return_value=sync_ids)
+    diff = Contact.sync_diff({1: 100, 2: 199, 4: 400})
+    assert diff.changed == [2, 3]
+    assert diff.deleted == [4]
+    assert diff.versions == {1: 100, 2: 200, 3: 300}
+
+
+def test_sync_diff_normalizes_string_versions(mocker: MockType):
+    mocker.patch(
+        "moneysnake.model.paginate",
+        return_value=[
+            {"id": "1", "version": "9"},
+            {"id": "2", "version": "10"},
+            {"id": "3", "version": "v2"},
+        ],
+    )
+    diff = FinancialMutation.sync_diff({1: 9, 2: "9", 3: "v2"})
+    assert diff.changed == [2]
+    assert diff.versions == {1: 9, 2: 10, 3: "v2"}
+
+
+def _echo_existing(deleted: set[int]):
+    """Fake synchronization POST that returns every id not in ``deleted``."""
+
+    def post(path: str, data: dict[str, Any]) -> list[dict[str, Any]]:
+        return [{"id": id} for id in reversed(data["ids"]) if id not in deleted]
+
+    return post
+
+
+class TestSyncFetchAll:
+    def test_batches_keep_input_order(self, mocker: MockType):
+        mock_post = mocker.patch(
+            "moneysnake.model.http_post", side_effect=_echo_existing(set())
+        )
+        ids = list(range(250, 0, -1))
+        result = Contact.sync_fetch_all(ids, max_workers=3)
+        assert list(result.records) == ids
+        assert result.missing == []
+        sizes = [len(call.kwargs["data"]["ids"]) for call in mock_post.call_args_list]
+        assert sorted(sizes) == [50, 100, 100]
+
+    def test_reports_missing_and_skips_duplicates(self, mocker: MockType):
+        mock_post = mocker.patch(
+            "moneysnake.model.http_post", side_effect=_echo_existing({2, 4})
+        )
+        result = Contact.sync_fetch_all([1, 2, 3, 3, "4", 5])
+        assert list(result.records) == [1, 3, 5]
+        assert all(isinstance(r, Contact) for r in result.records.values())
+        assert result.missing == [2, 4]
+        mock_post.assert_called_once_with(
+            "contacts/synchronization", data={"ids": [1, 2, 3, 4, 5]}
+        )
+
+    def test_empty(self, mocker: MockType):
+        mock_post = mocker.patch("moneysnake.model.http_post")
+        result = Contact.sync_fetch_all([])
+        assert result.records == {} and result.missing == []
+        mock_post.assert_not_called()
+
+    def test_workers_use_bound_client(self, mocker: MockType):
+        clients = set()
+
+        def post(path: str, data: dict[str, Any]) -> list[dict[str, Any]]:
+            clients.add(current_client().admin_id)
+            return [{"id": id} for id in data["ids"]]
+
+        mocker.patch("moneysnake.model.http_post", side_effect=post)
+        client = MoneybirdClient(admin_id=42, token="t")
+        result = Contact.sync_fetch_all(range(1, 301), client=client)
+        assert len(result.records) == 300
+        assert clients == {42}
+
+    def test_async(self, mocker: MockType):
+        async def post(path: str, data: dict[str, Any]) -> list[dict[str, Any]]:
+            return _echo_existing({7})(path, data)
+
+        mocker.patch("moneysnake.model.ahttp_post", side_effect=post)
+        result = asyncio.run(Contact.async_sync_fetch_all(range(1, 201)))
+        assert list(result.records) == [id for id in range(1, 201) if id != 7]
+        assert result.missing == [7]
+
+
+def test_find_many_uses_synchronization_endpoint(mocker: MockType):
+    mock_post = mocker.patch(
+        "moneysnake.model.http_post", side_effect=_echo_existing({2})
+    )
+    mock_get = mocker.patch("moneysnake.document.http_get")
+    result = PurchaseInvoice.find_many([1, 2, 3])
+    assert list(result.records) == [1, 3]
+    assert result.missing == [2]
+    mock_post.assert_called_once_with(
+        "documents/purchase_invoices/synchronization", data={"ids": [1, 2, 3]}
+    )
+    mock_get.assert_not_called()
+
+
+class TestRefreshStale:
+    def test_refreshes_only_changed_models(self, mocker: MockType):
+        mock_paginate = mocker.patch(
+            "moneysnake.model.paginate",
+            return_value=[
+                {"id": 1, "version": 100},
+                {"id": 2, "version": 201},
+                {"id": 3, "version": 300},
+            ],
+        )
+        mock_post = mocker.patch(
+            "moneysnake.model.http_post",
+            return_value=[{"id": 2, "version": 201, "state": "paid"}],
+        )
+        invoices = [
+            SalesInvoice(id=1, version=100, state="open"),
+            SalesInvoice(id=2, version=200, state="open"),
+            SalesInvoice(id=4, version=400, state="open"),
+        ]
+        result = refresh_stale(invoices)
+
+        mock_paginate.assert_called_once_with(
+            "sales_invoices/synchronization", params=None
+        )
+        mock_post.assert_called_once_with(
+            "sales_invoices/synchronization", data={"ids": [2]}
+        )
+        assert result.refreshed == [invoices[1]]
+        assert invoices[1].state == "paid" and invoices[1].version == 201
+        assert invoices[0].state == "open"
+        assert result.deleted == [invoices[2]]
+
+    def test_string_versions_and_one_call_per_class(self, mocker: MockType):
+        def sync_list(path: str, params: Any = None) -> list[dict[str, Any]]:
+            return [{"id": 1, "version": "5"}]
+
+        mock_paginate = mocker.patch(
+            "moneysnake.model.paginate", side_effect=sync_list
+        )
+        mock_post = mocker.patch("moneysnake.model.http_post")
+        models = [
+            FinancialMutation(id=1, version="5"),
+            Contact(id=1, version=5),
+            Contact(id=1, version=5),
+        ]
+        result = refresh_stale(models)
+        assert mock_paginate.call_count == 2
+        mock_post.assert_not_called()
+        assert result.refreshed == result.deleted == []
+
+    def test_string_versions_of_different_lengths(self, mocker: MockType):
+        mocker.patch(
+            "moneysnake.model.paginate", return_value=[{"id": 1, "version": "10"}]
+        )
+        mocker.patch(
+            "moneysnake.model.http_post", return_value=[{"id": 1, "version": "10"}]
+        )
+        stale = FinancialMutation(id=1, version="9")
+        current = FinancialMutation(id=1, version=10)
+        result = refresh_stale([stale, current])
+        assert result.refreshed == [stale]
+        assert stale.version == "10"
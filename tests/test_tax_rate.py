@@ -1,6 +1,10 @@
+import threading
+
 import pytest
 from pytest_mock import MockType
-from moneysnake.tax_rate import TaxRate
+from moneysnake import tax_rate
+from moneysnake.client import MoneybirdClient
+from moneysnake.tax_rate import TaxRate, TaxRateRegistry, set_tax_rate_registry
 
 type TaxRateData = list[dict[str, str | int | float | bool | None]]
 
@@ -45,7 +49,7 @@ def test_list_all_rates(mocker: MockType, tax_rates_data: TaxRateData):
     assert len(rates) == 2
     assert rates[0].name == "BTW 21%"
     assert rates[1].country == "DE"
-    mock_paginate.assert_called_with("tax_rates")
+    mock_paginate.assert_called_with("tax_rates", decode=TaxRate._validate_page)
 
 
 def test_all_sales(mocker: MockType, tax_rates_data: TaxRateData):
@@ -57,7 +61,9 @@ def test_all_sales(mocker: MockType, tax_rates_data: TaxRateData):
 
     assert len(rates) == 2
     mock_paginate.assert_called_with(
-        "tax_rates", params={"filter": "tax_rate_type:sales_invoice"}
+        "tax_rates",
+        params={"filter": "tax_rate_type:sales_invoice"},
+        decode=TaxRate._validate_page,
     )
 
 
@@ -74,4 +80,79 @@ def test_find_sales_by_country(mocker: MockType, tax_rates_data: TaxRateData):
     mock_paginate.assert_called_with(
         "tax_rates",
         params={"filter": "country:NL,tax_rate_type:sales_invoice"},
+        decode=TaxRate._validate_page,
     )
+
+
+@pytest.fixture(name="registry")
+def fixture_registry(mocker: MockType, tax_rates_data: TaxRateData):
+    mocker.patch("moneysnake.tax_rate.paginate", return_value=tax_rates_data)
+    registry = TaxRateRegistry(ttl=60)
+    set_tax_rate_registry(registry)
+    yield registry
+    set_tax_rate_registry(None)
+
+
+def test_registry_serves_classmethods_from_one_load(registry: TaxRateRegistry):
+    assert [rate.id for rate in TaxRate.list_all_rates()] == [123, 456]
+    assert len(TaxRate.list_sales_rates()) == 2
+    for _ in range(10):
+        (rate,) = TaxRate.find_sales_rate_by_country("DE")
+        assert rate.name == "BTW 0%"
+    assert TaxRate.find_sales_rate_by_country("BE") == []
+    assert tax_rate.paginate.call_count == 1
+
+
+def test_registry_indexes(registry: TaxRateRegistry):
+    assert registry.get(123).name == "BTW 21%"
+    assert registry.get(999) is None
+    assert [rate.id for rate in registry.find(percentage=21.0)] == [123]
+    assert registry.find(country="NL", percentage=0.0) == []
+    assert len(registry.find()) == 2
+
+
+def test_registry_ttl_and_refresh(mocker: MockType, registry: TaxRateRegistry):
+    now = mocker.patch("moneysnake.tax_rate.time.monotonic", return_value=0.0)
+    registry.clear()
+    registry.rates()
+    now.return_value = 59.0
+    registry.rates()
+    assert tax_rate.paginate.call_count == 1
+    now.return_value = 61.0
+    registry.rates()
+    assert tax_rate.paginate.call_count == 2
+    registry.refresh()
+    assert tax_rate.paginate.call_count == 3
+
+
+def test_registry_is_per_administration(registry: TaxRateRegistry):
+    registry.rates()
+    with MoneybirdClient(admin_id=2, token="t").bind():
+        registry.rates()
+    registry.rates()
+    assert tax_rate.paginate.call_count == 2
+
+
+def test_registry_loads_outside_the_lock(
+    mocker: MockType, registry: TaxRateRegistry, tax_rates_data: TaxRateData
+):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_paginate(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return tax_rates_data
+
+    mocker.patch("moneysnake.tax_rate.paginate", side_effect=slow_paginate)
+    loader = threading.Thread(target=registry.rates)
+    loader.start()
+    started.wait(5)
+    tax_rate.paginate.side_effect = None
+    tax_rate.paginate.return_value = tax_rates_data
+    with MoneybirdClient(admin_id=2, token="t").bind():
+        # Rates of another administration load while the first one is busy.
+        assert len(registry.rates()) == 2
+    assert loader.is_alive()
+    release.set()
+    loader.join()
+    assert tax_rate.paginate.call_count == 2
@@ -0,0 +1,135 @@
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from pytest_mock import MockType
+
+import moneysnake.client as client
+from moneysnake.client import MoneybirdClient, responses_trusted, trust_responses
+from moneysnake.contact import Contact, ContactPerson
+from moneysnake.external_sales_invoice import ExternalSalesInvoice
+from moneysnake.financial_mutation import FinancialMutation
+from moneysnake.model import construct
+from moneysnake.payment import Payment
+from moneysnake.sales_invoice import SalesInvoice, SalesInvoiceDetailsAttribute
+from moneysnake.tax_rate import TaxRate
+
+INVOICE = {
+    "id": "550000000000000001",
+    "contact_id": "550000000000000002",
+    "reference": "PO-1",
+    "unknown_field": "ignored",
+    "details": [{"id": "550000000000000100", "description": "Work", "price": "10"}],
+    "payments": None,
+}
+
+
+def test_construct_coerces_ids_and_nested_models():
+    invoice = construct(SalesInvoice, INVOICE)
+
+    assert invoice.id == 550000000000000001
+    assert invoice.contact_id == 550000000000000002
+    (detail,) = invoice.details
+    assert isinstance(detail, SalesInvoiceDetailsAttribute)
+    assert detail.id == 550000000000000100
+    assert detail.price == "10"
+    # Like the validator, a missing list becomes empty...
+    assert invoice.payments == []
+    # ...unless the field is optional.
+    external = construct(ExternalSalesInvoice, {"payments": None})
+    assert external.payments is None
+    assert not hasattr(invoice, "unknown_field")
+    assert invoice.model_fields_set == set(INVOICE) - {"unknown_field"}
+    assert invoice._destroyed_detail_ids == []
+    assert invoice.custom_fields == [] and invoice.tax_totals == []
+    assert construct(SalesInvoice, {}).tax_totals is not invoice.tax_totals
+
+
+def test_construct_coerces_floats():
+    payment = construct(Payment, {"price": "12.50", "price_base": 10})
+    assert payment.price == 12.5
+    assert isinstance(payment.price_base, float)
+    assert construct(TaxRate, {"percentage": "21.0"}).percentage == 21.0
+    assert construct(TaxRate, {"percentage": "n/a"}).percentage == "n/a"
+
+
+def test_construct_skips_validation():
+    contact = construct(
+        Contact, {"id": 1, "email_ubl": "not a bool", "contact_people": [{}]}
+    )
+    assert contact.email_ubl == "not a bool"
+    assert isinstance(contact.contact_people[0], ContactPerson)
+
+
+def test_list_all_in_trusted_block(mocker: MockType):
+    mocker.patch("moneysnake.sales_invoice.paginate", return_value=[INVOICE])
+    with trust_responses():
+        invoices = SalesInvoice.list_all()
+    assert invoices[0].details[0].description == "Work"
+    assert invoices[0].payments == []
+
+
+def test_load_in_trusted_block(mocker: MockType):
+    mocker.patch(
+        "moneysnake.model.http_get",
+        return_value={"id": "1", "version": "5"},
+    )
+    validate = mocker.spy(FinancialMutation, "model_validate")
+    with trust_responses():
+        mutation = FinancialMutation.find_by_id(1)
+    validate.assert_not_called()
+    assert mutation.id == 1
+
+    invoice_payment = construct(SalesInvoice, {"payments": [{"id": "2"}]}).payments
+    assert isinstance(invoice_payment[0], Payment)
+    assert invoice_payment[0].id == 2
+
+
+def test_records_with_nested_models_are_still_validated(mocker: MockType):
+    mocker.patch(
+        "moneysnake.model.http_get",
+        return_value={"id": "1", "contact_people": [{"firstname": "Ada"}]},
+    )
+    validate = mocker.spy(Contact, "model_validate")
+    with trust_responses():
+        contact = Contact.find_by_id(1)
+    validate.assert_called_once()
+    assert contact.contact_people[0].firstname == "Ada"
+
+
+def test_lists_are_validated_in_trusted_mode():
+    with trust_responses():
+        with pytest.raises(ValidationError):
+            TaxRate._validate_list([{"id": "not a number"}])
+
+
+def test_trusted_client():
+    trusting = MoneybirdClient(admin_id=1, token="t", trusted_responses=True)
+    assert not responses_trusted()
+    with trusting.bind():
+        assert responses_trusted()
+        with trust_responses(False):
+            assert not responses_trusted()
+
+
+def test_trusted_default_client():
+    client.set_trusted_responses(True)
+    try:
+        assert responses_trusted()
+    finally:
+        client.set_trusted_responses(False)
+
+
+def test_user_built_models_are_still_validated():
+    with trust_responses():
+        invoice = SalesInvoice(details=[{"id": "7", "description": "Work"}])
+        assert invoice.details[0].id == 7
+        with pytest.raises(ValidationError):
+            SalesInvoice(details=[{"id": "not a number"}])
+
+
+def test_responses_are_validated_by_default(mocker: MockType):
+    data: dict[str, Any] = {"id": "1", "email_ubl": "not a bool"}
+    mocker.patch("moneysnake.model.http_get", return_value=data)
+    with pytest.raises(ValidationError):
+        Contact.find_by_id(1)
@@ -0,0 +1,105 @@
+import io
+import mmap
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from pytest_mock import MockType
+
+from moneysnake.client import http_post_file
+from moneysnake.exceptions import MoneybirdAPIError
+
+SCAN = b"%PDF-1.7 " + b"x" * 200_000
+
+
+@pytest.fixture(name="respond")
+def fixture_respond(mocker: MockType) -> Callable[..., list[bytes]]:
+    """Answer uploads with the given statuses; returns the bodies sent."""
+    mocker.patch("moneysnake.client.time.sleep")
+
+    def respond(*statuses: int) -> list[bytes]:
+        bodies: list[bytes] = []
+        answers = iter(statuses)
+
+        def send(
+            self: httpx.Client, request: httpx.Request, **kwargs: Any
+        ) -> httpx.Response:
+            bodies.append(b"".join(request.stream))
+            return httpx.Response(next(answers), json={"id": 1}, request=request)
+
+        mocker.patch("moneysnake.client.httpx.Client.send", send)
+        return bodies
+
+    return respond
+
+
+def _upload(content: Any) -> None:
+    http_post_file(
+        "documents/receipts/1/attachments",
+        field="file",
+        filename="scan.pdf",
+        content=content,
+        content_type="application/pdf",
+    )
+
+
+def test_file_object_is_rewound_on_retry(respond: Callable[..., list[bytes]]):
+    uploads = respond(503, 429, 200)
+    _upload(io.BytesIO(SCAN))
+    assert len(uploads) == 3
+    assert all(SCAN in body for body in uploads)
+
+
+def test_path_is_streamed_and_retried(
+    respond: Callable[..., list[bytes]], tmp_path: Path
+):
+    uploads = respond(500, 200)
+    scan = tmp_path / "scan.pdf"
+    scan.write_bytes(SCAN)
+    _upload(scan)
+    assert len(uploads) == 2
+    assert all(SCAN in body for body in uploads)
+
+
+def test_mmap_is_uploaded(respond: Callable[..., list[bytes]], tmp_path: Path):
+    uploads = respond(429, 200)
+    scan = tmp_path / "scan.pdf"
+    scan.write_bytes(SCAN)
+    with scan.open("rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        _upload(mapped)
+    assert len(uploads) == 2
+    assert all(SCAN in body for body in uploads)
+
+
+def test_unseekable_file_is_not_retried(respond: Callable[..., list[bytes]]):
+    uploads = respond(500, 200)
+
+    class Pipe(io.RawIOBase):
+        def __init__(self) -> None:
+            self._data = io.BytesIO(SCAN)
+
+        def readable(self) -> bool:
+            return True
+
+        def readinto(self, buffer) -> int:
+            return self._data.readinto(buffer)
+
+    with pytest.raises(MoneybirdAPIError) as exc_info:
+        _upload(Pipe())
+    assert exc_info.value.status_code == 500
+    assert len(uploads) == 1
+
+
+def test_file_is_sent_from_the_start_on_every_attempt(
+    respond: Callable[..., list[bytes]]
+):
+    uploads = respond(503, 200)
+    file = io.BytesIO(SCAN)
+    file.seek(100)
+    _upload(file)
+    assert len(uploads) == 2
+    assert all(SCAN in upload for upload in uploads)
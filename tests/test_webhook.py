@@ -0,0 +1,176 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from pytest_mock import MockType
+
+import moneysnake.client as client
+from moneysnake.cache import ResponseCache
+from moneysnake.client import MoneybirdClient, http_get
+from moneysnake.contact import Contact
+from moneysnake.exceptions import MoneybirdWebhookError
+from moneysnake.external_sales_invoice import ExternalSalesInvoice
+from moneysnake.financial_mutation import FinancialMutation
+from moneysnake.index import LookupIndex, register_index, unregister_index
+from moneysnake.mirror import Mirror
+from moneysnake.purchase_invoice import PurchaseInvoice
+from moneysnake.receipt import Receipt
+from moneysnake.sales_invoice import SalesInvoice
+from moneysnake.session import Session
+from moneysnake.webhook import WebhookEvent, WebhookHandler
+
+PAYLOADS = Path(__file__).parent / "webhooks"
+TOKEN = "test-token"
+
+
+def _payload(name: str) -> dict[str, Any]:
+    return json.loads((PAYLOADS / name).read_text())
+
+
+def replay(handler: WebhookHandler, directory: Path = PAYLOADS) -> list[WebhookEvent]:
+    """Feed the recorded request bodies in ``directory`` to ``handler`` in order."""
+    paths = sorted(directory.glob("*.json"))
+    return [handler.handle(path.read_bytes()) for path in paths]
+
+
+@pytest.fixture(name="mirror")
+def fixture_mirror() -> Mirror:
+    return Mirror()
+
+
+@pytest.fixture(name="handler")
+def fixture_handler(mirror: Mirror) -> WebhookHandler:
+    return WebhookHandler(TOKEN, mirrors=[mirror])
+
+
+def test_replay_recorded_payloads(mirror: Mirror, handler: WebhookHandler):
+    events = replay(handler)
+
+    assert [event.model for event in events] == [
+        Contact,
+        SalesInvoice,
+        ExternalSalesInvoice,
+        FinancialMutation,
+        PurchaseInvoice,
+        Receipt,
+        SalesInvoice,
+        Contact,
+    ]
+    contact = mirror.get(Contact, 1)
+    assert contact is not None
+    assert (contact.company_name, contact.city) == ("Acme Holding B.V.", "Amsterdam")
+    assert mirror.get(SalesInvoice, 10) is None
+    assert mirror.get(ExternalSalesInvoice, 20).reference == "EXT-20"
+    assert mirror.get(FinancialMutation, 30).amount == "242.0"
+    assert mirror.get(PurchaseInvoice, 40).reference == "INK-40"
+    assert mirror.get(Receipt, 50).reference == "BON-50"
+    assert mirror.store.versions("contact") == {1: 1760000008}
+
+
+def test_wrong_token_is_rejected(mirror: Mirror):
+    handler = WebhookHandler("other-token", mirrors=[mirror])
+    with pytest.raises(MoneybirdWebhookError, match="token"):
+        handler.handle(json.dumps(_payload("01_contact_changed.json")))
+    assert mirror.count(Contact) == 0
+
+
+def test_missing_token_is_rejected(handler: WebhookHandler):
+    payload = _payload("01_contact_changed.json")
+    del payload["webhook_token"]
+    with pytest.raises(MoneybirdWebhookError):
+        handler.handle(payload)
+
+
+def test_malformed_body_is_rejected(handler: WebhookHandler):
+    with pytest.raises(MoneybirdWebhookError, match="Invalid"):
+        handler.handle(b"not json")
+    with pytest.raises(MoneybirdWebhookError, match="object"):
+        handler.handle(b"[]")
+
+
+def test_invalid_entity_is_rejected(mirror: Mirror, handler: WebhookHandler):
+    payload = _payload("01_contact_changed.json")
+    payload["entity"] = {**payload["entity"], "version": "not a number"}
+    with pytest.raises(MoneybirdWebhookError, match="Invalid Contact"):
+        handler.handle(payload)
+    assert mirror.count(Contact) == 0
+
+
+def test_str_body_is_accepted(handler: WebhookHandler):
+    event = handler.handle(json.dumps(_payload("01_contact_changed.json")))
+    assert event.model is Contact
+
+
+def test_other_administration_is_rejected(handler: WebhookHandler):
+    handler.client = MoneybirdClient(admin_id=456, token="t")
+    with pytest.raises(MoneybirdWebhookError, match="administration 123"):
+        handler.handle(_payload("01_contact_changed.json"))
+
+
+def test_unknown_entity_type_is_ignored(mirror: Mirror, handler: WebhookHandler):
+    payload = {**_payload("01_contact_changed.json"), "entity_type": "Estimate"}
+    event = handler.handle(payload)
+    assert event.model is None
+    assert mirror.count(Contact) == 0
+
+
+def test_cached_responses_are_invalidated(mocker: MockType, handler: WebhookHandler):
+    cache = ResponseCache()
+    client.set_response_cache(cache)
+    mock_request = mocker.patch(
+        "moneysnake.client.httpx.Client.request",
+        return_value=httpx.Response(
+            200,
+            json={"id": 1},
+            headers={"ETag": '"v1"'},
+            request=httpx.Request("GET", "https://example.com"),
+        ),
+    )
+    try:
+        http_get("contacts/1")
+        http_get("sales_invoices/10")
+        handler.handle(_payload("01_contact_changed.json"))
+        http_get("contacts/1")
+    finally:
+        client.set_response_cache(None)
+
+    assert len(cache) == 2
+    assert "If-None-Match" not in mock_request.call_args.kwargs["headers"]
+
+
+def test_session_entry_is_evicted(mocker: MockType, handler: WebhookHandler):
+    mocker.patch("moneysnake.model.http_get", return_value={"id": 1})
+    with Session() as session:
+        Contact.find_by_id(1)
+        handler.handle(_payload("01_contact_changed.json"))
+        assert len(session) == 0
+
+
+def test_registered_index_is_updated(handler: WebhookHandler):
+    index = LookupIndex(Contact, "customer_id")
+    register_index(index)
+    try:
+        handler.handle(_payload("01_contact_changed.json"))
+        assert index.get("C-1").company_name == "Acme B.V."
+
+        payload = _payload("01_contact_changed.json")
+        payload["action"] = "contact_destroyed"
+        handler.handle(payload)
+        assert index.get("C-1") is None
+    finally:
+        unregister_index(index)
+
+
+def test_handler_with_client_updates_index():
+    tenant = MoneybirdClient(admin_id=123, token="t")
+    index = LookupIndex(Contact, "customer_id", client=tenant)
+    register_index(index)
+    try:
+        WebhookHandler(TOKEN, client=tenant).handle(
+            _payload("01_contact_changed.json")
+        )
+        assert index.get("C-1")._client is tenant
+    finally:
+        unregister_index(index)